@@ -7,6 +7,7 @@ from alembic import context
 from sqlalchemy import create_engine
 
 from backend.databases.models import Base  # Import your SQLAlchemy models here
+from backend.databases.types import AddressBytes
 from backend.security.encryption import EncryptedString
 from backend.settings import settings
 
@@ -43,6 +44,10 @@ def render_item(type_: str, obj: object, autogen_context):
         autogen_context.imports.add("from backend.security.encryption import EncryptedString")
         return f"EncryptedString(length={obj.length})"
 
+    if type_ == "type" and isinstance(obj, AddressBytes):
+        autogen_context.imports.add("from backend.databases.types import AddressBytes")
+        return "AddressBytes()"
+
     # default rendering for other objects
     return False
 
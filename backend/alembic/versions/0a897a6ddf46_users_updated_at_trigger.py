@@ -0,0 +1,40 @@
+"""Maintain users.updated_at with a trigger
+
+Revision ID: 0a897a6ddf46
+Revises: 35d2f14fbc45
+Create Date: 2026-10-16 09:12:04.318772
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0a897a6ddf46"
+down_revision: str | Sequence[str] | None = "35d2f14fbc45"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER users_touch_updated BEFORE UPDATE ON users FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS users_touch_updated ON users")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,45 @@
+"""Add portfolio_totals materialized view
+
+Revision ID: 171b6ee720da
+Revises: 5aa77bffeaed
+Create Date: 2026-10-16 12:41:08.537920
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "171b6ee720da"
+down_revision: str | Sequence[str] | None = "5aa77bffeaed"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Mirrored by backend.databases.views.portfolio_totals; refreshed by the refresh_portfolio_totals task
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW portfolio_totals AS
+        SELECT w.portfolio_id,
+               b.wallet_id,
+               b.chain_id,
+               SUM(b.amount_decimal * COALESCE(b.price_usd, 0)) AS total_value_usd,
+               COUNT(*) AS token_count
+        FROM balances b
+        JOIN wallets w ON w.id = b.wallet_id
+        WHERE NOT b.is_deleted AND NOT w.is_deleted AND b.amount_decimal > 0
+        GROUP BY w.id, b.wallet_id, b.chain_id
+        WITH DATA
+        """
+    )
+    # A unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute("CREATE UNIQUE INDEX uq_portfolio_totals_wallet_chain ON portfolio_totals (wallet_id, chain_id)")
+    op.execute("CREATE INDEX ix_portfolio_totals_portfolio_id ON portfolio_totals (portfolio_id)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS portfolio_totals")
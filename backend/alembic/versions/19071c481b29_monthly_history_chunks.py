@@ -0,0 +1,32 @@
+"""Use monthly chunks for history hypertables
+
+Revision ID: 19071c481b29
+Revises: f87030c6d62c
+Create Date: 2026-10-16 10:38:12.661930
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "19071c481b29"
+down_revision: str | Sequence[str] | None = "f87030c6d62c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+HISTORY_HYPERTABLES = ("balances_history", "nft_balances_history", "cex_balances_history")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Applies to chunks created from now on; existing weekly chunks age out through cleanup_old_snapshots
+    for table in HISTORY_HYPERTABLES:
+        op.execute(f"SELECT set_chunk_time_interval('{table}', INTERVAL '1 month')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in HISTORY_HYPERTABLES:
+        op.execute(f"SELECT set_chunk_time_interval('{table}', INTERVAL '7 days')")
@@ -0,0 +1,35 @@
+"""Add portfolios.total_value_usd_display
+
+Revision ID: 1fa39c0dd845
+Revises: 0a897a6ddf46
+Create Date: 2026-10-16 09:41:27.503119
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1fa39c0dd845"
+down_revision: str | Sequence[str] | None = "0a897a6ddf46"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("portfolios", sa.Column("total_value_usd_display", sa.String(length=32), nullable=True))
+    op.execute(
+        """
+        UPDATE portfolios
+        SET total_value_usd_display = '$' || to_char(total_value_usd, 'FM999,999,999,999,999,990.00')
+        WHERE total_value_usd <> 0
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("portfolios", "total_value_usd_display")
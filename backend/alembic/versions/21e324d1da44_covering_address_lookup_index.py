@@ -0,0 +1,45 @@
+"""Make uq_address_chain a covering index, drop duplicate wallet_addresses indexes
+
+Revision ID: 21e324d1da44
+Revises: f69be7051437
+Create Date: 2026-10-16 15:18:40.527713
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "21e324d1da44"
+down_revision: str | Sequence[str] | None = "f69be7051437"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build the replacement first, so uniqueness is enforced throughout
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_address_chain_covering",
+            "wallet_addresses",
+            ["address_lowercase", "chain_id"],
+            unique=True,
+            postgresql_include=["wallet_id", "is_active"],
+            postgresql_concurrently=True,
+        )
+    op.drop_constraint("uq_address_chain", "wallet_addresses", type_="unique")
+    op.execute("ALTER INDEX uq_address_chain_covering RENAME TO uq_address_chain")
+    # Leading column of uq_address_chain
+    op.drop_index("ix_wallet_addresses_address_lowercase", table_name="wallet_addresses")
+    # Same columns as the uq_wallet_chain constraint's index
+    op.drop_index("ix_wallet_addr_wallet_chain", table_name="wallet_addresses")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_wallet_addr_wallet_chain", "wallet_addresses", ["wallet_id", "chain_id"], unique=False)
+    op.create_index("ix_wallet_addresses_address_lowercase", "wallet_addresses", ["address_lowercase"], unique=False)
+    op.drop_index("uq_address_chain", table_name="wallet_addresses")
+    op.create_unique_constraint("uq_address_chain", "wallet_addresses", ["address_lowercase", "chain_id"])
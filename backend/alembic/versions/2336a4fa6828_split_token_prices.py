@@ -0,0 +1,101 @@
+"""Move token market data into token_prices
+
+Revision ID: 2336a4fa6828
+Revises: 61e881b9da9a
+Create Date: 2026-10-16 11:37:15.902846
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2336a4fa6828"
+down_revision: str | Sequence[str] | None = "61e881b9da9a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "token_prices",
+        sa.Column("token_id", sa.BigInteger(), nullable=False),
+        sa.Column("price_usd", sa.Numeric(precision=20, scale=8), nullable=True),
+        sa.Column("market_cap_usd", sa.Numeric(precision=30, scale=4), nullable=True),
+        sa.Column("volume_24h_usd", sa.Numeric(precision=20, scale=4), nullable=True),
+        sa.Column("price_change_24h_percent", sa.Numeric(precision=8, scale=4), nullable=True),
+        sa.Column(
+            "id",
+            sa.BigInteger(),
+            autoincrement=True,
+            nullable=False,
+            comment="Internal primary key for database operations",
+        ),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+            comment="External identifier for API and frontend",
+        ),
+        sa.Column("memo", sa.Text(), nullable=True),
+        sa.Column("is_deleted", sa.Boolean(), server_default="false", nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("created_by", sa.BigInteger(), nullable=True),
+        sa.Column("updated_by", sa.BigInteger(), nullable=True),
+        sa.CheckConstraint("price_usd IS NULL OR price_usd >= 0", name="non_negative_price"),
+        sa.ForeignKeyConstraint(["token_id"], ["tokens.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("token_id"),
+    )
+    op.create_index(op.f("ix_token_prices_created_at"), "token_prices", ["created_at"], unique=False)
+    op.create_index(op.f("ix_token_prices_uuid"), "token_prices", ["uuid"], unique=False)
+
+    op.execute(
+        """
+        INSERT INTO token_prices (token_id, price_usd, market_cap_usd, volume_24h_usd, price_change_24h_percent)
+        SELECT id, current_price_usd, market_cap_usd, volume_24h_usd, price_change_24h_percent
+        FROM tokens
+        WHERE current_price_usd IS NOT NULL
+           OR market_cap_usd IS NOT NULL
+           OR volume_24h_usd IS NOT NULL
+           OR price_change_24h_percent IS NOT NULL
+        """
+    )
+
+    op.drop_index("idx_token_price", table_name="tokens")
+    op.drop_constraint("non_negative_price", "tokens", type_="check")
+    op.drop_column("tokens", "price_change_24h_percent")
+    op.drop_column("tokens", "volume_24h_usd")
+    op.drop_column("tokens", "market_cap_usd")
+    op.drop_column("tokens", "current_price_usd")
+    op.create_index("idx_token_price", "token_prices", ["price_usd"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_token_price", table_name="token_prices")
+    op.add_column("tokens", sa.Column("current_price_usd", sa.Numeric(precision=20, scale=8), nullable=True))
+    op.add_column("tokens", sa.Column("market_cap_usd", sa.Numeric(precision=30, scale=4), nullable=True))
+    op.add_column("tokens", sa.Column("volume_24h_usd", sa.Numeric(precision=20, scale=4), nullable=True))
+    op.add_column("tokens", sa.Column("price_change_24h_percent", sa.Numeric(precision=8, scale=4), nullable=True))
+    op.execute(
+        """
+        UPDATE tokens
+        SET current_price_usd = tp.price_usd,
+            market_cap_usd = tp.market_cap_usd,
+            volume_24h_usd = tp.volume_24h_usd,
+            price_change_24h_percent = tp.price_change_24h_percent
+        FROM token_prices tp
+        WHERE tp.token_id = tokens.id
+        """
+    )
+    op.create_check_constraint("non_negative_price", "tokens", "current_price_usd IS NULL OR current_price_usd >= 0")
+    op.create_index("idx_token_price", "tokens", ["current_price_usd"], unique=False)
+    op.drop_index(op.f("ix_token_prices_uuid"), table_name="token_prices")
+    op.drop_index(op.f("ix_token_prices_created_at"), table_name="token_prices")
+    op.drop_table("token_prices")
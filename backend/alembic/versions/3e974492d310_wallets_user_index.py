@@ -0,0 +1,35 @@
+"""Index wallets by owner and soft-delete flag
+
+Revision ID: 3e974492d310
+Revises: bd1b79fbfb4a
+Create Date: 2026-10-16 17:02:14.318406
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3e974492d310"
+down_revision: str | Sequence[str] | None = "bd1b79fbfb4a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_wallets_user_deleted",
+            "wallets",
+            ["user_id", "is_deleted"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_wallets_user_deleted", table_name="wallets", postgresql_concurrently=True)
@@ -0,0 +1,58 @@
+"""Store NFT token_metadata as JSONB with a GIN index
+
+Revision ID: 431eff9e6acb
+Revises: 4c03901fc383
+Create Date: 2026-10-16 14:31:47.208519
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "431eff9e6acb"
+down_revision: str | Sequence[str] | None = "4c03901fc383"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+NFT_TABLES = ("nft_balances", "nft_balances_history")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in NFT_TABLES:
+        op.alter_column(
+            table,
+            "token_metadata",
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=True,
+            existing_comment="Store JSON metadata",
+            postgresql_using="token_metadata::jsonb",
+        )
+    op.create_index(
+        "ix_nft_balances_metadata_gin",
+        "nft_balances",
+        ["token_metadata"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"token_metadata": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_nft_balances_metadata_gin", table_name="nft_balances", postgresql_using="gin")
+    for table in NFT_TABLES:
+        op.alter_column(
+            table,
+            "token_metadata",
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            type_=sa.JSON(),
+            existing_nullable=True,
+            existing_comment="Store JSON metadata",
+            postgresql_using="token_metadata::json",
+        )
@@ -0,0 +1,46 @@
+"""Replace history snapshot_date btree indexes with BRIN
+
+Revision ID: 4c03901fc383
+Revises: a3b8db8e065f
+Create Date: 2026-10-16 13:58:12.640571
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c03901fc383"
+down_revision: str | Sequence[str] | None = "a3b8db8e065f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# table -> index name prefix
+HISTORY_TABLES = {
+    "balances_history": "balance_history",
+    "nft_balances_history": "nft_history",
+    "cex_balances_history": "cex_history",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, prefix in HISTORY_TABLES.items():
+        # Duplicates the leading column of the (snapshot_date, id) primary key
+        op.drop_index(f"{table}_snapshot_date_idx", table_name=table)
+        op.create_index(
+            f"ix_{prefix}_snapshot_date_brin",
+            table,
+            ["snapshot_date"],
+            unique=False,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, prefix in HISTORY_TABLES.items():
+        op.drop_index(f"ix_{prefix}_snapshot_date_brin", table_name=table)
+        op.execute(f"CREATE INDEX {table}_snapshot_date_idx ON {table} (snapshot_date DESC)")
@@ -0,0 +1,30 @@
+"""Drop redundant uq_token_symbol_chain_contract
+
+Revision ID: 5aa77bffeaed
+Revises: 2336a4fa6828
+Create Date: 2026-10-16 12:04:33.470215
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5aa77bffeaed"
+down_revision: str | Sequence[str] | None = "2336a4fa6828"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Implied by uq_token_contract_chain; symbol lookups are served by idx_token_symbol_chain
+    op.drop_constraint("uq_token_symbol_chain_contract", "tokens", type_="unique")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_unique_constraint(
+        "uq_token_symbol_chain_contract", "tokens", ["symbol", "chain_id", "contract_address_lowercase"]
+    )
@@ -0,0 +1,46 @@
+"""Store wallet_addresses.address_lowercase as BYTEA
+
+Revision ID: 61e881b9da9a
+Revises: 19071c481b29
+Create Date: 2026-10-16 11:02:40.118394
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "61e881b9da9a"
+down_revision: str | Sequence[str] | None = "19071c481b29"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Same encoding as backend.databases.types.AddressBytes: 0x00 + 20 raw bytes for EVM, 0x01 + UTF-8 otherwise
+    op.execute(
+        r"""
+        ALTER TABLE wallet_addresses ALTER COLUMN address_lowercase TYPE bytea USING (
+            CASE WHEN address_lowercase ~ '^0x[0-9a-f]{40}$'
+                THEN '\x00'::bytea || decode(substr(address_lowercase, 3), 'hex')
+                ELSE '\x01'::bytea || convert_to(address_lowercase, 'UTF8')
+            END
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        """
+        ALTER TABLE wallet_addresses ALTER COLUMN address_lowercase TYPE text USING (
+            CASE WHEN get_byte(address_lowercase, 0) = 0
+                THEN '0x' || encode(substring(address_lowercase FROM 2), 'hex')
+                ELSE convert_from(substring(address_lowercase FROM 2), 'UTF8')
+            END
+        )
+        """
+    )
@@ -0,0 +1,49 @@
+"""Index transactions for balance replay, drop the redundant hash index
+
+Revision ID: a29bcae4e376
+Revises: 431eff9e6acb
+Create Date: 2026-10-16 14:52:09.731842
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a29bcae4e376"
+down_revision: str | Sequence[str] | None = "431eff9e6acb"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps transaction inserts going while the indexes build; it can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_tx_wallet_token_chain_time",
+            "transactions",
+            ["wallet_id", "token_id", "chain_id", "timestamp"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index("idx_tx_wallet_token", table_name="transactions", postgresql_concurrently=True)
+        # uq_tx_hash_chain (transaction_hash, chain_id) already serves lookups by hash
+        op.drop_index("ix_transactions_transaction_hash", table_name="transactions", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_transactions_transaction_hash",
+            "transactions",
+            ["transaction_hash"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_tx_wallet_token", "transactions", ["wallet_id", "token_id"], unique=False, postgresql_concurrently=True
+        )
+        op.drop_index("idx_tx_wallet_token_chain_time", table_name="transactions", postgresql_concurrently=True)
@@ -0,0 +1,50 @@
+"""Add partial indexes for non-zero balances
+
+Revision ID: a3b8db8e065f
+Revises: dd8f90927b9d
+Create Date: 2026-10-16 13:31:47.215093
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3b8db8e065f"
+down_revision: str | Sequence[str] | None = "dd8f90927b9d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_balances_wallet_nonzero",
+        "balances",
+        ["wallet_id", "chain_id"],
+        unique=False,
+        postgresql_where=sa.text("amount_decimal > 0"),
+    )
+    op.create_index(
+        "ix_balances_token_nonzero",
+        "balances",
+        ["token_id"],
+        unique=False,
+        postgresql_where=sa.text("amount_decimal > 0"),
+    )
+    op.create_index(
+        "ix_nft_balances_wallet_nonzero",
+        "nft_balances",
+        ["wallet_id"],
+        unique=False,
+        postgresql_where=sa.text("amount > 0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_nft_balances_wallet_nonzero", table_name="nft_balances", postgresql_where=sa.text("amount > 0"))
+    op.drop_index("ix_balances_token_nonzero", table_name="balances", postgresql_where=sa.text("amount_decimal > 0"))
+    op.drop_index("ix_balances_wallet_nonzero", table_name="balances", postgresql_where=sa.text("amount_decimal > 0"))
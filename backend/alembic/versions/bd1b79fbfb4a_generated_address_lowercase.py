@@ -0,0 +1,52 @@
+"""Generate wallet_addresses.address_lowercase in the database
+
+Revision ID: bd1b79fbfb4a
+Revises: 21e324d1da44
+Create Date: 2026-10-16 15:41:12.384915
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+from backend.databases.types import AddressBytes
+
+# revision identifiers, used by Alembic.
+revision: str = "bd1b79fbfb4a"
+down_revision: str | Sequence[str] | None = "21e324d1da44"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ADDRESS_BYTES_SQL = AddressBytes.sql_expression("address")
+
+
+def _create_uq_address_chain() -> None:
+    op.create_index(
+        "uq_address_chain",
+        "wallet_addresses",
+        ["address_lowercase", "chain_id"],
+        unique=True,
+        postgresql_include=["wallet_id", "is_active"],
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # An existing column can't be turned into a generated one; dropping it also drops uq_address_chain
+    op.drop_column("wallet_addresses", "address_lowercase")
+    op.add_column(
+        "wallet_addresses",
+        sa.Column("address_lowercase", AddressBytes(), sa.Computed(ADDRESS_BYTES_SQL, persisted=True), nullable=False),
+    )
+    _create_uq_address_chain()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("wallet_addresses", "address_lowercase")
+    op.add_column("wallet_addresses", sa.Column("address_lowercase", AddressBytes(), nullable=True))
+    op.execute(f"UPDATE wallet_addresses SET address_lowercase = {ADDRESS_BYTES_SQL}")
+    op.alter_column("wallet_addresses", "address_lowercase", nullable=False)
+    _create_uq_address_chain()
@@ -0,0 +1,50 @@
+"""Add covering indexes for per-wallet balance history
+
+Revision ID: dd8f90927b9d
+Revises: 171b6ee720da
+Create Date: 2026-10-16 12:58:21.604317
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "dd8f90927b9d"
+down_revision: str | Sequence[str] | None = "171b6ee720da"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_balance_history_wallet_token_chain_date",
+        "balances_history",
+        ["wallet_id", "token_id", "chain_id", "snapshot_date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_balance_history_wallet_type_date",
+        "balances_history",
+        ["wallet_id", "snapshot_type", "snapshot_date"],
+        unique=False,
+        postgresql_include=[
+            "amount_decimal",
+            "price_usd",
+            "avg_buy_price_usd",
+            "avg_sell_price_usd",
+            "total_bought_decimal",
+            "total_sold_decimal",
+        ],
+    )
+    # Both new indexes lead with wallet_id
+    op.drop_index("ix_balance_history_wallet_date", table_name="balances_history")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_balance_history_wallet_date", "balances_history", ["wallet_id", "snapshot_date"], unique=False)
+    op.drop_index("ix_balance_history_wallet_type_date", table_name="balances_history")
+    op.drop_index("ix_balance_history_wallet_token_chain_date", table_name="balances_history")
@@ -0,0 +1,46 @@
+"""Add partial sync queue indexes on wallets and cex_accounts
+
+Revision ID: f69be7051437
+Revises: a29bcae4e376
+Create Date: 2026-10-16 15:06:33.918204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f69be7051437"
+down_revision: str | Sequence[str] | None = "a29bcae4e376"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_wallets_syncable",
+            "wallets",
+            [sa.text("last_sync_at ASC NULLS FIRST")],
+            unique=False,
+            postgresql_where=sa.text("sync_enabled = true AND is_watched_only = false AND is_deleted = false"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_cex_accounts_syncable",
+            "cex_accounts",
+            [sa.text("last_sync_at ASC NULLS FIRST")],
+            unique=False,
+            postgresql_where=sa.text("sync_enabled = true AND is_deleted = false"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_cex_accounts_syncable", table_name="cex_accounts", postgresql_concurrently=True)
+        op.drop_index("ix_wallets_syncable", table_name="wallets", postgresql_concurrently=True)
@@ -0,0 +1,49 @@
+"""Use ENUM types for low-cardinality string columns
+
+Revision ID: f87030c6d62c
+Revises: 1fa39c0dd845
+Create Date: 2026-10-16 10:05:51.274410
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f87030c6d62c"
+down_revision: str | Sequence[str] | None = "1fa39c0dd845"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, enum type, values, previous String length)
+ENUM_COLUMNS = (
+    ("chains", "chain_type", "chain_type_enum", ("evm", "non-evm"), 20),
+    ("wallets", "wallet_type", "wallet_type_enum", ("metamask", "tronlink", "leather"), 20),
+    ("tokens", "token_standard", "token_standard_enum", ("native", "ERC-20", "BEP-20", "TRC-20", "SPL", "SIP-010"), 10),
+    (
+        "cex_subaccounts",
+        "subaccount_type",
+        "subaccount_type_enum",
+        ("spot", "funding", "earn", "margin", "futures"),
+        50,
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    for table, column, type_name, values, _ in ENUM_COLUMNS:
+        enum_type = sa.Enum(*values, name=type_name)
+        enum_type.create(bind, checkfirst=True)
+        op.alter_column(table, column, type_=enum_type, postgresql_using=f"{column}::{type_name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    for table, column, type_name, values, length in ENUM_COLUMNS:
+        op.alter_column(table, column, type_=sa.String(length=length), postgresql_using=f"{column}::text")
+        sa.Enum(*values, name=type_name).drop(bind, checkfirst=True)
@@ -12,7 +12,9 @@ from loguru import logger
 
 from backend import errors, routers
 from backend.databases.factory_async import close_async_database, init_database
+from backend.databases.redis import close_redis_pool
 from backend.logger import init_logging
+from backend.responses import FastJSONResponse
 from backend.security.encryption import init_encryption
 from backend.settings import settings
 from backend.taskiq_broker import broker
@@ -52,6 +54,7 @@ async def lifespan(app: FastAPI):
     logger.info("Taskiq broker shut down")
 
     await close_async_database()
+    await close_redis_pool()
 
 
 def get_app_version() -> str:
@@ -74,6 +77,7 @@ def create_app() -> FastAPI:
         version=get_app_version(),
         docs_url=None,
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
     logger.info(f"🚀 Starting {app.title} v{app.version}")
 
@@ -0,0 +1,46 @@
+import time
+from typing import Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Small in-process cache with expiring entries.
+
+    Entries live for `ttl` seconds, or until an earlier `expires_at` given on `set()`.
+    When `maxsize` is reached the oldest entry is dropped. Not shared between workers.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: dict[K, tuple[float, V]] = {}  # Insertion ordered: the oldest entry is first
+
+    def get(self, key: K) -> V | None:
+        """Cached value, or None when missing or expired"""
+        if (entry := self._entries.get(key)) is None:
+            return None
+        expires_at, value = entry
+        if time.time() < expires_at:
+            return value
+        self._entries.pop(key, None)
+        return None
+
+    def set(self, key: K, value: V, expires_at: float | None = None) -> None:
+        """Store `value` for `ttl` seconds, or until `expires_at` (epoch seconds) if that comes first"""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)), None)
+        ttl_expires_at = time.time() + self.ttl
+        self._entries[key] = (min(ttl_expires_at, expires_at) if expires_at else ttl_expires_at, value)
+
+    def pop(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,2 +1,2 @@
-from backend.databases.factory_async import get_async_db_session
+from backend.databases.factory_async import get_async_db_session, get_async_read_session
 from backend.databases.redis import get_redis_client
@@ -42,6 +42,8 @@ class BaseAsyncDatabase(ABC):
         self.db_url = db_url
         self.engine: AsyncEngine | None = None
         self.SessionLocal: async_sessionmaker[AsyncSession] | None = None
+        # Same engine, no autoflush: for requests that only read
+        self.ReadSessionLocal: async_sessionmaker[AsyncSession] | None = None
 
     @abstractmethod
     async def init_db(self) -> None:
@@ -61,6 +63,19 @@ class BaseAsyncDatabase(ABC):
             finally:
                 await db.close()
 
+    @asynccontextmanager
+    async def read_session(self) -> AsyncIterator[AsyncSession]:
+        """Provide an async session for read-only work: queries never flush pending changes first."""
+        if self.ReadSessionLocal is None:
+            logger.error("Async database session not initialized")
+            raise RuntimeError("Async database not initialized. Call init_db() first.")
+
+        async with self.ReadSessionLocal() as db:
+            try:
+                yield db
+            finally:
+                await db.close()
+
     async def close(self) -> None:
         """Close database engine"""
         if self.engine:
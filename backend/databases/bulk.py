@@ -0,0 +1,195 @@
+"""
+Bulk writes that bypass the ORM unit of work.
+
+Snapshot tasks write one row per balance on every run. Large batches are streamed with
+PostgreSQL `COPY` (asyncpg `copy_records_to_table`), which skips the per-row parse and
+bind overhead of INSERT; small batches use a single multi-row INSERT.
+
+Current wallet balances are upserted with `INSERT ... ON CONFLICT DO UPDATE` on
+its natural-key constraint, sent as multi-VALUES pages of `insertmanyvalues_page_size` rows
+instead of one round trip per balance.
+
+Snapshots of balances already in the database are taken with `INSERT ... SELECT`, so the rows
+never leave the server.
+
+Exports go the other way with `COPY (query) TO STDOUT`: the lines Postgres writes are handed
+to the caller as raw bytes, with no row or dict built in Python.
+
+Everything runs on the session's connection, inside its current transaction, so the caller
+still decides when to commit. Rows bypass the ORM: no objects are added to the session.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.databases.models import Balance, BalanceHistory, Base
+
+# Below this many rows a plain INSERT is as fast as COPY and keeps the statement in the logs
+COPY_THRESHOLD = 100
+
+BALANCE_HISTORY_COLUMNS = (
+    "wallet_id",
+    "chain_id",
+    "token_id",
+    "amount",
+    "amount_decimal",
+    "price_usd",
+    "avg_buy_price_usd",
+    "avg_sell_price_usd",
+    "total_bought_decimal",
+    "total_sold_decimal",
+    "last_price_update",
+    "snapshot_date",
+    "snapshot_type",
+    "triggered_by",
+)
+
+# COPY output chunks buffered ahead of a slow reader before the connection is paused
+COPY_OUT_BUFFER_CHUNKS = 16
+
+# Natural key of `balances` (constraint `uq_wallet_token_chain`)
+BALANCE_KEY_COLUMNS = ("wallet_id", "token_id", "chain_id")
+
+
+async def copy_rows(
+    session: AsyncSession, model: type[Base], columns: Sequence[str], rows: Sequence[dict[str, Any]]
+) -> int:
+    """
+    Insert `rows` (dicts keyed by `columns`) into `model`'s table.
+
+    Columns left out (id, uuid, timestamps) take their server defaults.
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+
+    if len(rows) <= COPY_THRESHOLD:
+        await session.execute(insert(model), [{column: row[column] for column in columns} for row in rows])
+        return len(rows)
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        model.__tablename__,
+        records=[tuple(row[column] for column in columns) for row in rows],
+        columns=list(columns),
+    )
+    return len(rows)
+
+
+async def copy_balance_history(session: AsyncSession, rows: Sequence[dict[str, Any]]) -> int:
+    """Bulk insert balance snapshots, see `BalanceCalculator.history_snapshot_row()`"""
+    return await copy_rows(session, BalanceHistory, BALANCE_HISTORY_COLUMNS, rows)
+
+
+async def snapshot_balances(
+    session: AsyncSession,
+    where: Sequence[ColumnElement[bool]],
+    snapshot_type: str,
+    triggered_by: str | None,
+    snapshot_date: datetime,
+) -> int:
+    """
+    Copy the current balances matching `where` into balances_history in one `INSERT ... SELECT`.
+
+    Returns:
+        Number of snapshots written
+    """
+    snapshot_values = {"snapshot_date": snapshot_date, "snapshot_type": snapshot_type, "triggered_by": triggered_by}
+    history_columns = BalanceHistory.__table__.c
+    source = select(
+        *(
+            literal(snapshot_values[column], history_columns[column].type).label(column)
+            if column in snapshot_values
+            else getattr(Balance, column)
+            for column in BALANCE_HISTORY_COLUMNS
+        )
+    ).where(*where)
+    result = await session.execute(insert(BalanceHistory).from_select(BALANCE_HISTORY_COLUMNS, source))
+    return result.rowcount
+
+
+async def copy_out(session: AsyncSession, stmt: Select) -> AsyncIterator[bytes]:
+    """
+    Stream the single text column of `stmt`, one line per row, as COPY output chunks.
+
+    Uses CSV format with quote and delimiter bytes that JSON never contains, so values come out
+    verbatim (text format would escape every backslash). Parameters are rendered inline.
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    query = str(stmt.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True}))
+    chunks: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=COPY_OUT_BUFFER_CHUNKS)
+
+    async def copy() -> None:
+        try:
+            await raw_connection.driver_connection.copy_from_query(
+                query, output=chunks.put, format="csv", delimiter="\x02", quote="\x01"
+            )
+        except asyncio.CancelledError:
+            raise  # The consumer went away: nobody drains the queue, so don't wait to put the end marker
+        except Exception:
+            await chunks.put(None)
+            raise
+        await chunks.put(None)
+
+    task = asyncio.create_task(copy())
+    try:
+        while (chunk := await chunks.get()) is not None:
+            yield chunk
+        await task  # Surface COPY errors
+    finally:
+        # Also reached when the client disconnects mid-stream: stop the COPY and wait for it to unwind,
+        # so the task doesn't outlive the response (its outcome is dropped, the error already surfaced above)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def _upsert(
+    session: AsyncSession,
+    model: type[Base],
+    constraint: str,
+    key_columns: Sequence[str],
+    rows: Sequence[dict[str, Any]],
+    touched_columns: Sequence[str] = ("updated_at",),
+) -> int:
+    """
+    `INSERT ... ON CONFLICT ON CONSTRAINT <constraint> DO UPDATE` for `rows`.
+
+    Every row must carry the same keys, including `key_columns`; on conflict the other
+    given columns overwrite the stored ones and `touched_columns` are set to now().
+    """
+    if not rows:
+        return 0
+
+    stmt = pg_insert(model)
+    updated_columns = [column for column in rows[0] if column not in key_columns]
+    stmt = stmt.on_conflict_do_update(
+        constraint=constraint,
+        set_={
+            **{column: stmt.excluded[column] for column in updated_columns},
+            **{column: func.now() for column in touched_columns},
+        },
+    )
+    await session.execute(stmt, list(rows))
+    return len(rows)
+
+
+async def upsert_balances(session: AsyncSession, rows: Sequence[dict[str, Any]]) -> int:
+    """Insert or update current balances by (wallet_id, token_id, chain_id). Returns the row count."""
+    return await _upsert(
+        session,
+        Balance,
+        "uq_wallet_token_chain",
+        BALANCE_KEY_COLUMNS,
+        rows,
+        touched_columns=("updated_at", "last_updated_at"),
+    )
@@ -1,3 +1,4 @@
+import threading
 from collections.abc import Iterator
 
 from sqlalchemy.orm import Session
@@ -7,6 +8,7 @@ from backend.databases.mariadb import MariaDatabase
 from backend.databases.postgres import PostgresDatabase
 
 _db_instance: BaseDatabase | None = None
+_init_lock = threading.Lock()
 
 
 def init_database(db_url: str, db_type: str, *, force_reinit: bool = False) -> BaseDatabase:
@@ -22,17 +24,24 @@ def init_database(db_url: str, db_type: str, *, force_reinit: bool = False) -> B
     if _db_instance is not None and not force_reinit:
         return _db_instance
 
-    db_type = db_type.lower()
+    with _init_lock:
+        if _db_instance is not None and not force_reinit:
+            return _db_instance
 
-    if db_type in {"postgres", "postgresql"}:
-        _db_instance = PostgresDatabase(db_url)
-    elif db_type in {"maria", "mariadb"}:
-        _db_instance = MariaDatabase(db_url)
-    else:
-        raise ValueError(f"Unsupported database type: {db_type}")
+        db_type = db_type.lower()
 
-    _db_instance.init_db()
-    return _db_instance
+        if db_type in {"postgres", "postgresql"}:
+            db_instance = PostgresDatabase(db_url)
+        elif db_type in {"maria", "mariadb"}:
+            db_instance = MariaDatabase(db_url)
+        else:
+            raise ValueError(f"Unsupported database type: {db_type}")
+
+        db_instance.init_db()
+        if _db_instance is not None and _db_instance.engine is not None:
+            _db_instance.engine.dispose()
+        _db_instance = db_instance
+        return _db_instance
 
 
 def get_db_instance() -> BaseDatabase:
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncIterator
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -6,26 +7,38 @@ from backend.databases.base import BaseAsyncDatabase
 from backend.databases.postgres import AsyncPostgresDatabase
 
 _db_instance: BaseAsyncDatabase | None = None
+# Concurrent callers must not each build an engine (and a connection pool) of their own
+_init_lock = asyncio.Lock()
 
 
 async def init_database(db_url: str, db_type: str, *, force_reinit: bool = False) -> BaseAsyncDatabase:
     """
     Factory + Singleton for async database instance.
+
+    The instance is published only once its engine is ready, and a forced reinit disposes
+    the previous engine, so a process never holds more than one pool.
     """
     global _db_instance
 
     if _db_instance is not None and not force_reinit:
         return _db_instance
 
-    db_type = db_type.lower()
+    async with _init_lock:
+        if _db_instance is not None and not force_reinit:
+            return _db_instance
 
-    if db_type in {"postgres", "postgresql"}:
-        _db_instance = AsyncPostgresDatabase(db_url)
-    else:
-        raise ValueError(f"Unsupported database type: {db_type}")
+        db_type = db_type.lower()
 
-    await _db_instance.init_db()
-    return _db_instance
+        if db_type in {"postgres", "postgresql"}:
+            db_instance = AsyncPostgresDatabase(db_url)
+        else:
+            raise ValueError(f"Unsupported database type: {db_type}")
+
+        await db_instance.init_db()
+        if _db_instance is not None:
+            await _db_instance.close()
+        _db_instance = db_instance
+        return _db_instance
 
 
 def get_async_db_instance() -> BaseAsyncDatabase:
@@ -43,6 +56,13 @@ async def get_async_db_session() -> AsyncIterator[AsyncSession]:
         yield session
 
 
+async def get_async_read_session() -> AsyncIterator[AsyncSession]:
+    """Async dependency for FastAPI endpoints that only read (no autoflush before each query)"""
+    db = get_async_db_instance()
+    async with db.read_session() as session:
+        yield session
+
+
 async def close_async_database() -> None:
     """Close database connection"""
     global _db_instance
@@ -2,7 +2,6 @@ from datetime import datetime
 from decimal import Decimal
 
 from sqlalchemy import (
-    JSON,
     BigInteger,
     Boolean,
     CheckConstraint,
@@ -17,6 +16,7 @@ from sqlalchemy import (
     UniqueConstraint,
     text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, declarative_mixin, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -39,7 +39,7 @@ class Transaction(Base):
         BigInteger, ForeignKey("tokens.id", ondelete="RESTRICT"), nullable=False, index=True
     )
 
-    transaction_hash: Mapped[str | None] = mapped_column(String(100), nullable=True, index=True)
+    transaction_hash: Mapped[str | None] = mapped_column(String(100), nullable=True)  # Looked up via uq_tx_hash_chain
     block_number: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     transaction_index: Mapped[int | None] = mapped_column(Integer, nullable=True, comment="Transaction index in block")
     transaction_type: Mapped[str] = mapped_column(String(20), nullable=False)
@@ -78,7 +78,8 @@ class Transaction(Base):
         # Performance indexes
         Index("idx_tx_wallet_time", "wallet_id", "timestamp"),
         Index("idx_tx_chain_status", "chain_id", "status"),
-        Index("idx_tx_wallet_token", "wallet_id", "token_id"),
+        # Replay order for balance recalculation: one token's transactions in a wallet, by time
+        Index("idx_tx_wallet_token_chain_time", "wallet_id", "token_id", "chain_id", "timestamp"),
     )
 
 
@@ -148,14 +149,11 @@ class Balance(Base, BalanceBase):
         UniqueConstraint("wallet_id", "token_id", "chain_id", name="uq_wallet_token_chain"),
         CheckConstraint("amount >= 0", name="non_negative_balance_raw"),
         CheckConstraint("amount_decimal >= 0", name="non_negative_balance_decimal"),
+        # Partial indexes for "current holdings" reads, which all filter on amount_decimal > 0
+        Index("ix_balances_wallet_nonzero", "wallet_id", "chain_id", postgresql_where=text("amount_decimal > 0")),
+        Index("ix_balances_token_nonzero", "token_id", postgresql_where=text("amount_decimal > 0")),
     )
 
-    def to_schema(self, include_id: bool = False) -> dict:
-        base_schema = super().to_schema(include_id)
-        if self.amount_decimal:
-            base_schema["amount_display"] = f"{self.amount_decimal} {self.token.symbol}"
-        return base_schema
-
 
 class BalanceHistory(Base, BalanceBase):
     __tablename__ = "balances_history"
@@ -185,8 +183,30 @@ class BalanceHistory(Base, BalanceBase):
         ),
         Index("ix_balance_history_token_date", "token_id", "chain_id", "snapshot_date"),
         Index("ix_balance_history_type_date", "snapshot_type", "snapshot_date"),
-        Index("ix_balance_history_wallet_date", "wallet_id", "snapshot_date"),
-        Index("balances_history_snapshot_date_idx", text("snapshot_date DESC")),
+        # Per-position series (get_balance_history)
+        Index("ix_balance_history_wallet_token_chain_date", "wallet_id", "token_id", "chain_id", "snapshot_date"),
+        # Covers the wallet chart aggregate (get_portfolio_history_aggregated) for index-only scans
+        Index(
+            "ix_balance_history_wallet_type_date",
+            "wallet_id",
+            "snapshot_type",
+            "snapshot_date",
+            postgresql_include=[
+                "amount_decimal",
+                "price_usd",
+                "avg_buy_price_usd",
+                "avg_sell_price_usd",
+                "total_bought_decimal",
+                "total_sold_decimal",
+            ],
+        ),
+        # The (snapshot_date, id) primary key already serves ordered time lookups; BRIN covers range scans cheaply
+        Index(
+            "ix_balance_history_snapshot_date_brin",
+            "snapshot_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
 
@@ -199,7 +219,7 @@ class NFTBalanceBase:
     nft_token_id: Mapped[str] = mapped_column(String(100), nullable=False)
     token_standard: Mapped[str] = mapped_column(String(20), nullable=False, default="ERC721")  # ERC721, ERC1155, etc.
     token_url: Mapped[str | None] = mapped_column(Text, nullable=True)
-    token_metadata: Mapped[str | None] = mapped_column(JSON, nullable=True, comment="Store JSON metadata")
+    token_metadata: Mapped[dict | None] = mapped_column(JSONB, nullable=True, comment="Store JSON metadata")
     name: Mapped[str | None] = mapped_column(String(20), nullable=True)
     amount: Mapped[str] = mapped_column(Integer, nullable=False, default=1)  # For ERC1155
     price_usd: Mapped[Decimal] = mapped_column(Numeric(precision=20, scale=4), nullable=False, default=0)
@@ -214,6 +234,14 @@ class NFTBalance(Base, NFTBalanceBase):
     __table_args__ = (
         UniqueConstraint("wallet_id", "contract_address", name="uq_nft_wallet_token"),
         CheckConstraint("amount >= 0", name="positive_amount"),
+        Index("ix_nft_balances_wallet_nonzero", "wallet_id", postgresql_where=text("amount > 0")),
+        # Containment lookups on metadata attributes (token_metadata @> '{"trait": ...}')
+        Index(
+            "ix_nft_balances_metadata_gin",
+            "token_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"token_metadata": "jsonb_path_ops"},
+        ),
     )
 
 
@@ -239,7 +267,12 @@ class NFTBalanceHistory(Base, NFTBalanceBase):
     __table_args__ = (
         PrimaryKeyConstraint("snapshot_date", "id"),
         Index("idx_nft_history_wallet_date", "wallet_id", "snapshot_date"),
-        Index("nft_balances_history_snapshot_date_idx", text("snapshot_date DESC")),
+        Index(
+            "ix_nft_history_snapshot_date_brin",
+            "snapshot_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
 
@@ -320,12 +353,6 @@ class CexBalance(Base, CexBalanceBase):
         CheckConstraint("amount_decimal >= 0", name="positive_cex_balance_decimal"),
     )
 
-    def to_schema(self, include_id: bool = False) -> dict:
-        base_schema = super().to_schema(include_id)
-        if self.amount_decimal:
-            base_schema["amount_display"] = f"{self.amount_decimal} {self.token.symbol}"
-        return base_schema
-
 
 class CexBalanceHistory(Base, CexBalanceBase):
     __tablename__ = "cex_balances_history"
@@ -354,5 +381,10 @@ class CexBalanceHistory(Base, CexBalanceBase):
         ),
         Index("idx_cex_history_subaccount_date", "subaccount_id", "snapshot_date"),
         Index("idx_cex_history_token_date", "token_id", "snapshot_date"),
-        Index("cex_balances_history_snapshot_date_idx", text("snapshot_date DESC")),
+        Index(
+            "ix_cex_history_snapshot_date_brin",
+            "snapshot_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
@@ -1,12 +1,14 @@
 import json
 import uuid
-from datetime import UTC, datetime
+from collections.abc import Callable
+from datetime import datetime
 from decimal import Decimal
+from enum import Enum
 from typing import Any, Self, TypeVar
 
 import sqlalchemy.exc
 from loguru import logger
-from sqlalchemy import BigInteger, Boolean, DateTime, Text
+from sqlalchemy import DDL, BigInteger, Boolean, DateTime, MetaData, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column, selectinload
@@ -17,6 +19,24 @@ from backend.errors import DatabaseError, UnexpectedException
 T = TypeVar("T", bound="Base")
 
 
+def enum_values(enum_class: type[Enum]) -> list[str]:
+    """Store enum values (e.g. "non-evm"), not member names, in Postgres ENUM types"""
+    return [member.value for member in enum_class]
+
+
+# Trigger function used by tables that let Postgres maintain `updated_at` (see `server_onupdate=FetchedValue()`)
+set_updated_at_function = DDL(
+    """
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at = now();
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+)
+
+
 class DecimalEncoder(json.JSONEncoder):
     """
     JSON encoder that handles Decimal, datetime, and UUID types
@@ -47,6 +67,17 @@ class Base(DeclarativeBase):
 
     __abstract__ = True
 
+    # The names Postgres gives unnamed constraints (and SQLAlchemy's index default), spelled out so
+    # every constraint has its database name in the metadata for autogenerate and op.drop_constraint()
+    metadata = MetaData(
+        naming_convention={
+            "ix": "ix_%(column_0_label)s",
+            "uq": "%(table_name)s_%(column_0_N_name)s_key",
+            "fk": "%(table_name)s_%(column_0_N_name)s_fkey",
+            "pk": "%(table_name)s_pkey",
+        }
+    )
+
     id: Mapped[int] = mapped_column(
         BigInteger, primary_key=True, autoincrement=True, comment="Internal primary key for database operations"
     )
@@ -82,7 +113,6 @@ class Base(DeclarativeBase):
     async def save(self, session: AsyncSession, by_user_id: int | None = None, log_action: str | None = None) -> None:
         if by_user_id:
             self.updated_by = by_user_id
-        self.updated_at = datetime.now(UTC)
         try:
             session.add(self)
             await session.commit()
@@ -269,20 +299,40 @@ class Base(DeclarativeBase):
             preserve_precision: Keep Decimals as strings
             include_id: Include internal BigInteger ID (False by default for API safety)
         """
-        return {
-            column.name: self._serialize_value(getattr(self, column.name), preserve_precision)
-            for column in self.__table__.columns
-            if column.name != "id" and not include_id
-        }
+        return self._dict_builder(include_id)(self, self._serialize_value, preserve_precision)
+
+    @classmethod
+    def _schema_keys(cls) -> tuple[str, ...]:
+        """Column names of the model, resolved once per class instead of walking the table on every call"""
+        keys = cls.__dict__.get("_SCHEMA_KEYS")
+        if keys is None:
+            keys = cls._SCHEMA_KEYS = tuple(column.key for column in cls.__table__.columns)
+        return keys
+
+    @classmethod
+    def _dict_builder(cls, include_id: bool) -> Callable[[Any, Callable, bool], dict[str, Any]]:
+        """
+        Serializer generated once per class (and `include_id` flag) from `_schema_keys()`.
+
+        The function is a single dict literal, e.g. for a model with `uuid` and `name` columns:
+        `def to_dict(self, s, p): return {"uuid": s(self.uuid, p), "name": s(self.name, p)}`
+        so building a row is plain attribute loads with no per-key loop, zip or filter.
+        """
+        builders = cls.__dict__.get("_DICT_BUILDERS")
+        if builders is None:
+            builders = cls._DICT_BUILDERS = {}
+        builder = builders.get(include_id)
+        if builder is None:
+            items = ", ".join(f"{key!r}: s(self.{key}, p)" for key in cls._schema_keys() if include_id or key != "id")
+            namespace: dict[str, Any] = {}
+            source = f"def to_dict(self, s, p):\n    return {{{items}}}\n"
+            exec(compile(source, f"<{cls.__name__}.to_dict>", "exec"), namespace)
+            builder = builders[include_id] = namespace["to_dict"]
+        return builder
 
     def to_json(self, **kwargs) -> str:
         """Convert to JSON string with proper decimal handling"""
         return json.dumps(self.to_dict(), ensure_ascii=False, **kwargs)
 
-    # For backward compatibility, keep the existing method name but improve it
-    def to_schema(self, include_id: bool = False) -> dict[str, Any]:
-        """Alias for to_dict() for backward compatibility"""
-        return self.to_dict(include_id=include_id)
-
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(id={self.id}, uuid={self.uuid})>"
@@ -1,9 +1,11 @@
 from decimal import Decimal
+from typing import Any
 
 from sqlalchemy import (
     BigInteger,
     Boolean,
     CheckConstraint,
+    Enum,
     ForeignKey,
     Index,
     Integer,
@@ -12,9 +14,13 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
 )
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from backend.databases.models import Base
+from backend.databases.models.base import enum_values
+from backend.schemas.chains import ChainType
+from backend.schemas.tokens import TokenStandard
 
 
 class Token(Base):
@@ -38,18 +44,16 @@ class Token(Base):
     decimals: Mapped[int] = mapped_column(Integer, nullable=False)  # e.g. 18, 6, etc.
     contract_address: Mapped[str | None] = mapped_column(Text, nullable=True)
     contract_address_lowercase: Mapped[str | None] = mapped_column(Text, nullable=True)
-    token_standard: Mapped[str | None] = mapped_column(
-        String(10), nullable=True, default="native"
-    )  # e.g. native, ERC-20, BEP-20, nft
+    token_standard: Mapped[TokenStandard | None] = mapped_column(
+        Enum(TokenStandard, name="token_standard_enum", values_callable=enum_values),
+        nullable=True,
+        default=TokenStandard.NATIVE,
+    )  # e.g. native, ERC-20, BEP-20
     is_native: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
 
     # Price tracking
     coingecko_id: Mapped[str | None] = mapped_column(String(100), nullable=True, unique=True)
     coinmarketcap_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    current_price_usd: Mapped[Decimal | None] = mapped_column(Numeric(precision=20, scale=8), nullable=True)
-    market_cap_usd: Mapped[Decimal | None] = mapped_column(Numeric(precision=30, scale=4), nullable=True)
-    volume_24h_usd: Mapped[Decimal | None] = mapped_column(Numeric(precision=20, scale=4), nullable=True)
-    price_change_24h_percent: Mapped[Decimal | None] = mapped_column(Numeric(precision=8, scale=4), nullable=True)
 
     # Metadata
     logo_url: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -58,24 +62,59 @@ class Token(Base):
     whitepaper_url: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     chain = relationship("Chain", back_populates="tokens")
-    transactions = relationship("Transaction", back_populates="token", cascade="all, delete-orphan")
-    balances = relationship("Balance", back_populates="token", cascade="all, delete-orphan")
-    balances_history = relationship("BalanceHistory", back_populates="token", cascade="all, delete-orphan")
-    cex_balances = relationship("CexBalance", back_populates="token", cascade="all, delete-orphan")
-    cex_balances_history = relationship("CexBalanceHistory", back_populates="token", cascade="all, delete-orphan")
+    # One row per token at most, so LEFT JOINed into whatever query loads the token instead of a SELECT ... IN
+    price: Mapped["TokenPrice | None"] = relationship(
+        "TokenPrice", back_populates="token", uselist=False, cascade="all, delete-orphan", lazy="joined"
+    )
+    # Unbounded collections: never walk them lazily, load explicitly with selectinload() where really needed.
+    # Their rows reference tokens.id ON DELETE RESTRICT, so the database refuses to hard delete a token that
+    # still has any (tokens are soft deleted); passive_deletes only keeps the ORM from loading them first.
+    balances = relationship(
+        "Balance", back_populates="token", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
+    cex_balances = relationship(
+        "CexBalance", back_populates="token", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
+    transactions = relationship(
+        "Transaction", back_populates="token", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
+    balances_history = relationship(
+        "BalanceHistory",
+        back_populates="token",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+    cex_balances_history = relationship(
+        "CexBalanceHistory",
+        back_populates="token",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
 
     __table_args__ = (
         # Unique constraint for token identification
         UniqueConstraint("contract_address_lowercase", "chain_id", name="uq_token_contract_chain"),
-        UniqueConstraint("symbol", "chain_id", "contract_address_lowercase", name="uq_token_symbol_chain_contract"),
         # Validation constraints
         CheckConstraint("decimals >= 0 AND decimals <= 18", name="safe_decimals_range"),
-        CheckConstraint("current_price_usd IS NULL OR current_price_usd >= 0", name="non_negative_price"),
         Index("idx_token_chain_native", "chain_id", "is_native"),
-        Index("idx_token_price", "current_price_usd"),
         Index("idx_token_symbol_chain", "symbol", "chain_id"),
     )
 
+    # Market data lives in `token_prices`; proxied so schemas and callers keep using the flat attribute names
+    current_price_usd = association_proxy("price", "price_usd", creator=lambda value: TokenPrice(price_usd=value))
+    market_cap_usd = association_proxy(
+        "price", "market_cap_usd", creator=lambda value: TokenPrice(market_cap_usd=value)
+    )
+    volume_24h_usd = association_proxy(
+        "price", "volume_24h_usd", creator=lambda value: TokenPrice(volume_24h_usd=value)
+    )
+    price_change_24h_percent = association_proxy(
+        "price", "price_change_24h_percent", creator=lambda value: TokenPrice(price_change_24h_percent=value)
+    )
+    PRICE_FIELDS = ("current_price_usd", "market_cap_usd", "volume_24h_usd", "price_change_24h_percent")
+
     @validates("contract_address_lowercase")
     def validate_contract_address_lowercase(self, key, address):
         return address.lower().strip() if address else address
@@ -106,6 +145,36 @@ class Token(Base):
         """Convert human readable to smallest unit"""
         return int(amount * Decimal(10**self.decimals))
 
+    def to_dict(self, preserve_precision: bool = True, include_id: bool = False) -> dict[str, Any]:
+        token_dict = super().to_dict(preserve_precision, include_id)
+        for field in self.PRICE_FIELDS:
+            token_dict[field] = self._serialize_value(getattr(self, field), preserve_precision)
+        return token_dict
+
+
+class TokenPrice(Base):
+    """
+    Market data per token, kept out of `tokens` so frequent price updates
+    don't rewrite (and bloat) the identity rows and their indexes.
+    """
+
+    __tablename__ = "token_prices"
+
+    token_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("tokens.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+    price_usd: Mapped[Decimal | None] = mapped_column(Numeric(precision=20, scale=8), nullable=True)
+    market_cap_usd: Mapped[Decimal | None] = mapped_column(Numeric(precision=30, scale=4), nullable=True)
+    volume_24h_usd: Mapped[Decimal | None] = mapped_column(Numeric(precision=20, scale=4), nullable=True)
+    price_change_24h_percent: Mapped[Decimal | None] = mapped_column(Numeric(precision=8, scale=4), nullable=True)
+
+    token = relationship("Token", back_populates="price")
+
+    __table_args__ = (
+        CheckConstraint("price_usd IS NULL OR price_usd >= 0", name="non_negative_price"),
+        Index("idx_token_price", "price_usd"),
+    )
+
 
 class Chain(Base):
     """
@@ -129,7 +198,9 @@ class Chain(Base):
 
     name: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)  # short identifier, e.g. "eth-mainnet"
     name_full: Mapped[str | None] = mapped_column(Text, nullable=True)  # Human-readable name, e.g. "Ethereum Mainnet"
-    chain_type: Mapped[str] = mapped_column(String(20), nullable=False)  # "evm", "bitcoin", "tron", "solana" etc.
+    chain_type: Mapped[ChainType] = mapped_column(
+        Enum(ChainType, name="chain_type_enum", values_callable=enum_values), nullable=False
+    )  # "evm" or "non-evm"
     chain_id: Mapped[str | None] = mapped_column(
         String(20), nullable=True
     )  # for EVM - numeric as str, e.g. "1", "56", others: null or native id
@@ -138,12 +209,17 @@ class Chain(Base):
     is_testnet: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="true")
 
-    tokens = relationship("Token", back_populates="chain")
-    wallet_addresses = relationship("WalletAddress", back_populates="chain", cascade="all, delete-orphan")
-    transactions = relationship("Transaction", back_populates="chain")
-    balances = relationship("Balance", back_populates="chain")
-    balances_history = relationship("BalanceHistory", back_populates="chain")
-    rpcs = relationship("RPC", back_populates="chain", cascade="all, delete-orphan")
+    # Read-only reverse sides: rows are attached via chain_id and chains.id is ON DELETE RESTRICT
+    tokens = relationship("Token", back_populates="chain", viewonly=True, lazy="raise_on_sql")
+    wallet_addresses = relationship("WalletAddress", back_populates="chain", viewonly=True, lazy="raise_on_sql")
+    balances = relationship("Balance", back_populates="chain", viewonly=True, lazy="raise_on_sql")
+    balances_history = relationship("BalanceHistory", back_populates="chain", viewonly=True, lazy="raise_on_sql")
+    # Not walked at request time; load explicitly with selectinload() if ever needed
+    transactions = relationship("Transaction", back_populates="chain", lazy="raise_on_sql", passive_deletes=True)
+    # rpcs.chain_id is ON DELETE RESTRICT as well: RPCs must be removed before their chain is hard deleted
+    rpcs = relationship(
+        "RPC", back_populates="chain", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
 
     __table_args__ = (Index("idx_chain_active_testnet", "is_active", "is_testnet"),)
 
@@ -1,11 +1,14 @@
-from datetime import UTC, datetime
+from datetime import datetime
 from decimal import Decimal
 
 from sqlalchemy import (
+    DDL,
     BigInteger,
     Boolean,
     CheckConstraint,
     DateTime,
+    Enum,
+    FetchedValue,
     ForeignKey,
     Index,
     Integer,
@@ -14,10 +17,14 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     event,
+    func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from backend.databases.models import Base
+from backend.databases.models.base import enum_values, set_updated_at_function
+from backend.schemas.cex import SubaccountType
 from backend.security.encryption import EncryptedString
 
 
@@ -36,9 +43,16 @@ class User(Base):
     telegram_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     telegram_username: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
-    wallets = relationship("Wallet", back_populates="owner", cascade="all, delete-orphan")
-    portfolios = relationship("Portfolio", back_populates="owner", cascade="all, delete-orphan")
-    cex_accounts = relationship("CexAccount", back_populates="owner", cascade="all, delete-orphan")
+    # Maintained by the `users_touch_updated` trigger, so SQLAlchemy never sends it in the UPDATE
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue(), nullable=False
+    )
+
+    # Read-only: rows are attached through their user_id, and ON DELETE CASCADE removes them with the user.
+    # Never lazy loaded: managers load what a response needs with explicit selectinload() paths.
+    wallets = relationship("Wallet", back_populates="owner", viewonly=True, lazy="raise_on_sql")
+    portfolios = relationship("Portfolio", back_populates="owner", viewonly=True, lazy="raise_on_sql")
+    cex_accounts = relationship("CexAccount", back_populates="owner", viewonly=True, lazy="raise_on_sql")
 
     __table_args__ = (
         Index("ix_users_username_active", "username", unique=True, postgresql_where="is_deleted = false"),
@@ -60,17 +74,27 @@ class Portfolio(Base):
     )
     name: Mapped[str] = mapped_column(String(50), nullable=False)
     total_value_usd: Mapped[Decimal] = mapped_column(Numeric(precision=20, scale=4), nullable=False, default=0)
+    # "$1,234.56", formatted once when total_value_usd is assigned rather than on every render
+    total_value_usd_display: Mapped[str | None] = mapped_column(String(32), nullable=True)
     last_sync_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    owner = relationship("User", back_populates="portfolios")
-    wallets = relationship("Wallet", back_populates="portfolio", cascade="all, delete-orphan")
-    cex_accounts = relationship("CexAccount", back_populates="portfolio", cascade="all, delete-orphan")
+    # Never lazy loaded: managers load what a response needs with explicit selectinload() paths
+    owner = relationship("User", back_populates="portfolios", lazy="raise_on_sql")
+    wallets = relationship(
+        "Wallet", back_populates="portfolio", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
+    cex_accounts = relationship(
+        "CexAccount",
+        back_populates="portfolio",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
 
-    def to_schema(self, include_id: bool = False) -> dict:
-        base_schema = super().to_schema(include_id)
-        if self.total_value_usd:
-            base_schema["total_value_usd_display"] = f"${self.total_value_usd:,.2f}"
-        return base_schema
+    @validates("total_value_usd")
+    def validate_total_value_usd(self, key, total_value_usd):
+        self.total_value_usd_display = f"${total_value_usd:,.2f}" if total_value_usd else None
+        return total_value_usd
 
 
 class Exchange(Base):
@@ -86,7 +110,8 @@ class Exchange(Base):
     rate_limit_per_minute: Mapped[int | None] = mapped_column(Integer, nullable=True)
     weight_limit_per_minute: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    accounts = relationship("CexAccount", back_populates="exchange", cascade="all, delete-orphan")
+    # Read-only: accounts reference their exchange ON DELETE RESTRICT
+    accounts = relationship("CexAccount", back_populates="exchange", viewonly=True, lazy="raise_on_sql")
 
 
 class CexAccount(Base):
@@ -109,34 +134,67 @@ class CexAccount(Base):
     last_sync_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     total_value_usd: Mapped[Decimal] = mapped_column(Numeric(precision=20, scale=4), nullable=False, default=0)
 
-    owner = relationship("User", back_populates="cex_accounts")
-    exchange = relationship("Exchange", back_populates="accounts")
+    # Never lazy loaded, as for wallets
+    owner = relationship("User", back_populates="cex_accounts", lazy="raise_on_sql")
+    exchange = relationship("Exchange", back_populates="accounts", lazy="raise_on_sql")
+    # cex_subaccounts.account_id has no ON DELETE CASCADE, so the ORM still deletes subaccounts itself
     subaccounts = relationship("CexSubAccount", back_populates="account", cascade="all, delete-orphan")
-    portfolio = relationship("Portfolio", back_populates="cex_accounts")
-    transactions = relationship("Transaction", back_populates="cex_account", cascade="all, delete-orphan")
+    portfolio = relationship("Portfolio", back_populates="cex_accounts", lazy="raise_on_sql")
+    transactions = relationship(
+        "Transaction",
+        back_populates="cex_account",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
 
     __table_args__ = (Index("idx_cex_account_user_exchange", "user_id", "exchange_id"),)
 
 
+# Sync queue, as for wallets (ix_wallets_syncable)
+Index(
+    "ix_cex_accounts_syncable",
+    CexAccount.last_sync_at.asc().nulls_first(),
+    postgresql_where=text("sync_enabled = true AND is_deleted = false"),
+)
+
+
 class CexSubAccount(Base):
     __tablename__ = "cex_subaccounts"
 
     account_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("cex_accounts.id"), nullable=False)
 
-    subaccount_type: Mapped[str] = mapped_column(String(50), nullable=False)  # e.g. "spot", "funding", "earn"
+    subaccount_type: Mapped[SubaccountType] = mapped_column(
+        Enum(SubaccountType, name="subaccount_type_enum", values_callable=enum_values), nullable=False
+    )  # e.g. "spot", "funding", "earn"
     subaccount_name: Mapped[str | None] = mapped_column(String(100), nullable=True, comment="Exchange-specific name/ID")
     total_value_usd: Mapped[Decimal] = mapped_column(Numeric(precision=20, scale=4), nullable=False, default=0)
 
     account = relationship("CexAccount", back_populates="subaccounts")
-    cex_balances = relationship("CexBalance", back_populates="subaccount", cascade="all, delete-orphan")
-    cex_balances_history = relationship("CexBalanceHistory", back_populates="subaccount", cascade="all, delete-orphan")
+    cex_balances = relationship(
+        "CexBalance",
+        back_populates="subaccount",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+    cex_balances_history = relationship(
+        "CexBalanceHistory",
+        back_populates="subaccount",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
 
     __table_args__ = (
         UniqueConstraint("account_id", "subaccount_type", "subaccount_name", name="uq_subaccount_identifier"),
     )
 
 
-# Add event listeners for automatic timestamp updates
-@event.listens_for(User, "before_update")
-def receive_before_update(mapper, connection, target):
-    target.updated_at = datetime.now(UTC)
+# Install the trigger on `metadata.create_all()` as well (tests); deployed databases get it from migrations
+event.listen(User.__table__, "before_create", set_updated_at_function)
+event.listen(
+    User.__table__,
+    "after_create",
+    DDL("CREATE TRIGGER users_touch_updated BEFORE UPDATE ON users FOR EACH ROW EXECUTE FUNCTION set_updated_at()"),
+)
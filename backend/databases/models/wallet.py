@@ -1,10 +1,27 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, Numeric, String, Text, UniqueConstraint, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Computed,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Numeric,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from backend.databases.models import Base
+from backend.databases.models.base import enum_values
+from backend.databases.types import AddressBytes
+from backend.schemas.wallets import WalletType
 
 
 class WalletAddress(Base):
@@ -29,7 +46,10 @@ class WalletAddress(Base):
 
     # Address info
     address: Mapped[str] = mapped_column(Text, nullable=False)
-    address_lowercase: Mapped[str] = mapped_column(Text, nullable=False, index=True)
+    # BYTEA lookup key (see uq_address_chain), generated by Postgres so bulk inserts needn't compute it
+    address_lowercase: Mapped[str] = mapped_column(
+        AddressBytes, Computed(AddressBytes.sql_expression("address"), persisted=True), nullable=False
+    )
 
     # Optional: for HD wallets
     derivation_path: Mapped[str | None] = mapped_column(
@@ -53,23 +73,24 @@ class WalletAddress(Base):
 
     # Relationships
     wallet = relationship("Wallet", back_populates="addresses")
-    chain = relationship("Chain", back_populates="wallet_addresses")
+    chain = relationship("Chain", back_populates="wallet_addresses", innerjoin=True)  # chain_id is NOT NULL
 
     __table_args__ = (
         # One wallet can only have one address per chain
         UniqueConstraint("wallet_id", "chain_id", name="uq_wallet_chain"),
-        # Same address can't exist twice on the same chain (but can on different chains)
-        UniqueConstraint("address_lowercase", "chain_id", name="uq_address_chain"),
+        # Same address can't exist twice on the same chain (but can on different chains).
+        # Also the address lookup index: INCLUDE answers "which wallet owns it" from the index alone.
+        Index(
+            "uq_address_chain",
+            "address_lowercase",
+            "chain_id",
+            unique=True,
+            postgresql_include=["wallet_id", "is_active"],
+        ),
         # Performance indexes
-        Index("ix_wallet_addr_wallet_chain", "wallet_id", "chain_id"),
         Index("ix_wallet_addr_chain_active", "chain_id", "is_active"),
     )
 
-    @validates("address_lowercase")
-    def validate_address_lowercase(self, key: str, address: str) -> str:
-        """Ensure address is lowercase for consistent lookups."""
-        return address.lower().strip() if address else address
-
     @validates("address")
     def validate_address(self, key: str, address: str) -> str:
         """Basic address validation and normalization."""
@@ -86,22 +107,60 @@ class Wallet(Base):
         BigInteger, ForeignKey("portfolios.id", ondelete="SET NULL"), nullable=True
     )
     name: Mapped[str | None] = mapped_column(String(50), nullable=True)  # optional user-defined name
-    wallet_type: Mapped[str] = mapped_column(String(20), nullable=False)  # metamask, ledger, tronlink
+    wallet_type: Mapped[WalletType] = mapped_column(
+        Enum(WalletType, name="wallet_type_enum", values_callable=enum_values), nullable=False
+    )  # metamask, tronlink, leather
     sync_enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, server_default="true")
     is_watched_only: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default="false")
     last_sync_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     total_value_usd: Mapped[Decimal] = mapped_column(Numeric(precision=20, scale=4), nullable=False, default=0)
 
     # Relationships
-    owner = relationship("User", back_populates="wallets")
+    # Never lazy loaded: managers load what a response needs with explicit selectinload() paths.
+    # Child rows are removed by ON DELETE CASCADE, not by walking the collections in Python.
+    owner = relationship("User", back_populates="wallets", lazy="raise_on_sql")
     addresses: Mapped[list["WalletAddress"]] = relationship(
-        "WalletAddress", back_populates="wallet", cascade="all, delete-orphan"
+        "WalletAddress",
+        back_populates="wallet",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+    portfolio = relationship("Portfolio", back_populates="wallets", lazy="raise_on_sql")
+    transactions = relationship(
+        "Transaction", back_populates="wallet", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
+    balances = relationship(
+        "Balance", back_populates="wallet", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
+    nft_balances = relationship(
+        "NFTBalance", back_populates="wallet", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
+    balances_history = relationship(
+        "BalanceHistory",
+        back_populates="wallet",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
-    portfolio = relationship("Portfolio", back_populates="wallets")
-    transactions = relationship("Transaction", back_populates="wallet", cascade="all, delete-orphan")
-    balances = relationship("Balance", back_populates="wallet", cascade="all, delete-orphan")
-    balances_history = relationship("BalanceHistory", back_populates="wallet", cascade="all, delete-orphan")
-    nft_balances = relationship("NFTBalance", back_populates="wallet", cascade="all, delete-orphan")
-    nft_balances_history = relationship("NFTBalanceHistory", back_populates="wallet", cascade="all, delete-orphan")
-
-    __table_args__ = (Index("ix_wallets_portfolio", "portfolio_id"),)
+    nft_balances_history = relationship(
+        "NFTBalanceHistory",
+        back_populates="wallet",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        Index("ix_wallets_portfolio", "portfolio_id"),
+        # A user's live wallets (user_id + is_deleted = false); the leading column also serves the users FK cascade
+        Index("ix_wallets_user_deleted", "user_id", "is_deleted"),
+    )
+
+
+# Sync queue: wallets due for a sync, never-synced first. Declared after the class to order NULLS FIRST.
+Index(
+    "ix_wallets_syncable",
+    Wallet.last_sync_at.asc().nulls_first(),
+    postgresql_where=text("sync_enabled = true AND is_watched_only = false AND is_deleted = false"),
+)
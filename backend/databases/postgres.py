@@ -1,28 +1,83 @@
+import uuid
+from typing import Any
+
 from loguru import logger
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 
 from backend.databases.base import BaseAsyncDatabase, BaseDatabase
+from backend.settings import settings
+
+
+def pool_options(poolclass: type[QueuePool]) -> dict[str, Any]:
+    """
+    Engine pool arguments from settings.
+
+    Behind PgBouncer the pooling happens upstream, so each checkout opens a fresh
+    connection to the bouncer (NullPool) instead of holding a second pool here.
+    """
+    if settings.postgres_pgbouncer:
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.postgres_pool_size,
+        "max_overflow": settings.postgres_max_overflow,
+        "pool_pre_ping": settings.postgres_pool_pre_ping,
+        "pool_recycle": settings.postgres_pool_recycle,
+        "pool_use_lifo": settings.postgres_pool_use_lifo,
+        "pool_reset_on_return": "rollback",  # Never hand out a connection with an open transaction
+    }
+
+
+def server_settings() -> dict[str, str]:
+    """
+    Session parameters sent when an API connection is opened.
+
+    JIT compilation costs more than it saves on short OLTP plans, so its threshold is raised
+    above what point lookups and per-wallet reads cost. PgBouncer rejects startup parameters
+    other than application_name, so there it is left to the server configuration.
+    """
+    params = {"application_name": "bagtracker"}
+    if not settings.postgres_pgbouncer:
+        params["jit_above_cost"] = str(settings.postgres_jit_above_cost)
+    return params
+
+
+def statement_cache_args() -> dict[str, Any]:
+    """
+    asyncpg prepared statement arguments.
+
+    Repeated lookups reuse the server-side plan instead of re-parsing on every call. PgBouncer in
+    transaction mode may run the next statement on another server connection than the one that
+    prepared it, so nothing is cached (neither by SQLAlchemy nor by asyncpg itself) and each
+    statement gets a unique name instead of asyncpg's per-connection `__asyncpg_stmt_N__` counter.
+    """
+    if settings.postgres_pgbouncer:
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    return {"prepared_statement_cache_size": settings.postgres_statement_cache_size}
 
 
 class PostgresDatabase(BaseDatabase):
     def init_db(self) -> None:
         logger.debug("Initializing Postgres database...")
         try:
-            # TODO: Move pool settings to settings.py (and ENV)
             self.engine = create_engine(
                 self.db_url,
-                poolclass=QueuePool,
-                pool_size=10,
-                max_overflow=20,
-                pool_pre_ping=True,  # Verify connections before use
-                pool_recycle=3600,  # Recycle connections after 1 hour
+                **pool_options(QueuePool),
+                query_cache_size=settings.postgres_query_cache_size,
+                insertmanyvalues_page_size=settings.postgres_insertmanyvalues_page_size,
                 echo=False,
                 connect_args={
-                    "connect_timeout": 10,
+                    "connect_timeout": settings.postgres_connect_timeout,
                     "application_name": "bagtracker",
+                    # PgBouncer in transaction mode cannot route server-side prepared statements
+                    "prepare_threshold": None if settings.postgres_pgbouncer else settings.postgres_prepare_threshold,
                 },
             )
             self.SessionLocal = sessionmaker(bind=self.engine)
@@ -38,16 +93,14 @@ class AsyncPostgresDatabase(BaseAsyncDatabase):
         try:
             self.engine = create_async_engine(
                 self.db_url,
-                poolclass=AsyncAdaptedQueuePool,
-                pool_size=10,
-                max_overflow=20,
-                pool_pre_ping=True,
-                pool_recycle=3600,
+                **pool_options(AsyncAdaptedQueuePool),
+                query_cache_size=settings.postgres_query_cache_size,
+                insertmanyvalues_page_size=settings.postgres_insertmanyvalues_page_size,
                 echo=False,
                 connect_args={
-                    "server_settings": {
-                        "application_name": "bagtracker",
-                    },
+                    "timeout": settings.postgres_connect_timeout,
+                    "server_settings": server_settings(),
+                    **statement_cache_args(),
                 },
             )
             self.SessionLocal = async_sessionmaker(
@@ -55,7 +108,13 @@ class AsyncPostgresDatabase(BaseAsyncDatabase):
                 class_=AsyncSession,
                 expire_on_commit=False,
             )
+            self.ReadSessionLocal = async_sessionmaker(
+                self.engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autoflush=False,
+            )
             logger.info("✅ Async Postgres database initialized successfully")
         except Exception as e:
             logger.error(f"Async Postgres initialization failed: {e}")
-            self.engine, self.SessionLocal = None, None
+            self.engine, self.SessionLocal, self.ReadSessionLocal = None, None, None
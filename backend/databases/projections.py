@@ -0,0 +1,201 @@
+"""
+SQL-side JSON projections.
+
+Build API payloads in Postgres with `json_build_object` / `json_agg` for read paths that would
+otherwise load full ORM graphs only to dump them into response schemas. Numeric columns are
+emitted as JSON strings: the driver never builds a `Decimal` per value on these pass-through
+paths, and precision survives the round trip into the Pydantic schemas.
+"""
+
+from uuid import UUID
+
+from sqlalchemy import JSON, Numeric, Select, Text, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+from backend.databases.models import Balance, Base, Chain, Portfolio, Transaction, User, Wallet, WalletAddress
+
+EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+
+# Same fields as `schemas.BalanceResponse`
+BALANCE_RESPONSE_COLUMNS = (
+    Balance.uuid,
+    Balance.wallet_id,
+    Balance.chain_id,
+    Balance.token_id,
+    Balance.amount_decimal,
+    Balance.avg_buy_price_usd,
+    Balance.avg_sell_price_usd,
+    Balance.total_bought_decimal,
+    Balance.total_sold_decimal,
+    Balance.price_usd,
+    Balance.last_price_update,
+    Balance.created_at,
+    Balance.updated_at,
+)
+
+# Same fields as `schemas.Transaction`
+TRANSACTION_RESPONSE_COLUMNS = (
+    Transaction.uuid,
+    Transaction.chain_id,
+    Transaction.token_id,
+    Transaction.transaction_hash,
+    Transaction.block_number,
+    Transaction.transaction_index,
+    Transaction.transaction_type,
+    Transaction.status,
+    Transaction.counterparty_address,
+    Transaction.amount,
+    Transaction.price_usd,
+    Transaction.gas_used,
+    Transaction.gas_price,
+    Transaction.fee_value,
+    Transaction.fee_currency,
+    Transaction.block_timestamp,
+    Transaction.detected_at,
+    Transaction.timestamp,
+    Transaction.created_at,
+)
+
+# Same fields as `schemas.Chain`
+CHAIN_RESPONSE_COLUMNS = (
+    Chain.id,
+    Chain.name,
+    Chain.name_full,
+    Chain.chain_type,
+    Chain.chain_id,
+    Chain.explorer_url,
+)
+
+# Same fields as `schemas.WalletAddressResponse`, except the BYTEA `address_lowercase` key
+WALLET_ADDRESS_RESPONSE_COLUMNS = (
+    WalletAddress.uuid,
+    WalletAddress.wallet_id,
+    WalletAddress.chain_id,
+    WalletAddress.address,
+    WalletAddress.derivation_path,
+    WalletAddress.is_active,
+    WalletAddress.last_sync_at,
+    WalletAddress.last_sync_block,
+    WalletAddress.created_at,
+    WalletAddress.updated_at,
+)
+
+# Same fields as `schemas.WalletResponse`, without `addresses`
+WALLET_RESPONSE_COLUMNS = (
+    Wallet.uuid,
+    Wallet.name,
+    Wallet.wallet_type,
+    Wallet.memo,
+    Wallet.created_at,
+    Wallet.last_sync_at,
+    Wallet.total_value_usd,
+)
+
+
+def json_object(*columns: InstrumentedAttribute | ColumnElement) -> ColumnElement:
+    """
+    `json_build_object('key', column, ...)` for the given mapped columns or labeled expressions
+    (keyed by label), numerics as strings
+    """
+    arguments = []
+    for column in columns:
+        arguments.append(literal_column(f"'{column.key}'"))
+        arguments.append(cast(column, Text) if isinstance(column.type, Numeric) else column)
+    return func.json_build_object(*arguments, type_=JSON)
+
+
+def _json_array(element: ColumnElement, order_by: ColumnElement) -> ColumnElement:
+    """`json_agg(element ORDER BY order_by)`, or an empty array instead of NULL when there are no rows"""
+    return func.coalesce(func.json_agg(aggregate_order_by(element, order_by)), EMPTY_JSON_ARRAY, type_=JSON)
+
+
+def _wallet_rows_json(
+    wallet_uuid: UUID, model: type[Base], columns: tuple[InstrumentedAttribute, ...], *criteria: ColumnElement
+) -> Select:
+    """
+    One row per matching wallet: `(id, rows)`, where `rows` is a JSON array of `model` rows
+    owned by the wallet, built by a single correlated aggregate.
+    """
+    rows = select(_json_array(json_object(*columns), model.id)).where(
+        model.wallet_id == Wallet.id, model.is_deleted.is_(False), *criteria
+    )
+
+    return select(Wallet.id, rows.scalar_subquery().label("rows")).where(
+        Wallet.uuid == wallet_uuid, Wallet.is_deleted.is_(False)
+    )
+
+
+def wallet_balances_json(wallet_uuid: UUID, include_zero: bool = False) -> Select:
+    """`(id, rows)` for the wallet, `rows` shaped like `schemas.BalanceResponse`"""
+    criteria = () if include_zero else (Balance.amount_decimal > 0,)
+    return _wallet_rows_json(wallet_uuid, Balance, BALANCE_RESPONSE_COLUMNS, *criteria)
+
+
+def wallet_transactions_json(wallet_uuid: UUID) -> Select:
+    """`(id, rows)` for the wallet, `rows` shaped like `schemas.Transaction`"""
+    return _wallet_rows_json(wallet_uuid, Transaction, TRANSACTION_RESPONSE_COLUMNS)
+
+
+def wallet_transaction_lines(wallet_id: int) -> Select:
+    """One JSON object per transaction of the wallet, shaped like `schemas.Transaction`, oldest first"""
+    return (
+        select(json_object(*TRANSACTION_RESPONSE_COLUMNS))
+        .where(Transaction.wallet_id == wallet_id, Transaction.is_deleted.is_(False))
+        .order_by(Transaction.timestamp, Transaction.id)
+    )
+
+
+def _wallets_json(*criteria: ColumnElement) -> ColumnElement:
+    """JSON array of the matching wallets with their addresses and chains, shaped like `schemas.WalletResponse`"""
+    addresses = (
+        select(
+            _json_array(
+                json_object(
+                    *WALLET_ADDRESS_RESPONSE_COLUMNS,
+                    func.lower(WalletAddress.address).label("address_lowercase"),
+                    json_object(*CHAIN_RESPONSE_COLUMNS).label("chain"),
+                ),
+                WalletAddress.id,
+            )
+        )
+        .join(Chain, Chain.id == WalletAddress.chain_id)
+        .where(WalletAddress.wallet_id == Wallet.id, WalletAddress.is_deleted.is_(False))
+    )
+    wallets = select(
+        _json_array(json_object(*WALLET_RESPONSE_COLUMNS, addresses.scalar_subquery().label("addresses")), Wallet.id)
+    ).where(Wallet.is_deleted.is_(False), *criteria)
+    return wallets.scalar_subquery()
+
+
+def user_tree_json(*criteria: ColumnElement) -> Select:
+    """
+    `(tree)` for the matching user: one JSON document shaped like `schemas.User`, with wallets
+    and portfolios (and their wallets, addresses and chains) nested by correlated aggregates.
+    """
+    portfolios = select(
+        _json_array(
+            json_object(
+                Portfolio.uuid,
+                Portfolio.name,
+                Portfolio.memo,
+                Portfolio.created_at,
+                _wallets_json(Wallet.portfolio_id == Portfolio.id).label("wallets"),
+            ),
+            Portfolio.id,
+        )
+    ).where(Portfolio.user_id == User.id, Portfolio.is_deleted.is_(False))
+
+    tree = json_object(
+        User.uuid,
+        User.username,
+        User.email,
+        User.name,
+        User.last_name,
+        User.nickname,
+        User.memo,
+        _wallets_json(Wallet.user_id == User.id).label("wallets"),
+        portfolios.scalar_subquery().label("portfolios"),
+    )
+    return select(tree.label("tree")).where(User.is_deleted.is_(False), *criteria)
@@ -1,15 +1,40 @@
-import redis
 from loguru import logger
+from redis.asyncio import ConnectionPool, Redis
 
 from backend.settings import settings
 
+# One pool per process, created on first use: clients share its sockets instead of opening their own
+_pool: ConnectionPool | None = None
 
-def get_redis_client() -> redis.Redis:
-    logger.info(f"Connecting to Redis at {settings.redis_host}:{settings.redis_port}")
+
+def _get_pool() -> ConnectionPool:
+    global _pool
+    if _pool is None:
+        logger.info(f"Connecting to Redis at {settings.redis_host}:{settings.redis_port}")
+        _pool = ConnectionPool(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=settings.redis_db,
+            username=settings.redis_username,
+            password=settings.redis_password,
+            max_connections=settings.redis_max_connections,
+            health_check_interval=30,
+            socket_keepalive=True,
+        )
+    return _pool
+
+
+def get_redis_client() -> Redis:
     if not settings.redis_host:
         error_message = "Redis host is not set in settings"
         logger.error(error_message)
         raise RuntimeError(error_message)
-    return redis.Redis(
-        host=settings.redis_host, port=settings.redis_port, db=settings.redis_db, password=settings.redis_password
-    )
+    return Redis(connection_pool=_get_pool())
+
+
+async def close_redis_pool() -> None:
+    """Close the pooled Redis connections"""
+    global _pool
+    if _pool is not None:
+        await _pool.aclose()
+        _pool = None
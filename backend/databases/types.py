@@ -0,0 +1,62 @@
+from sqlalchemy import LargeBinary
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class AddressBytes(TypeDecorator):
+    """
+    Blockchain address stored as length-tagged BYTEA, exposed as a lowercase string.
+
+    Usage:
+        address_lowercase: Mapped[str] = mapped_column(AddressBytes, nullable=False)
+
+    Storage:
+    - EVM hex addresses ("0x" + 40 hex chars): 0x00 tag + 20 raw bytes
+    - Anything else (Tron, Solana, Stacks, Bitcoin): 0x01 tag + UTF-8 bytes
+
+    EVM keys shrink from 42 characters to 21 bytes, which keeps the lookup indexes
+    narrow. Comparisons in queries go through the same encoding, so callers keep
+    working with plain strings.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    EVM_TAG = b"\x00"
+    TEXT_TAG = b"\x01"
+
+    @staticmethod
+    def sql_expression(column: str) -> str:
+        """
+        The same encoding in SQL, for a generated column computed from a plain text `column`.
+
+        Non-EVM addresses are lowercased before encoding. decode(..., 'escape') turns the text into
+        its raw bytes (convert_to() would too, but it isn't IMMUTABLE, which generated columns need).
+        """
+        return (
+            f"CASE WHEN {column} ~ '^0[xX][0-9a-fA-F]{{40}}$' "
+            f"THEN '\\x00'::bytea || decode(substr({column}, 3), 'hex') "
+            f"ELSE '\\x01'::bytea || decode(replace(lower({column}), '\\', '\\\\'), 'escape') END"
+        )
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> bytes | None:
+        """Called when saving to database - packs the address"""
+        if value is None:
+            return None
+
+        if len(value) == 42 and value[:2] in ("0x", "0X"):
+            try:
+                return self.EVM_TAG + bytes.fromhex(value[2:])
+            except ValueError:
+                pass  # Not hex after all, store as text
+        return self.TEXT_TAG + value.encode("utf-8")
+
+    def process_result_value(self, value: bytes | None, dialect: Dialect) -> str | None:
+        """Called when reading from database - unpacks the address"""
+        if value is None:
+            return None
+
+        value = bytes(value)
+        if value[:1] == self.EVM_TAG:
+            return "0x" + value[1:].hex()
+        return value[1:].decode("utf-8")
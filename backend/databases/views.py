@@ -0,0 +1,27 @@
+"""
+Read-only mappings of materialized views.
+
+Views are created and changed by Alembic migrations. Their tables live in a separate
+MetaData so `Base.metadata.create_all()` and autogenerate never treat them as tables.
+"""
+
+from sqlalchemy import BigInteger, Column, Integer, MetaData, Numeric, Table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+views_metadata = MetaData()
+
+# Token value per (wallet, chain), with the wallet's portfolio for per-portfolio sums
+portfolio_totals = Table(
+    "portfolio_totals",
+    views_metadata,
+    Column("portfolio_id", BigInteger),
+    Column("wallet_id", BigInteger, primary_key=True),
+    Column("chain_id", BigInteger, primary_key=True),
+    Column("total_value_usd", Numeric),
+    Column("token_count", Integer),
+)
+
+
+async def refresh_portfolio_totals(session: AsyncSession) -> None:
+    """Rebuild `portfolio_totals` without blocking readers"""
+    await session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY portfolio_totals"))
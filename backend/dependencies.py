@@ -1,15 +1,36 @@
+import asyncio
+import hmac
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend import errors
+from backend.cache import TTLCache
 from backend.databases.factory_async import get_async_db_session
 from backend.databases.models import User
 from backend.security.jwt import decode_access_token
 from backend.settings import settings
 
+# Encoded once for the constant-time comparison in TokenAuth
+_TOKEN_BYTES = settings.token.encode()
+
+# Authenticated users by id, detached from the session that loaded them
+_user_cache: TTLCache[int, User] = TTLCache(maxsize=settings.user_cache_size, ttl=settings.user_cache_ttl)
+
+
+# User lookups in progress, awaited by concurrent requests for the same user instead of querying again
+_user_lookups: dict[int, asyncio.Future[User]] = {}
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def forget_cached_user(mapper, connection, target: User) -> None:
+    """Drop a user from the cache as soon as a change to it is flushed"""
+    _user_cache.pop(target.id)
+
 
 class TokenAuth(APIKeyHeader):
     """
@@ -17,8 +38,9 @@ class TokenAuth(APIKeyHeader):
     """
 
     async def __call__(self, request: Request):
-        token = super().__call__(request=request)
-        if await token != settings.token:
+        token = await super().__call__(request=request)
+        # Constant time, so response timing doesn't tell how much of a guess was right
+        if not hmac.compare_digest(token.encode() if token else b"", _TOKEN_BYTES):
             raise errors.NotAuthorizedException("Wrong token")
 
 
@@ -40,7 +62,8 @@ class JWTBearer(HTTPBearer):
             raise HTTPException(status_code=403, detail="Invalid authentication scheme")
 
         try:
-            decode_access_token(credentials.credentials)
+            # Kept for get_current_user, so the token is verified once per request
+            request.state.token_data = decode_access_token(credentials.credentials)
         except ValueError as e:
             raise HTTPException(status_code=403, detail=str(e)) from e
 
@@ -48,6 +71,7 @@ class JWTBearer(HTTPBearer):
 
 
 async def get_current_user(
+    request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(JWTBearer())],
     session: Annotated[AsyncSession, Depends(get_async_db_session)],
 ) -> User:
@@ -55,6 +79,7 @@ async def get_current_user(
     Get the current authenticated user from JWT token.
 
     Args:
+        request: Current request, carrying the token data decoded by JWTBearer
         credentials: HTTP Authorization credentials containing JWT token
         session: Database session
 
@@ -64,16 +89,47 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    token = credentials.credentials
-    try:
-        token_data = decode_access_token(token)
-    except ValueError as e:
-        raise HTTPException(status_code=403, detail=str(e)) from e
+    if (token_data := getattr(request.state, "token_data", None)) is None:
+        try:
+            token_data = decode_access_token(credentials.credentials)
+        except ValueError as e:
+            raise HTTPException(status_code=403, detail=str(e)) from e
+
+    if (user := _user_cache.get(token_data.user_id)) is not None:
+        return user
 
-    user = await User.get_one(session, id=token_data.user_id)
+    while (pending := _user_lookups.get(token_data.user_id)) is not None:
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise  # This request was cancelled, not the lookup it waited on
+
+    lookup = _user_lookups[token_data.user_id] = asyncio.get_running_loop().create_future()
+    try:
+        user = await _load_user(session, token_data.user_id)
+    except asyncio.CancelledError:
+        lookup.cancel()
+        raise
+    except Exception as e:
+        lookup.set_exception(e)
+        lookup.exception()  # Mark it retrieved, so a lookup nobody else waited on isn't logged as unhandled
+        raise
+    else:
+        lookup.set_result(user)
+        return user
+    finally:
+        _user_lookups.pop(token_data.user_id, None)
+
+
+async def _load_user(session: AsyncSession, user_id: int) -> User:
+    """Loads an active user, detaches it from the session and caches it"""
+    user = await User.get_one(session, id=user_id)
     if not user or user.is_deleted:
         raise HTTPException(status_code=404, detail="User not found")
 
+    session.expunge(user)  # Shared between requests, so it must not belong to this one's session
+    _user_cache.set(user.id, user)
     return user
 
 
@@ -1,29 +1,25 @@
-import traceback
+import json
+from collections.abc import Callable
+from functools import cache
 
 from fastapi import Request
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from loguru import logger
 from pydantic_core import ValidationError
 
+from backend.responses import FastJSONResponse
 
-async def handle_exception(request: Request, exc: Exception) -> JSONResponse:
-    code = 500
-    message = str(exc.args)
-    logger.error(traceback.format_exc())
-    if isinstance(exc, GeneralProcessingException):
-        code = exc.status_code
-        message = exc.message
-    elif isinstance(exc, ValidationError):
-        errors_kwargs = {"include_url": False}
-        return JSONResponse(
-            status_code=code,
-            content=jsonable_encoder({"detail": exc.errors(**errors_kwargs)}),
-        )
-    return JSONResponse(
-        status_code=code,
-        content={"type": str(type(exc)), "message": message},
-    )
+
+@cache
+def _default_body(exc_class: type["GeneralProcessingException"]) -> bytes:
+    """Serialized error body of an exception class raised with its default status and message, built once"""
+    content = {"type": str(exc_class), "message": exc_class.message}
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+async def handle_exception(request: Request, exc: Exception) -> Response:
+    return _handler_for(type(exc))(request, exc)
 
 
 class GeneralProcessingException(Exception):
@@ -108,3 +104,43 @@ class TransactionError(GeneralProcessingException):
 
     def __init__(self, status_code: int | None = None, exception_message: str | None = None):
         super().__init__(status_code=status_code, exception_message=exception_message)
+
+
+def _log_unhandled(request: Request, exc: Exception) -> None:
+    # The traceback is only formatted if a sink writes the record
+    logger.opt(exception=exc).error(f"Unhandled {type(exc).__name__} on {request.method} {request.url.path}")
+
+
+def _handle_processing_exception(request: Request, exc: GeneralProcessingException) -> Response:
+    exc_class = type(exc)
+    if exc.status_code < 500:
+        # Expected client errors: no traceback to build
+        logger.warning(f"{exc_class.__name__}: {exc.message}")
+    else:
+        _log_unhandled(request, exc)
+    if exc.status_code == exc_class.status_code and exc.message == exc_class.message:
+        return Response(content=_default_body(exc_class), status_code=exc.status_code, media_type="application/json")
+    return FastJSONResponse(status_code=exc.status_code, content={"type": str(exc_class), "message": exc.message})
+
+
+def _handle_validation_error(request: Request, exc: ValidationError) -> Response:
+    _log_unhandled(request, exc)
+    return FastJSONResponse(status_code=500, content=jsonable_encoder({"detail": exc.errors(include_url=False)}))
+
+
+def _handle_unexpected(request: Request, exc: Exception) -> Response:
+    _log_unhandled(request, exc)
+    return FastJSONResponse(status_code=500, content={"type": str(type(exc)), "message": str(exc.args)})
+
+
+_HANDLERS: dict[type[Exception], Callable[[Request, Exception], Response]] = {
+    GeneralProcessingException: _handle_processing_exception,
+    ValidationError: _handle_validation_error,
+    Exception: _handle_unexpected,
+}
+
+
+@cache
+def _handler_for(exc_class: type[Exception]) -> Callable[[Request, Exception], Response]:
+    """Handler of the closest registered base class, resolved once per exception class"""
+    return next(_HANDLERS[base] for base in exc_class.__mro__ if base in _HANDLERS)
@@ -1,15 +1,59 @@
-from backend.managers.info import InfoManager
-from backend.managers.healthcheck import HealthCheckManager
-from backend.managers.eth import EthereumManager
-from backend.managers.base_crud import BaseCRUDManager
-from backend.managers.users import UserManager
-from backend.managers.chains import ChainManager
-from backend.managers.tokens import TokenManager
-from backend.managers.rpcs import RpcManager
-from backend.managers.wallet_address import WalletAddressManager
-from backend.managers.wallets import WalletManager
-from backend.managers.balance import BalanceManager
-from backend.managers.balance_history import BalanceHistoryManager
-from backend.managers.transactions import TransactionManager  # Should be after BalanceManager
-from backend.managers.portfolio import PortfolioManager
-from backend.managers.auth import AuthManager
+"""
+Managers are imported on first access (PEP 562), so importing one doesn't load them all
+and the order they import each other in doesn't matter.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_LAZY = {
+    "InfoManager": "backend.managers.info",
+    "HealthCheckManager": "backend.managers.healthcheck",
+    "EthereumManager": "backend.managers.eth",
+    "BaseCRUDManager": "backend.managers.base_crud",
+    "UserManager": "backend.managers.users",
+    "ChainManager": "backend.managers.chains",
+    "TokenManager": "backend.managers.tokens",
+    "RpcManager": "backend.managers.rpcs",
+    "WalletAddressManager": "backend.managers.wallet_address",
+    "WalletManager": "backend.managers.wallets",
+    "BalanceManager": "backend.managers.balance",
+    "BalanceHistoryManager": "backend.managers.balance_history",
+    "TransactionManager": "backend.managers.transactions",
+    "PortfolioManager": "backend.managers.portfolio",
+    "AuthManager": "backend.managers.auth",
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(importlib.import_module(module), name)
+    globals()[name] = obj  # Later lookups don't come back here
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted((*globals(), *_LAZY))
+
+
+if TYPE_CHECKING:
+    from backend.managers.auth import AuthManager
+    from backend.managers.balance import BalanceManager
+    from backend.managers.balance_history import BalanceHistoryManager
+    from backend.managers.base_crud import BaseCRUDManager
+    from backend.managers.chains import ChainManager
+    from backend.managers.eth import EthereumManager
+    from backend.managers.healthcheck import HealthCheckManager
+    from backend.managers.info import InfoManager
+    from backend.managers.portfolio import PortfolioManager
+    from backend.managers.rpcs import RpcManager
+    from backend.managers.tokens import TokenManager
+    from backend.managers.transactions import TransactionManager
+    from backend.managers.users import UserManager
+    from backend.managers.wallet_address import WalletAddressManager
+    from backend.managers.wallets import WalletManager
@@ -1,4 +1,4 @@
-from datetime import UTC, datetime
+from sqlalchemy import func
 
 from backend.errors import UserError
 from backend.managers import UserManager
@@ -37,8 +37,8 @@ class AuthManager(UserManager):
         if not user.password_hash or not verify_password(credentials.password, user.password_hash):
             raise UserError(status_code=401, exception_message="Invalid username or password")
 
-        # Update last login
-        user.last_login = datetime.now(UTC)
+        # Update last login (stamped by the database, save() refreshes the value)
+        user.last_login = func.now()
         await user.save(self.db)
 
         # Create JWT token
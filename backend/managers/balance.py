@@ -1,15 +1,19 @@
 from collections.abc import Sequence
 from datetime import UTC, datetime
 from decimal import Decimal
+from functools import cached_property
 from uuid import UUID
 
 from loguru import logger
-from sqlalchemy import func, not_, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import func, lambda_stmt, select, update
+from sqlalchemy.orm import joinedload
 
+from backend.databases.bulk import copy_balance_history, snapshot_balances, upsert_balances
 from backend.databases.models import Balance, Transaction, Wallet
+from backend.databases.projections import wallet_balances_json
+from backend.errors import DatabaseError
 from backend.managers import BaseCRUDManager
-from backend.schemas import SnapshotType, TransactionStatus
+from backend.schemas import SnapshotType
 from backend.services.balance_calculator import BalanceCalculator
 
 
@@ -25,6 +29,11 @@ class BalanceManager(BaseCRUDManager[Balance]):
     def _model_class(self) -> type[Balance]:
         return Balance
 
+    @cached_property
+    def _calculator(self) -> BalanceCalculator:
+        """One calculator per manager, shared by its methods"""
+        return BalanceCalculator(self.db, self.settings)
+
     async def get_wallet_balances(
         self,
         wallet_id: int | None = None,
@@ -56,18 +65,36 @@ class BalanceManager(BaseCRUDManager[Balance]):
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def get_wallet_balances_json(self, wallet_uuid: UUID, include_zero: bool = False) -> tuple[int, list[dict]]:
+        """
+        Gets all balances for a wallet as plain dicts built by Postgres (no ORM objects).
+
+        Args:
+            wallet_uuid: External wallet UUID
+            include_zero: Whether to include zero balances
+
+        Returns:
+            Tuple of (internal wallet ID, list of balance dicts shaped like `BalanceResponse`)
+        """
+        result = await self.db.execute(wallet_balances_json(wallet_uuid, include_zero))
+        if (row := result.one_or_none()) is None:
+            raise DatabaseError(404, "Object not found")
+        return row.id, row.rows
+
     async def get_wallet_balances_by_chain(
         self, wallet_id: int, chain_id: int, include_zero: bool = False
     ) -> list[Balance]:
         """Get balances for a wallet on a specific chain."""
-        stmt = (
-            select(Balance)
+        # lambda_stmt: the statement is built once per code path, later calls only swap the bound ids
+        stmt = lambda_stmt(
+            lambda: select(Balance)
             .where(Balance.wallet_id == wallet_id, Balance.chain_id == chain_id)
-            .options(selectinload(Balance.token), selectinload(Balance.chain))
+            # Many-to-one, so LEFT JOINed into the same query rather than fetched with extra SELECT ... IN
+            .options(joinedload(Balance.token), joinedload(Balance.chain))
         )
 
         if not include_zero:
-            stmt = stmt.where(Balance.amount_decimal > 0)
+            stmt += lambda s: s.where(Balance.amount_decimal > 0)
 
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
@@ -79,30 +106,36 @@ class BalanceManager(BaseCRUDManager[Balance]):
         Returns:
             Dict with total_value_usd and breakdown by token
         """
-        stmt = select(
-            func.sum(self.model.amount_decimal).label("amount_decimal"),
-            func.sum(self.model.price_usd).label("price_usd"),
-            # Weighted averages for buy/sell prices
-            (
-                func.sum(self.model.avg_buy_price_usd * self.model.total_bought_decimal)
-                / func.nullif(func.sum(self.model.total_bought_decimal), 0)
-            ).label("avg_buy_price_usd"),
-            (
-                func.sum(self.model.avg_sell_price_usd * self.model.total_sold_decimal)
-                / func.nullif(func.sum(self.model.total_sold_decimal), 0)
-            ).label("avg_sell_price_usd"),
-            func.sum(self.model.total_bought_decimal).label("total_bought_decimal"),
-            func.sum(self.model.total_sold_decimal).label("total_sold_decimal"),
-            func.count(self.model.id).label("token_count"),
-        ).where(
-            self.model.wallet_id == wallet_id,
-            self.model.amount_decimal > 0,
+        stmt = lambda_stmt(
+            lambda: select(
+                func.sum(Balance.amount_decimal).label("amount_decimal"),
+                # Value-weighted, so amount_decimal * price_usd is the sum of each balance's value
+                (
+                    func.sum(Balance.amount_decimal * Balance.price_usd)
+                    / func.nullif(func.sum(Balance.amount_decimal), 0)
+                ).label("price_usd"),
+                # Weighted averages for buy/sell prices
+                (
+                    func.sum(Balance.avg_buy_price_usd * Balance.total_bought_decimal)
+                    / func.nullif(func.sum(Balance.total_bought_decimal), 0)
+                ).label("avg_buy_price_usd"),
+                (
+                    func.sum(Balance.avg_sell_price_usd * Balance.total_sold_decimal)
+                    / func.nullif(func.sum(Balance.total_sold_decimal), 0)
+                ).label("avg_sell_price_usd"),
+                func.sum(Balance.total_bought_decimal).label("total_bought_decimal"),
+                func.sum(Balance.total_sold_decimal).label("total_sold_decimal"),
+                func.count(Balance.id).label("token_count"),
+            ).where(
+                Balance.wallet_id == wallet_id,
+                Balance.amount_decimal > 0,
+            )
         )
 
         result = await self.db.execute(stmt)
         row = result.one()
 
-        calculator = BalanceCalculator(self.db, self.settings)
+        calculator = self._calculator
 
         total_balance = Balance()
         total_balance._assign_attributes(row._asdict())
@@ -121,16 +154,20 @@ class BalanceManager(BaseCRUDManager[Balance]):
         Returns:
             Dict mapping chain_id -> total_value_usd
         """
-        from sqlalchemy import func
-
-        stmt = (
+        per_chain = (
             select(Balance.chain_id, func.sum(Balance.amount_decimal * Balance.price_usd).label("total_value_usd"))
             .where(Balance.wallet_id == wallet_id, Balance.amount_decimal > 0)
             .group_by(Balance.chain_id)
+            .subquery()
+        )
+        # Folded into one row of two parallel arrays: numeric[] still decodes to Decimal, which JSON would not
+        stmt = select(
+            func.array_agg(per_chain.c.chain_id).label("chain_ids"),
+            func.array_agg(per_chain.c.total_value_usd).label("totals"),
         )
 
-        result = await self.db.execute(stmt)
-        return {row.chain_id: row.total_value_usd for row in result}
+        row = (await self.db.execute(stmt)).one()
+        return dict(zip(row.chain_ids or [], row.totals or [], strict=True))
 
     async def process_transaction(self, transaction: Transaction, create_snapshot: bool = True) -> Balance:
         """
@@ -144,7 +181,7 @@ class BalanceManager(BaseCRUDManager[Balance]):
         Returns:
             Updated Balance object
         """
-        calculator = BalanceCalculator(self.db, self.settings)
+        calculator = self._calculator
         balance = await calculator.process_transaction(transaction=transaction, create_snapshot=create_snapshot)
 
         # Update wallet total value
@@ -153,19 +190,62 @@ class BalanceManager(BaseCRUDManager[Balance]):
 
         return balance
 
-    async def _update_wallet_total(self, wallet_id: int) -> None:
-        """Updates the total_value_usd on the wallet record."""
-        totals = await self.get_wallet_total_value(wallet_id)
-        logger.debug(f"{totals=}")
+    async def process_transactions(
+        self, transactions: list[Transaction], create_snapshot: bool = True
+    ) -> list[Balance]:
+        """
+        Processes many transactions in one pass, for syncs and imports.
+        Each touched balance is written once and each wallet total is updated once at the end.
 
-        stmt = select(Wallet).where(Wallet.id == wallet_id)
-        result = await self.db.execute(stmt)
-        wallet = result.scalar_one()
+        Args:
+            transactions: Wallet transactions to process
+            create_snapshot: Whether to create a history snapshot per transaction
+
+        Returns:
+            Updated Balance objects, one per (wallet, token, chain)
+        """
+        calculator = self._calculator
+        balances = await calculator.process_transactions(transactions, create_snapshot=create_snapshot)
+
+        for wallet_id in {tx.wallet_id for tx in transactions}:
+            await self._update_wallet_total(wallet_id)
+
+        return balances
+
+    async def upsert_balances(self, rows: list[dict]) -> int:
+        """
+        Writes many balances at once, inserting new (wallet, token, chain) rows and updating existing ones.
+        Used by sync jobs that refresh a wallet's whole token list. Balance objects already
+        loaded in the session are not refreshed.
+
+        Args:
+            rows: Balance column dicts, all with the same keys (wallet_id, token_id and chain_id required)
+
+        Returns:
+            Number of rows written
+        """
+        written = await upsert_balances(self.db, rows)
 
-        wallet.total_value_usd = totals["total_value_usd"]
-        logger.debug(f"Saving balance: {wallet.total_value_usd}")
-        # await self.db.flush()
-        await Wallet.save(wallet, self.db)
+        for wallet_id in {row["wallet_id"] for row in rows}:
+            await self._update_wallet_total(wallet_id)
+
+        return written
+
+    async def _update_wallet_total(self, wallet_id: int) -> None:
+        """Updates the total_value_usd on the wallet record, in one UPDATE with the sum as a subquery."""
+        total_value_usd = (
+            select(func.coalesce(func.sum(Balance.amount_decimal * Balance.price_usd), 0))
+            .where(Balance.wallet_id == wallet_id, Balance.amount_decimal > 0)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(Wallet)
+            .where(Wallet.id == wallet_id)
+            .values(total_value_usd=total_value_usd)
+            .returning(Wallet.total_value_usd)
+        )
+        result = await self.db.execute(stmt)
+        logger.debug(f"Saved wallet {wallet_id} total: {result.scalar_one()}")
 
     async def recalculate_wallet_balances(self, wallet_id: int, create_snapshots: bool = False) -> list[Balance]:
         """
@@ -181,41 +261,24 @@ class BalanceManager(BaseCRUDManager[Balance]):
         Returns:
             List of recalculated Balance objects (excludes None results)
         """
-        calculator = BalanceCalculator(self.db, self.settings)
-
-        # Get all unique token/chain combinations for this wallet
-        stmt = (
-            select(Transaction.token_id, Transaction.chain_id)
-            .where(
-                Transaction.wallet_id == wallet_id,
-                Transaction.status == TransactionStatus.CONFIRMED.value,
-                not_(Transaction.is_deleted),
-            )
-            .distinct()
-        )
-
-        result = await self.db.execute(stmt)
-        token_chain_pairs = result.all()
-        logger.debug(f"{token_chain_pairs=}")
-
-        recalculated_balances = []
-
-        for token_id, chain_id in token_chain_pairs:
-            balance = await calculator.recalculate_balance_from_transactions(
-                wallet_id=wallet_id, token_id=token_id, chain_id=chain_id
+        calculator = self._calculator
+
+        # One read of all the wallet's transactions and one upsert, whatever the number of tokens
+        recalculated_balances = await calculator.recalculate_wallet(wallet_id)
+        logger.debug(f"Recalculated {len(recalculated_balances)} balances for wallet {wallet_id}")
+
+        if create_snapshots:
+            snapshot_date = datetime.now(UTC)
+            await copy_balance_history(
+                self.db,
+                [
+                    BalanceCalculator.history_snapshot_row(
+                        balance, SnapshotType.TRANSACTION, "recalculation", snapshot_date=snapshot_date
+                    )
+                    for balance in recalculated_balances
+                ],
             )
 
-            # Skip if no transactions exist for this token/chain
-            if balance is None:
-                continue
-
-            if create_snapshots:
-                await calculator._create_history_snapshot(
-                    balance=balance, snapshot_type=SnapshotType.TRANSACTION, triggered_by="recalculation"
-                )
-
-            recalculated_balances.append(balance)
-
         # Update wallet total
         await self._update_wallet_total(wallet_id)
 
@@ -241,20 +304,19 @@ class BalanceManager(BaseCRUDManager[Balance]):
         Returns:
             List of updated Balance objects
         """
-        calculator = BalanceCalculator(self.db, self.settings)
+        price_updated_at = datetime.now(UTC)  # Same timestamp for every balance of this price update
+        held = (Balance.token_id == token_id, Balance.amount_decimal > 0)
 
-        stmt = select(self.model).where(self.model.token_id == token_id, self.model.amount_decimal > 0)
-
-        result = await self.db.execute(stmt)
-        balances = result.scalars().all()
-
-        for balance in balances:
-            balance.price_usd = new_price_usd
-            balance.last_price_update = datetime.now(UTC)
+        stmt = (
+            update(Balance)
+            .where(*held)
+            .values(price_usd=new_price_usd, last_price_update=price_updated_at)
+            .returning(Balance)
+        )
+        result = await self.db.scalars(stmt, execution_options={"populate_existing": True})
+        balances = result.all()
 
-            if create_snapshots:
-                await calculator._create_history_snapshot(
-                    balance=balance, snapshot_type=snapshot_type, triggered_by="price_update"
-                )
+        if create_snapshots and balances:
+            await snapshot_balances(self.db, held, snapshot_type.value, "price_update", price_updated_at)
 
         return balances
@@ -1,13 +1,17 @@
-from collections.abc import Sequence
-from datetime import datetime
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from functools import cached_property
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, Select, String, delete, func, literal, select, union_all
 
-from backend.databases.models import BalanceHistory
+from backend.databases.models import Balance, BalanceHistory
 from backend.managers.base_crud import BaseCRUDManager
-from backend.schemas import PortfolioHistoryPoint, SnapshotType
+from backend.schemas import CURRENT_SNAPSHOT_TYPE, PortfolioHistoryPoint, SnapshotType
 from backend.services.balance_calculator import BalanceCalculator
 
+# Rows fetched per round trip from the server-side cursor when streaming history
+HISTORY_BATCH_SIZE = 1000
+
 
 class BalanceHistoryManager(BaseCRUDManager[BalanceHistory]):
     """Manager for balance history operations."""
@@ -16,6 +20,40 @@ class BalanceHistoryManager(BaseCRUDManager[BalanceHistory]):
     def _model_class(self) -> type[BalanceHistory]:
         return BalanceHistory
 
+    @cached_property
+    def _calculator(self) -> BalanceCalculator:
+        """One calculator per manager, shared by its methods"""
+        return BalanceCalculator(self.db, self.settings)
+
+    @staticmethod
+    def _history_points(
+        wallet_id: int,
+        token_id: int,
+        chain_id: int,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        snapshot_type: SnapshotType | None = None,
+    ) -> Select:
+        """Snapshots of one position as `BalanceHistoryPoint` columns (plain rows, no ORM objects)"""
+        stmt = select(
+            BalanceHistory.snapshot_date,
+            BalanceHistory.snapshot_type,
+            BalanceHistory.amount_decimal,
+            BalanceHistory.price_usd,
+            BalanceHistory.triggered_by,
+        ).where(
+            BalanceHistory.wallet_id == wallet_id,
+            BalanceHistory.token_id == token_id,
+            BalanceHistory.chain_id == chain_id,
+        )
+        if start_date:
+            stmt = stmt.where(BalanceHistory.snapshot_date >= start_date)
+        if end_date:
+            stmt = stmt.where(BalanceHistory.snapshot_date <= end_date)
+        if snapshot_type:
+            stmt = stmt.where(BalanceHistory.snapshot_type == snapshot_type.value)
+        return stmt
+
     async def get_balance_history(
         self,
         wallet_id: int,
@@ -24,11 +62,14 @@ class BalanceHistoryManager(BaseCRUDManager[BalanceHistory]):
         start_date: datetime | None = None,
         end_date: datetime | None = None,
         snapshot_type: SnapshotType | None = None,
-    ) -> Sequence[BalanceHistory]:
+    ) -> AsyncIterator[Row]:
         """
         Gets balance history for charting and analytics.
         Leverages TimescaleDB hypertable for efficient time-series queries.
 
+        Rows come from a server-side cursor `HISTORY_BATCH_SIZE` at a time, so callers can build
+        their response while reading instead of holding every row first.
+
         Args:
             wallet_id: Wallet ID
             token_id: Token ID
@@ -37,30 +78,124 @@ class BalanceHistoryManager(BaseCRUDManager[BalanceHistory]):
             end_date: End date filter
             snapshot_type: Type of snapshot filter (use SnapshotType enum)
 
-        Returns:
-            List of BalanceHistory records
+        Yields:
+            Rows shaped like `BalanceHistoryPoint`, ordered by snapshot_date
+        """
+        stmt = self._history_points(wallet_id, token_id, chain_id, start_date, end_date, snapshot_type)
+        result = await self.db.stream(
+            stmt.order_by(BalanceHistory.snapshot_date.asc()).execution_options(yield_per=HISTORY_BATCH_SIZE)
+        )
+        async for row in result:
+            yield row
+
+    async def get_balance_history_with_current(
+        self,
+        wallet_id: int,
+        token_id: int,
+        chain_id: int,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        snapshot_type: SnapshotType | None = None,
+    ) -> AsyncIterator[Row]:
+        """
+        Same series as `get_balance_history()`, ending with the live balance as a `current` point.
+        History and current rows come from one UNION ALL query over the shared balance columns.
+
+        Yields:
+            Rows shaped like `BalanceHistoryPoint`, ordered by snapshot_date
+        """
+        history = self._history_points(wallet_id, token_id, chain_id, start_date, end_date, snapshot_type)
+
+        current = select(
+            Balance.updated_at,
+            literal(CURRENT_SNAPSHOT_TYPE),
+            Balance.amount_decimal,
+            Balance.price_usd,
+            literal(None, String),
+        ).where(
+            Balance.wallet_id == wallet_id,
+            Balance.token_id == token_id,
+            Balance.chain_id == chain_id,
+            Balance.is_deleted.is_(False),
+        )
+
+        points = union_all(history, current).subquery()
+        result = await self.db.stream(
+            select(points).order_by(points.c.snapshot_date.asc()).execution_options(yield_per=HISTORY_BATCH_SIZE)
+        )
+        async for row in result:
+            yield row
+
+    async def stream_balance_history(
+        self,
+        wallet_id: int,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        snapshot_type: SnapshotType | None = None,
+    ) -> AsyncIterator[Row]:
+        """
+        All snapshots of a wallet, oldest first, for exports.
+
+        Rows come from a server-side cursor `HISTORY_BATCH_SIZE` at a time, so memory stays flat
+        over any date range. Consume the iterator while the session is still open.
+
+        Yields:
+            Rows shaped like `BalanceHistoryExportRow`
         """
         stmt = (
-            select(self.model)
-            .filter(
-                self.model.wallet_id == wallet_id,
-                self.model.token_id == token_id,
-                self.model.chain_id == chain_id,
+            select(
+                BalanceHistory.snapshot_date,
+                BalanceHistory.snapshot_type,
+                BalanceHistory.token_id,
+                BalanceHistory.chain_id,
+                BalanceHistory.amount_decimal,
+                BalanceHistory.price_usd,
+                BalanceHistory.triggered_by,
             )
-            .order_by(self.model.snapshot_date.asc())
+            .where(BalanceHistory.wallet_id == wallet_id)
+            .order_by(BalanceHistory.snapshot_date.asc())
+            .execution_options(yield_per=HISTORY_BATCH_SIZE)
         )
-
         if start_date:
-            stmt = stmt.where(self.model.snapshot_date >= start_date)
-
+            stmt = stmt.where(BalanceHistory.snapshot_date >= start_date)
         if end_date:
-            stmt = stmt.where(self.model.snapshot_date <= end_date)
-
+            stmt = stmt.where(BalanceHistory.snapshot_date <= end_date)
         if snapshot_type:
-            stmt = stmt.where(self.model.snapshot_type == snapshot_type.value)
+            stmt = stmt.where(BalanceHistory.snapshot_type == snapshot_type.value)
+
+        result = await self.db.stream(stmt)
+        async for row in result:
+            yield row
+
+    async def delete_expired_snapshots(self, hourly_cutoff: datetime, history_cutoff: datetime) -> tuple[int, int]:
+        """
+        Bulk deletes scheduled snapshots past their retention period.
+        Transaction snapshots are never expired: they are the only record of balances between schedules.
+
+        Args:
+            hourly_cutoff: Hourly snapshots older than this are deleted
+            history_cutoff: Daily, weekly and monthly snapshots older than this are deleted
+
+        Returns:
+            Number of hourly and of daily/weekly/monthly snapshots deleted
+        """
+        result = await self.db.execute(
+            delete(self.model).where(
+                self.model.snapshot_type == SnapshotType.HOURLY.value, self.model.snapshot_date < hourly_cutoff
+            )
+        )
+        hourly_deleted = getattr(result, "rowcount", 0) or 0
 
-        result = await self.db.execute(stmt)
-        return result.scalars().all()
+        result = await self.db.execute(
+            delete(self.model).where(
+                self.model.snapshot_type.in_(
+                    [SnapshotType.DAILY.value, SnapshotType.WEEKLY.value, SnapshotType.MONTHLY.value]
+                ),
+                self.model.snapshot_date < history_cutoff,
+            )
+        )
+        history_deleted = getattr(result, "rowcount", 0) or 0
+        return hourly_deleted, history_deleted
 
     async def get_portfolio_history_aggregated(
         self,
@@ -68,6 +203,7 @@ class BalanceHistoryManager(BaseCRUDManager[BalanceHistory]):
         start_date: datetime | None = None,
         end_date: datetime | None = None,
         snapshot_type: SnapshotType = SnapshotType.DAILY,
+        bucket: timedelta | None = None,
     ) -> list["PortfolioHistoryPoint"]:
         """
         Gets aggregated portfolio value over time.
@@ -78,49 +214,74 @@ class BalanceHistoryManager(BaseCRUDManager[BalanceHistory]):
             start_date: Start date filter
             end_date: End date filter
             snapshot_type: Snapshot aggregation level (default: DAILY)
+            bucket: Downsample to one point per TimescaleDB time_bucket of this width, from the last
+                snapshot of each position in the bucket (default: one point per snapshot date)
 
         Returns:
             List of PortfolioHistoryPoint objects with aggregated data
         """
+        filters = [self.model.wallet_id == wallet_id, self.model.snapshot_type == snapshot_type.value]
+        if start_date:
+            filters.append(self.model.snapshot_date >= start_date)
+        if end_date:
+            filters.append(self.model.snapshot_date <= end_date)
+
+        position_columns = (
+            self.model.amount_decimal,
+            self.model.price_usd,
+            self.model.avg_buy_price_usd,
+            self.model.avg_sell_price_usd,
+            self.model.total_bought_decimal,
+            self.model.total_sold_decimal,
+        )
+        if bucket is None:
+            source = select(self.model.snapshot_date, *position_columns).where(*filters).subquery()
+        else:
+            bucket_date = func.time_bucket(bucket, self.model.snapshot_date)
+            # Several snapshot runs can fall in one bucket: keep each position's last one so none is summed twice
+            source = (
+                select(bucket_date.label("snapshot_date"), *position_columns)
+                .where(*filters)
+                .distinct(bucket_date, self.model.token_id, self.model.chain_id)
+                .order_by(bucket_date, self.model.token_id, self.model.chain_id, self.model.snapshot_date.desc())
+                .subquery()
+            )
+        columns = source.c
 
         stmt = (
             select(
-                self.model.snapshot_date,
-                func.sum(self.model.amount_decimal).label("amount_decimal"),
-                func.sum(self.model.price_usd).label("price_usd"),
+                columns.snapshot_date,
+                func.sum(columns.amount_decimal).label("amount_decimal"),
+                # Value-weighted, so amount_decimal * price_usd is the sum of each position's value
+                (
+                    func.sum(columns.amount_decimal * columns.price_usd)
+                    / func.nullif(func.sum(columns.amount_decimal), 0)
+                ).label("price_usd"),
                 (
-                    func.sum(self.model.avg_buy_price_usd * self.model.total_bought_decimal)
-                    / func.nullif(func.sum(self.model.total_bought_decimal), 0)
+                    func.sum(columns.avg_buy_price_usd * columns.total_bought_decimal)
+                    / func.nullif(func.sum(columns.total_bought_decimal), 0)
                 ).label("avg_buy_price_usd"),
                 (
-                    func.sum(self.model.avg_sell_price_usd * self.model.total_sold_decimal)
-                    / func.nullif(func.sum(self.model.total_sold_decimal), 0)
+                    func.sum(columns.avg_sell_price_usd * columns.total_sold_decimal)
+                    / func.nullif(func.sum(columns.total_sold_decimal), 0)
                 ).label("avg_sell_price_usd"),
-                func.sum(self.model.total_bought_decimal).label("total_bought_decimal"),
-                func.sum(self.model.total_sold_decimal).label("total_sold_decimal"),
+                func.sum(columns.total_bought_decimal).label("total_bought_decimal"),
+                func.sum(columns.total_sold_decimal).label("total_sold_decimal"),
             )
-            .filter(
-                self.model.wallet_id == wallet_id,
-                self.model.snapshot_type == snapshot_type.value,
-            )
-            .group_by(self.model.snapshot_date)
-            .order_by(self.model.snapshot_date.asc())
+            .group_by(columns.snapshot_date)
+            .order_by(columns.snapshot_date.asc())
         )
 
-        if start_date:
-            stmt = stmt.filter(self.model.snapshot_date >= start_date)
-
-        if end_date:
-            stmt = stmt.filter(self.model.snapshot_date <= end_date)
-
-        results = await self.db.execute(stmt)
-
-        calculator = BalanceCalculator(self.db, self.settings)
+        # One point per snapshot date over an unbounded range: stream, and turn each batch into points as it
+        # arrives, so only the points are kept
+        results = await self.db.stream(stmt.execution_options(yield_per=HISTORY_BATCH_SIZE))
 
-        return [
-            PortfolioHistoryPoint(
-                snapshot_date=result.snapshot_date,
-                **(await calculator.calculate_from_balance(result._asdict())).model_dump(),
+        calculator = self._calculator
+        points = []
+        async for rows in results.partitions():
+            totals = await calculator.calculate_from_balance_many([row._asdict() for row in rows])
+            points.extend(
+                PortfolioHistoryPoint(snapshot_date=row.snapshot_date, **row_totals.model_dump())
+                for row, row_totals in zip(rows, totals, strict=True)
             )
-            for result in results
-        ]
+        return points
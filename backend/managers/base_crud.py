@@ -1,18 +1,21 @@
 import contextlib
 import uuid
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from typing import Annotated, Generic, TypeVar
+from collections import Counter
+from collections.abc import AsyncIterator, Sequence
+from functools import lru_cache
+from typing import Annotated, Generic, Self, TypeVar
 
 import sqlalchemy.exc
 from fastapi import Depends
 from loguru import logger
-from sqlalchemy import Select, select
+from sqlalchemy import Select, event, inspect, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
 from backend import schemas
-from backend.databases import get_async_db_session
+from backend.databases import get_async_db_session, get_async_read_session
 from backend.databases.models import Base, User
 from backend.errors import BadRequestException, DatabaseError
 from backend.settings import Settings, get_settings
@@ -21,6 +24,16 @@ from backend.validators import get_uuid, get_uuid_or_rise
 T = TypeVar("T", bound=Base)
 
 
+@event.listens_for(Session, "after_soft_rollback")
+def forget_session_lookups(session: Session, previous_transaction) -> None:
+    """
+    A rollback expires the objects the managers remembered in `session.info`; handing them out again
+    would lazy load their attributes on next access, which async sessions can't do
+    """
+    session.info.pop("objects_by_id", None)
+    session.info.pop("users_by_name_or_uuid", None)
+
+
 class BaseCRUDManager(ABC, Generic[T]):
     """
     Base CRUD Manager with support for eager loading relationships.
@@ -30,6 +43,12 @@ class BaseCRUDManager(ABC, Generic[T]):
 
     # Override in subclasses to specify relationships to eager load
     eager_load: list[str] | None = None
+    # `eager_load` as the hashable key of `_loader_options`, frozen when the subclass is defined
+    _eager_load_paths: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._eager_load_paths = tuple(cls.eager_load or ())
 
     def __init__(
         self,
@@ -42,13 +61,29 @@ class BaseCRUDManager(ABC, Generic[T]):
         if not self.model:
             raise NotImplementedError("Subclasses must define a model.")
 
+    @classmethod
+    def reader(
+        cls,
+        db: Annotated[AsyncSession, Depends(get_async_read_session)],
+        settings: Annotated[Settings, Depends(get_settings)],
+    ) -> Self:
+        """
+        Dependency for GET endpoints: the manager on a read session.
+        Use `Depends(Manager.reader)`; endpoints that write keep `Depends(Manager)`.
+        """
+        return cls(db, settings)
+
     @property
     @abstractmethod
     def _model_class(self) -> type[T]:
         pass
 
     def _apply_eager_loading(
-        self, stmt: Select, include_deleted: bool = False, eager_load: list[str] | None = None
+        self,
+        stmt: Select,
+        include_deleted: bool = False,
+        eager_load: list[str] | None = None,
+        single_row: bool = False,
     ) -> Select:
         """
         Apply eager loading options to a SQLAlchemy statement.
@@ -57,47 +92,100 @@ class BaseCRUDManager(ABC, Generic[T]):
         - 'relationship' for single-level
         - 'relationship.nested' for multi-level
 
+        Collections are loaded with one extra SELECT ... IN per level (selectinload); many-to-one
+        hops (e.g. `addresses.chain`) are LEFT JOINed into that query instead (joinedload).
+        For a single-row fetch the collections of the first path that has any are JOINed as well,
+        saving their round trips; the others stay separate so two collections never multiply rows.
+        Paths sharing a leading relationship (`wallets`, `wallets.addresses`) are never JOINed that way.
+        Results of single-row statements must be `.unique()`d. With `settings.debug` any other
+        relationship raises instead of lazy loading.
+
         Args:
             stmt: the original SQLAlchemy statement to apply eager loading to
             include_deleted: Whether to include soft-deleted records in relationships
             eager_load: Override default eager loading with custom relationships
+            single_row: The statement fetches one object (get/get_one)
         Returns:
             stmt: the SQLAlchemy statement with eager loading
         """
-        if eager_load := eager_load or self.eager_load:
-            for relationship_path in eager_load:
-                # Split by dot to support nested relationships
-                parts = relationship_path.split(".")
-
-                # Start with the base model
-                current_model = self.model
-                if not hasattr(current_model, parts[0]):
-                    logger.warning(f"Relationship '{parts[0]}' not found on model {current_model.__name__}")
-                    continue
-
-                # Build the chain of selectinload
-                rel_attr = getattr(current_model, parts[0])
-                related_model = rel_attr.property.mapper.class_
-                loader = selectinload(rel_attr)
-
-                current_model = related_model
-
-                # Chain additional levels
-                for part in parts[1:]:
-                    if not hasattr(current_model, part):
-                        logger.warning(f"Relationship '{part}' not found on model {current_model.__name__}")
-                        break
+        if paths := (tuple(eager_load) if eager_load else self._eager_load_paths):
+            stmt = stmt.options(*self._loader_options(self.model, paths, single_row))
+        if self.settings.debug:
+            # Any other relationship that would need SQL on access raises, so missing eager loads show up in dev
+            stmt = stmt.options(*self._raiseload_options(self.model, paths))
+        return stmt
 
-                    rel_attr = getattr(current_model, part)
-                    related_model = rel_attr.property.mapper.class_
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _raiseload_options(model: type[Base], relationship_paths: tuple[str, ...]) -> tuple[ExecutableOption, ...]:
+        """
+        `raiseload` for each relationship of `model` that lazy loads and isn't eager loaded by `relationship_paths`.
+        Unlike a `raiseload("*")` wildcard, this keeps the mapper-level eager loaders (`lazy="joined"`, ...).
+        """
+        eager_loaded = {path.split(".")[0] for path in relationship_paths}
+        return tuple(
+            raiseload(getattr(model, relationship.key), sql_only=True)
+            for relationship in inspect(model).relationships
+            if relationship.key not in eager_loaded and relationship.lazy in ("select", True)
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _loader_options(
+        model: type[Base], relationship_paths: tuple[str, ...], single_row: bool = False
+    ) -> tuple[ExecutableOption, ...]:
+        """
+        Loader options for `relationship_paths` of `model`, built once per distinct combination.
+        Options are immutable, so the same ones are shared by every statement.
+        """
+        loaders = []
+        can_join_collection = single_row
+        # A loader set on a shared prefix must be the same in every path, so only a path whose leading
+        # relationship no other path uses may switch its collections to joinedload
+        leading_counts = Counter(path.split(".")[0] for path in relationship_paths)
+        for relationship_path in relationship_paths:
+            # Split by dot to support nested relationships
+            parts = relationship_path.split(".")
+
+            # Start with the base model
+            current_model = model
+            if not hasattr(current_model, parts[0]):
+                logger.warning(f"Relationship '{parts[0]}' not found on model {current_model.__name__}")
+                continue
+
+            join_collections = can_join_collection and leading_counts[parts[0]] == 1
+            has_collection = False
+
+            # Build the chain of loaders
+            rel_attr = getattr(current_model, parts[0])
+            related_model = rel_attr.property.mapper.class_
+            has_collection |= rel_attr.property.uselist
+            loader = (selectinload if rel_attr.property.uselist and not join_collections else joinedload)(rel_attr)
+
+            current_model = related_model
+
+            # Chain additional levels
+            for part in parts[1:]:
+                if not hasattr(current_model, part):
+                    logger.warning(f"Relationship '{part}' not found on model {current_model.__name__}")
+                    break
+
+                rel_attr = getattr(current_model, part)
+                related_model = rel_attr.property.mapper.class_
+                has_collection |= rel_attr.property.uselist
 
-                    # Chain the nested loader
+                # Chain the nested loader
+                if rel_attr.property.uselist and not join_collections:
                     loader = loader.selectinload(rel_attr)
+                else:
+                    loader = loader.joinedload(rel_attr)
 
-                    current_model = related_model
+                current_model = related_model
 
-                stmt = stmt.options(loader)
-        return stmt
+            if has_collection and join_collections:
+                can_join_collection = False
+            loaders.append(loader)
+        return tuple(loaders)
 
     def _get_by_kwargs(self, include_deleted: bool = False, **kwargs) -> Select:
         """
@@ -113,6 +201,11 @@ class BaseCRUDManager(ABC, Generic[T]):
             stmt = stmt.filter(self.model.is_deleted.is_(False))
         return stmt
 
+    async def _exists_by(self, **kwargs) -> bool:
+        """True if a non-deleted object matches `kwargs`, without loading it"""
+        query = select(literal(True)).select_from(self.model).filter_by(is_deleted=False, **kwargs).limit(1)
+        return bool(await self.db.scalar(query))
+
     async def _error_if_exists(self, obj_id: str | int) -> None:
         """
         Rises DatabaseError if object exists or BadRequestException if obj_id is not int or UUID
@@ -123,25 +216,31 @@ class BaseCRUDManager(ABC, Generic[T]):
         Returns:
             None if object does not exists
         """
-        try:
-            if isinstance(obj_id, int):
-                await self.model.get_by_id(self.db, obj_id)
-            elif obj_uuid := get_uuid(obj_id):
-                await self.model.get_by_uuid(self.db, obj_uuid)
-            else:
-                raise BadRequestException()
+        if isinstance(obj_id, int):
+            exists = await self._exists_by(id=obj_id)
+        elif obj_uuid := get_uuid(obj_id):
+            exists = await self._exists_by(uuid=obj_uuid)
+        else:
+            raise BadRequestException()
+        if exists:
             raise DatabaseError(status_code=400, exception_message="Object already exists")
-        except DatabaseError as e:
-            if e.status_code == 404:
-                return
-            raise
 
     async def get_user_by_name_or_uuid(self, username_or_uuid: str, include_deleted: bool = False) -> User:
-        """Get User object without eager loading"""
+        """
+        Get User object without eager loading.
+
+        Remembered in `session.info` for the session's lifetime (one request), so managers
+        creating many objects for the same user look it up once.
+        """
+        users = self.db.info.setdefault("users_by_name_or_uuid", {})
+        if (user := users.get((username_or_uuid, include_deleted))) is not None:
+            return user
         try:
-            return await User.get_one(self.db, include_deleted, uuid=get_uuid_or_rise(username_or_uuid))
+            user = await User.get_one(self.db, include_deleted, uuid=get_uuid_or_rise(username_or_uuid))
         except ValueError:
-            return await User.get_one(self.db, include_deleted, username=username_or_uuid)
+            user = await User.get_one(self.db, include_deleted, username=username_or_uuid)
+        users[(username_or_uuid, include_deleted)] = user
+        return user
 
     async def get_all_by_user(
         self,
@@ -162,19 +261,33 @@ class BaseCRUDManager(ABC, Generic[T]):
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def iter_all(
+        self, include_deleted: bool = False, eager_load: list[str] | None = None, batch_size: int = 1000, **kwargs
+    ) -> AsyncIterator[T]:
+        """
+        Same objects as `get_all()`, streamed from a server-side cursor `batch_size` rows at a time.
+        Collections are selectin-loaded per batch; the session must stay open until iteration ends.
+        """
+        stmt = self._get_by_kwargs(include_deleted, **kwargs)
+        stmt = self._apply_eager_loading(stmt, include_deleted, eager_load)
+        result = await self.db.stream_scalars(stmt.execution_options(yield_per=batch_size))
+        async for obj in result:
+            yield obj
+
     async def get_one(self, include_deleted: bool = False, eager_load: list[str] | bool | None = None, **kwargs) -> T:
         try:
             stmt = self._get_by_kwargs(include_deleted, **kwargs)
             if eager_load in (None, True):
                 eager_load = []
             if isinstance(eager_load, list):
-                stmt = self._apply_eager_loading(stmt, include_deleted, eager_load)
+                stmt = self._apply_eager_loading(stmt, include_deleted, eager_load, single_row=True)
             result = await self.db.execute(stmt)
-            return result.scalar_one()
+            obj = result.unique().scalar_one()
         except sqlalchemy.exc.NoResultFound:
             raise DatabaseError(404, "Object not found") from None
         except ValueError as e:
             raise BadRequestException() from e
+        return obj
 
     async def get(
         self, obj_id: int | uuid.UUID | str, include_deleted: bool = False, eager_load: list[str] | None = None
@@ -187,13 +300,33 @@ class BaseCRUDManager(ABC, Generic[T]):
             include_deleted: Whether to include soft-deleted records
             eager_load: Override default eager loading with custom relationships
         """
-        obj_uuid = get_uuid(obj_id)
-        try:
-            fiter_by = {"uuid": obj_uuid} if obj_uuid else {"id": int(obj_id)}
-        except ValueError as e:
-            raise BadRequestException() from e
+        if isinstance(obj_id, int):
+            filter_by = {"id": obj_id}
+        elif isinstance(obj_id, uuid.UUID):
+            filter_by = {"uuid": obj_id}
+        elif obj_uuid := get_uuid(obj_id):
+            filter_by = {"uuid": obj_uuid}
         else:
-            return await self.get_one(include_deleted, eager_load, **fiter_by)
+            try:
+                filter_by = {"id": int(obj_id)}
+            except ValueError as e:
+                raise BadRequestException() from e
+        if eager_load is not None:
+            return await self.get_one(include_deleted, eager_load, **filter_by)
+
+        # With the default loading, repeat lookups within the session reuse the first result
+        key = (self.model, *filter_by.values(), include_deleted)
+        objects = self.db.info.setdefault("objects_by_id", {})
+        if (obj := objects.get(key)) is None:
+            obj = objects[key] = await self.get_one(include_deleted, eager_load, **filter_by)
+        return obj
+
+    def _forget(self, obj: T) -> None:
+        """Drop `obj` from the session's `get()` cache"""
+        if objects := self.db.info.get("objects_by_id"):
+            for include_deleted in (False, True):
+                objects.pop((self.model, obj.id, include_deleted), None)
+                objects.pop((self.model, obj.uuid, include_deleted), None)
 
     async def create(self, create_dict: dict, by_user_id: int | None = None) -> T:
         with contextlib.suppress(KeyError):
@@ -202,10 +335,11 @@ class BaseCRUDManager(ABC, Generic[T]):
         logger.debug(f"CREATE DICT: {create_dict}")
         created_obj = await new_obj.create(self.db, create_dict, by_user_id)
 
-        # Refresh with eager loading
-        # FIXME: eager refresh is not working with nested relationships
-        # if self.eager_load:
-        #     await self.db.refresh(created_obj, self.eager_load)
+        # Server defaults already came back with the INSERT (eager_defaults), so only relationships
+        # need another query. refresh() can't follow nested paths: the eager select loads them into
+        # the same identity instead.
+        if not self.eager_load:
+            return created_obj
         return await self.get_one(id=created_obj.id)
 
     async def create_from_schema(self, obj_data: schemas.BaseModel, for_username_or_id: str | None = None) -> T:
@@ -220,6 +354,7 @@ class BaseCRUDManager(ABC, Generic[T]):
 
     async def update(self, obj_id: int | uuid.UUID | str, obj_data: schemas.BaseModel) -> T:
         obj = await self.get(obj_id)
+        self._forget(obj)
         updated_obj = await obj.update(self.db, obj_data.model_dump())
 
         # Refresh with eager loading
@@ -247,6 +382,7 @@ class BaseCRUDManager(ABC, Generic[T]):
 
     async def patch(self, obj_id: int | uuid.UUID | str, obj_data: schemas.BaseModel) -> T:
         obj = await self.get(obj_id)
+        self._forget(obj)
         patched_obj = await obj.update(self.db, obj_data.model_dump(exclude_unset=True))
 
         # Refresh with eager loading
@@ -256,6 +392,7 @@ class BaseCRUDManager(ABC, Generic[T]):
 
     async def delete(self, obj_uuid: int | uuid.UUID | str) -> None:
         obj = await self.get(obj_uuid)
+        self._forget(obj)
         await obj.delete(self.db)
 
     async def sync_sequence(self) -> None:
@@ -2,9 +2,8 @@ from datetime import UTC, datetime
 from typing import Annotated
 
 from fastapi import Depends, Request
-from fastapi.concurrency import run_in_threadpool
 from loguru import logger
-from redis import Redis
+from redis.asyncio import Redis
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -53,7 +52,7 @@ class HealthCheckManager:
         if not settings.redis_host:
             return HealthCheck(status="Disabled", message="Redis host is not set")
         try:
-            await run_in_threadpool(self.redis_client.ping)
+            await self.redis_client.ping()
             return HealthCheck(status=True, message="Redis healthcheck Ok")
         except Exception as e:
             return self._return_error("Redis healthcheck failed: ", e)
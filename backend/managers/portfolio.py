@@ -1,15 +1,18 @@
 import uuid
+from decimal import Decimal
+
+from sqlalchemy import func, select
 
 from backend.databases.models import Portfolio, Wallet
+from backend.databases.views import portfolio_totals
 from backend.errors import DatabaseError
 from backend.managers.base_crud import BaseCRUDManager
 
 
 class PortfolioManager(BaseCRUDManager[Portfolio]):
+    # Only what `schemas.Portfolio` reads; owner and cex_accounts are never serialized
     eager_load = [
-        "owner",
         "wallets.addresses.chain",
-        "cex_accounts",
     ]
 
     @property
@@ -32,6 +35,32 @@ class PortfolioManager(BaseCRUDManager[Portfolio]):
         wallet.portfolio_id = None
         await self.db.commit()
 
+    async def get_portfolio_totals(self, portfolio_uuid: str) -> dict:
+        """
+        Token value of a portfolio, read from the `portfolio_totals` materialized view.
+        Figures are as of the view's last refresh, not the current balances.
+
+        Returns:
+            Dict with total_value_usd, token_count and a chain_id -> value breakdown
+        """
+        portfolio = await Portfolio.get_by_uuid(self.db, uuid.UUID(portfolio_uuid))
+        stmt = (
+            select(
+                portfolio_totals.c.chain_id,
+                func.sum(portfolio_totals.c.total_value_usd).label("total_value_usd"),
+                func.sum(portfolio_totals.c.token_count).label("token_count"),
+            )
+            .where(portfolio_totals.c.portfolio_id == portfolio.id)
+            .group_by(portfolio_totals.c.chain_id)
+        )
+        rows = (await self.db.execute(stmt)).all()
+
+        return {
+            "total_value_usd": sum((row.total_value_usd for row in rows), Decimal(0)),
+            "token_count": sum(row.token_count for row in rows),
+            "by_chain": {row.chain_id: row.total_value_usd for row in rows},
+        }
+
     # def get_portfolio_summary(self, user_id: str) -> dict[str, Any]:
     #     """Get portfolio summary with proper decimal aggregation"""
     #     from sqlalchemy import func
@@ -1,16 +1,34 @@
 import uuid
+from collections.abc import AsyncIterator
+from functools import cached_property
 
 from loguru import logger
+from sqlalchemy import insert, select
 
 from backend import schemas
+from backend.databases.bulk import copy_out
 from backend.databases.models import CexAccount, Transaction, Wallet
-from backend.errors import BadRequestException
+from backend.databases.projections import wallet_transaction_lines, wallet_transactions_json
+from backend.errors import BadRequestException, DatabaseError
 from backend.managers import BalanceManager
 from backend.managers.base_crud import BaseCRUDManager
-from backend.schemas import SnapshotType, TransactionStatus
+from backend.schemas import TransactionStatus
 from backend.services import BalanceCalculator
 from backend.validators import get_uuid_or_rise
 
+# Left out of the insert when the client didn't send them, so the columns' own defaults apply
+DATABASE_DEFAULTED_FIELDS = frozenset({"block_timestamp", "detected_at", "timestamp"})
+
+
+def transaction_row(transaction_data: schemas.TransactionCreateOrUpdate) -> dict:
+    """
+    Column values for a new transaction, without the wallet/CEX account UUIDs (resolved to ids by the caller).
+    Schema defaults are kept: status and transaction_type are NOT NULL without a database default, so
+    `model_dump(exclude_unset=True)` would fail the insert when the client relies on them.
+    """
+    unset_defaults = DATABASE_DEFAULTED_FIELDS - transaction_data.model_fields_set
+    return transaction_data.model_dump(exclude={"wallet_uuid", "cex_account_uuid", *unset_defaults})
+
 
 class TransactionManager(BaseCRUDManager[Transaction]):
     """
@@ -32,6 +50,11 @@ class TransactionManager(BaseCRUDManager[Transaction]):
     def _model_class(self) -> type[Transaction]:
         return Transaction
 
+    @cached_property
+    def _calculator(self) -> BalanceCalculator:
+        """One calculator per manager, shared by its methods"""
+        return BalanceCalculator(self.db, self.settings)
+
     async def create_tx(
         self, transaction_data: schemas.TransactionCreateOrUpdate, process_balance: bool = True
     ) -> Transaction:
@@ -45,7 +68,7 @@ class TransactionManager(BaseCRUDManager[Transaction]):
         Returns:
             Created Transaction object
         """
-        transaction_dict = transaction_data.model_dump(exclude_unset=True)
+        transaction_dict = transaction_row(transaction_data)
         if transaction_data.wallet_uuid and not transaction_data.cex_account_uuid:
             wallet = await Wallet.get_by_uuid(self.db, transaction_data.wallet_uuid)
             transaction_dict["wallet_id"] = wallet.id
@@ -68,6 +91,26 @@ class TransactionManager(BaseCRUDManager[Transaction]):
         wallet = await Wallet.get_by_uuid(self.db, get_uuid_or_rise(wallet_uuid))
         return await self.get_all(wallet_id=wallet.id)
 
+    async def get_by_wallet_uuid_json(self, wallet_uuid: str) -> list[dict]:
+        """
+        Gets all transactions for a wallet as plain dicts built by Postgres (no ORM objects).
+
+        Returns:
+            List of transaction dicts shaped like `schemas.Transaction`
+        """
+        result = await self.db.execute(wallet_transactions_json(get_uuid_or_rise(wallet_uuid)))
+        if (row := result.one_or_none()) is None:
+            raise DatabaseError(404, "Object not found")
+        return row.rows
+
+    async def export_by_wallet_uuid(self, wallet_uuid: str) -> AsyncIterator[bytes]:
+        """
+        All transactions of a wallet as NDJSON bytes, written by Postgres with COPY and passed through as-is.
+        The wallet is resolved up front, so an unknown UUID raises before anything is streamed.
+        """
+        wallet = await Wallet.get_by_uuid(self.db, get_uuid_or_rise(wallet_uuid))
+        return copy_out(self.db, wallet_transaction_lines(wallet.id))
+
     async def update_tx(
         self,
         obj_id: int | uuid.UUID | str,
@@ -119,11 +162,12 @@ class TransactionManager(BaseCRUDManager[Transaction]):
         chain_id = transaction.chain_id
 
         # Delete transaction
+        self._forget(transaction)
         await transaction.delete(self.db)
 
         # Recalculate balance for this token (if balance still needed)
         if recalculate_balance and wallet_id and token_id and chain_id:
-            calculator = BalanceCalculator(self.db, self.settings)
+            calculator = self._calculator
             # This will delete the balance if no transactions remain
             await calculator.recalculate_balance_from_transactions(
                 wallet_id=wallet_id, token_id=token_id, chain_id=chain_id
@@ -142,7 +186,7 @@ class TransactionManager(BaseCRUDManager[Transaction]):
 
         # Recalculate balance to remove this transaction's effects
         if transaction.wallet_id and transaction.token_id and transaction.chain_id:
-            calculator = BalanceCalculator(self.db, self.settings)
+            calculator = self._calculator
             # This will handle the case where no confirmed transactions remain
             await calculator.recalculate_balance_from_transactions(
                 wallet_id=transaction.wallet_id, token_id=transaction.token_id, chain_id=transaction.chain_id
@@ -164,37 +208,50 @@ class TransactionManager(BaseCRUDManager[Transaction]):
         Returns:
             List of created Transaction objects
         """
-        created_transactions = []
+        if not transactions:
+            return []
 
-        # Group transactions by wallet and token for efficient processing
-        transactions_by_key = {}
+        wallet_ids = await self._ids_by_uuid(Wallet, {tx.wallet_uuid for tx in transactions if tx.wallet_uuid})
+        cex_account_ids = await self._ids_by_uuid(
+            CexAccount, {tx.cex_account_uuid for tx in transactions if tx.cex_account_uuid}
+        )
 
+        rows = []
         for tx_data in transactions:
-            # Create transaction
-            tx = await self.create_tx(tx_data, process_balance=False)
-            created_transactions.append(tx)
-
-            # Group for batch balance processing
-            if tx.wallet_id:
-                key = (tx.wallet_id, tx.token_id, tx.chain_id)
-                if key not in transactions_by_key:
-                    transactions_by_key[key] = []
-                transactions_by_key[key].append(tx)
-
-        # Batch process balances
+            row = transaction_row(tx_data)
+            if tx_data.wallet_uuid and not tx_data.cex_account_uuid:
+                row["wallet_id"] = wallet_ids[tx_data.wallet_uuid]
+            elif tx_data.cex_account_uuid and not tx_data.wallet_uuid:
+                row["cex_account_id"] = cex_account_ids[tx_data.cex_account_uuid]
+            else:
+                raise BadRequestException()
+            rows.append(row)
+
+        # One multi-row INSERT ... RETURNING (paged by insertmanyvalues_page_size) instead of a
+        # flush, commit and re-select per transaction
+        result = await self.db.scalars(insert(Transaction).returning(Transaction, sort_by_parameter_order=True), rows)
+        created_transactions = list(result.all())
+        await self.db.commit()
+
+        # All confirmed wallet transactions applied in one pass: one read, one upsert and one
+        # total update per wallet, whatever the batch size
         if process_balances:
-            calculator = BalanceCalculator(self.db, self.settings)
-
-            for wallet_id, token_id, chain_id in transactions_by_key:
-                # Recalculate balance from all transactions for this token
-                balance = await calculator.recalculate_balance_from_transactions(
-                    wallet_id=wallet_id, token_id=token_id, chain_id=chain_id
-                )
-
-                # Create a single snapshot after bulk import (if balance exists)
-                if balance:
-                    await calculator._create_history_snapshot(
-                        balance=balance, snapshot_type=SnapshotType.TRANSACTION, triggered_by="bulk_import"
-                    )
+            confirmed = [
+                tx for tx in created_transactions if tx.wallet_id and tx.status == TransactionStatus.CONFIRMED.value
+            ]
+            balance_manager = BalanceManager(self.db, self.settings)
+            await balance_manager.process_transactions(confirmed, create_snapshot=True)
 
         return created_transactions
+
+    async def _ids_by_uuid(self, model: type[Wallet | CexAccount], uuids: set[uuid.UUID]) -> dict[uuid.UUID, int]:
+        """Internal IDs for the given external UUIDs in one query. Rises a 404 if any of them is missing."""
+        if not uuids:
+            return {}
+        result = await self.db.execute(
+            select(model.uuid, model.id).where(model.uuid.in_(uuids), model.is_deleted.is_(False))
+        )
+        ids = dict(result.tuples().all())
+        if len(ids) != len(uuids):
+            raise DatabaseError(404, "Object not found")
+        return ids
@@ -1,19 +1,19 @@
-from sqlalchemy import or_, select
+from sqlalchemy import func, or_, select
 
 from backend import schemas
 from backend.databases.models import User
-from backend.errors import UserError
+from backend.databases.projections import user_tree_json
+from backend.errors import DatabaseError, UserError
 from backend.managers.base_crud import BaseCRUDManager
 from backend.security import hash_password, verify_password
 from backend.validators import get_uuid_or_rise
 
 
 class UserManager(BaseCRUDManager):
-    # Define relationships to eager load
+    # Relationships read by `schemas.User`, one SELECT ... IN per level. Anything else raises on access.
     eager_load = [
         "wallets.addresses.chain",
-        "portfolios.wallets",
-        "cex_accounts",
+        "portfolios.wallets.addresses.chain",
     ]
 
     @property
@@ -47,6 +47,22 @@ class UserManager(BaseCRUDManager):
         except ValueError:
             return await self.get_one(username=username_or_uuid)
 
+    async def get_user_json(self, username_or_uuid: str) -> dict:
+        """
+        Gets a user with wallets and portfolios as one JSON document built by Postgres (no ORM objects).
+
+        Returns:
+            Dict shaped like `schemas.User`
+        """
+        try:
+            criterion = User.uuid == get_uuid_or_rise(username_or_uuid)
+        except ValueError:
+            criterion = User.username == username_or_uuid
+
+        if (tree := await self.db.scalar(user_tree_json(criterion))) is None:
+            raise DatabaseError(404, "Object not found")
+        return tree
+
     async def get_user_by_email(self, email: str) -> User:
         if user := await User.get_one(self.db, email=email):
             return user
@@ -91,10 +107,8 @@ class UserManager(BaseCRUDManager):
         if not user.password_hash or not verify_password(password, user.password_hash):
             raise UserError(status_code=401, exception_message="Invalid username/email or password")
 
-        # Update last login time
-        from datetime import UTC, datetime
-
-        user.last_login = datetime.now(UTC)
+        # Update last login time (stamped by the database, save() refreshes the value)
+        user.last_login = func.now()
         await user.save(self.db)
 
         return user
@@ -114,9 +128,7 @@ class UserManager(BaseCRUDManager):
         result = await self.db.execute(stmt)
         if user := result.scalar_one_or_none():
             # Update last login time
-            from datetime import UTC, datetime
-
-            user.last_login = datetime.now(UTC)
+            user.last_login = func.now()
             # Update telegram_username if changed
             if telegram_data.username and user.telegram_username != telegram_data.username:
                 user.telegram_username = telegram_data.username
@@ -147,9 +159,7 @@ class UserManager(BaseCRUDManager):
             password_hash=None,  # Telegram users don't need password
         )
 
-        from datetime import UTC, datetime
-
-        new_user.last_login = datetime.now(UTC)
+        new_user.last_login = func.now()
         await new_user.save(self.db)
 
         return new_user, True
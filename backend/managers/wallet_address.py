@@ -1,5 +1,5 @@
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from backend.databases.models import WalletAddress
 from backend.errors import WalletError
@@ -37,16 +37,13 @@ class WalletAddressManager(BaseCRUDManager[WalletAddress]):
         # Create new address
         data = address_data.model_dump()
         data["wallet_id"] = wallet_id
-        data["address_lowercase"] = data["address"].lower()
 
         return await self.create(data)
 
     async def get_wallet_addresses(self, wallet_id: int, include_inactive: bool = False) -> list[WalletAddress]:
         """Get all addresses for a wallet."""
         stmt = (
-            select(WalletAddress)
-            .filter(WalletAddress.wallet_id == wallet_id)
-            .options(selectinload(WalletAddress.chain))
+            select(WalletAddress).filter(WalletAddress.wallet_id == wallet_id).options(joinedload(WalletAddress.chain))
         )
 
         if not include_inactive:
@@ -60,11 +57,18 @@ class WalletAddressManager(BaseCRUDManager[WalletAddress]):
         stmt = (
             select(WalletAddress)
             .filter(WalletAddress.address_lowercase == address.lower(), WalletAddress.chain_id == chain_id)
-            .options(selectinload(WalletAddress.wallet), selectinload(WalletAddress.chain))
+            .options(joinedload(WalletAddress.wallet), joinedload(WalletAddress.chain))
         )
 
         return await self.db.scalar(stmt)
 
+    async def get_wallet_id_by_address_and_chain(self, address: str, chain_id: int) -> int | None:
+        """Owning wallet ID of an address on a chain, read from the covering `uq_address_chain` index."""
+        stmt = select(WalletAddress.wallet_id).filter(
+            WalletAddress.address_lowercase == address.lower(), WalletAddress.chain_id == chain_id
+        )
+        return await self.db.scalar(stmt)
+
     async def deactivate_chain(self, wallet_id: int, chain_id: int) -> WalletAddress:
         """
         Deactivate a chain for a wallet.
@@ -1,6 +1,11 @@
+from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 
-from backend.databases.models import Wallet, WalletAddress
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from backend.databases.models import Balance, BalanceHistory, Wallet, WalletAddress
 from backend.errors import DatabaseError
 from backend.managers import BaseCRUDManager, WalletAddressManager
 from backend.schemas import WalletAddChain, WalletAddressCreate, WalletCreateMultichain
@@ -82,6 +87,41 @@ class WalletManager(BaseCRUDManager[Wallet]):
     async def get_by_address_and_chain(self, address: str, chain_id: int) -> Wallet | None:
         """Find wallet by address on specific chain."""
         address_manager = WalletAddressManager(self.db, self.settings)
-        wallet_address = await address_manager.get_by_address_and_chain(address, chain_id)
+        wallet_id = await address_manager.get_wallet_id_by_address_and_chain(address, chain_id)
 
-        return await self.get(wallet_address.wallet.id) if wallet_address else None
+        return await self.get(wallet_id) if wallet_id else None
+
+    async def get_with_balances(self, wallet_id: int) -> Wallet:
+        """Wallet with its current balances and their tokens; no other relationship is loaded."""
+        stmt = self._get_by_kwargs(id=wallet_id).options(selectinload(Wallet.balances).joinedload(Balance.token))
+        if wallet := await self.db.scalar(stmt):
+            return wallet
+        raise DatabaseError(404, "Object not found")
+
+    async def get_with_history(self, wallet_id: int, since: datetime) -> Wallet:
+        """
+        Wallet with the balance snapshots taken at or after `since` in `balances_history`.
+        The bound is part of the SELECT ... IN, so older hypertable chunks are never read.
+        """
+        stmt = (
+            self._get_by_kwargs(id=wallet_id)
+            .options(selectinload(Wallet.balances_history.and_(BalanceHistory.snapshot_date >= since)))
+            .execution_options(populate_existing=True)  # Replace a collection loaded with another bound
+        )
+        if wallet := await self.db.scalar(stmt):
+            return wallet
+        raise DatabaseError(404, "Object not found")
+
+    async def get_wallets_to_sync(self, limit: int = 100) -> Sequence[Wallet]:
+        """
+        Next wallets for the sync scheduler: sync enabled, not watch-only, never synced first,
+        then least recently synced. Served by the partial index `ix_wallets_syncable`.
+        """
+        stmt = (
+            select(Wallet)
+            .where(Wallet.sync_enabled.is_(True), Wallet.is_watched_only.is_(False), Wallet.is_deleted.is_(False))
+            .order_by(Wallet.last_sync_at.asc().nulls_first())
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
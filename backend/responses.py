@@ -0,0 +1,16 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by pydantic-core's Rust serializer instead of `json.dumps`.
+
+    Same compact UTF-8 output for the plain dicts and lists FastAPI hands to responses,
+    without adding another JSON library to the dependencies.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -3,15 +3,17 @@ Balance API Endpoints
 FastAPI router for balance operations.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from backend.managers import BalanceHistoryManager, BalanceManager
 from backend.schemas import (
+    BalanceHistoryExportRow,
     BalanceHistoryPoint,
     BalanceResponse,
     PortfolioChartResponse,
@@ -24,7 +26,7 @@ router = APIRouter(prefix="/balance")
 
 @router.get("/wallet/{wallet_uuid}", response_model=WalletBalancesResponse)
 async def get_wallet_balances(
-    balance_manager: Annotated[BalanceManager, Depends(BalanceManager)],
+    balance_manager: Annotated[BalanceManager, Depends(BalanceManager.reader)],
     wallet_uuid: str,
     include_zero: bool = Query(False, description="Include zero balances"),
 ):
@@ -34,11 +36,10 @@ async def get_wallet_balances(
     - **wallet_uuid**: Wallet UUID
     - **include_zero**: Include tokens with zero balance
     """
-    balances = await balance_manager.get_wallet_balances(wallet_uuid=UUID(wallet_uuid), include_zero=include_zero)
+    wallet_id, balances = await balance_manager.get_wallet_balances_json(UUID(wallet_uuid), include_zero=include_zero)
 
     # Get wallet totals
     if balances:
-        wallet_id = balances[0].wallet_id
         totals = await balance_manager.get_wallet_total_value(wallet_id)
     else:
         zero_value_decimal = Decimal(0)
@@ -49,7 +50,7 @@ async def get_wallet_balances(
         }
 
     return WalletBalancesResponse(
-        wallet_id=balances[0].wallet_id if balances else 0,
+        wallet_id=wallet_id,
         balances=[BalanceResponse.model_validate(b) for b in balances],
         **totals,
     )
@@ -57,13 +58,14 @@ async def get_wallet_balances(
 
 @router.get("/history/token/{wallet_id}/{token_id}/{chain_id}", response_model=list[BalanceHistoryPoint])
 async def get_token_balance_history(
-    history_manager: Annotated[BalanceHistoryManager, Depends(BalanceHistoryManager)],
+    history_manager: Annotated[BalanceHistoryManager, Depends(BalanceHistoryManager.reader)],
     wallet_id: int,
     token_id: int,
     chain_id: int,
     start_date: datetime | None = Query(None, description="Start date filter"),
     end_date: datetime | None = Query(None, description="End date filter"),
     snapshot_type: SnapshotType | None = Query(None, description="Snapshot type filter"),
+    include_current: bool = Query(False, description="End the series with the live balance"),
 ):
     """
     Get balance history for a specific token.
@@ -75,8 +77,12 @@ async def get_token_balance_history(
     - **start_date**: Optional start date
     - **end_date**: Optional end date
     - **snapshot_type**: Filter by type (transaction, hourly, daily, weekly, monthly)
+    - **include_current**: Append the live balance as a final `current` point
     """
-    history = await history_manager.get_balance_history(
+    get_history = (
+        history_manager.get_balance_history_with_current if include_current else history_manager.get_balance_history
+    )
+    history = get_history(
         wallet_id=wallet_id,
         token_id=token_id,
         chain_id=chain_id,
@@ -85,16 +91,48 @@ async def get_token_balance_history(
         snapshot_type=snapshot_type,
     )
 
-    return [BalanceHistoryPoint.model_validate(h) for h in history]
+    # Points are built as rows arrive, so the raw rows are never all held at once
+    return [BalanceHistoryPoint.model_validate(h) async for h in history]
+
+
+@router.get("/history/export/{wallet_id}", response_class=StreamingResponse)
+async def export_balance_history(
+    wallet_id: int,
+    history_manager: Annotated[BalanceHistoryManager, Depends(BalanceHistoryManager.reader)],
+    start_date: datetime | None = Query(None, description="Start date filter"),
+    end_date: datetime | None = Query(None, description="End date filter"),
+    snapshot_type: SnapshotType | None = Query(None, description="Snapshot type filter"),
+):
+    """
+    Export the full balance history of a wallet as NDJSON, one snapshot per line.
+    Streamed from the database, so long ranges don't have to fit in memory.
+
+    - **wallet_id**: Wallet ID
+    - **start_date**: Optional start date
+    - **end_date**: Optional end date
+    - **snapshot_type**: Filter by type (transaction, hourly, daily, weekly, monthly)
+    """
+    rows = history_manager.stream_balance_history(
+        wallet_id=wallet_id, start_date=start_date, end_date=end_date, snapshot_type=snapshot_type
+    )
+
+    async def ndjson():
+        async for row in rows:
+            yield BalanceHistoryExportRow.model_validate(row).model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
 
 
 @router.get("/history/portfolio/{wallet_id}", response_model=PortfolioChartResponse)
 async def get_portfolio_history(
     wallet_id: int,
-    history_manager: Annotated[BalanceHistoryManager, Depends(BalanceHistoryManager)],
+    history_manager: Annotated[BalanceHistoryManager, Depends(BalanceHistoryManager.reader)],
     start_date: datetime | None = Query(None, description="Start date filter"),
     end_date: datetime | None = Query(None, description="End date filter"),
     snapshot_type: SnapshotType = Query(SnapshotType.DAILY, description="Snapshot type"),
+    bucket: timedelta | None = Query(
+        None, gt=timedelta(0), description="Downsample to one point per bucket (ISO 8601 duration)"
+    ),
 ):
     """
     Get aggregated portfolio value over time.
@@ -104,9 +142,10 @@ async def get_portfolio_history(
     - **start_date**: Optional start date
     - **end_date**: Optional end date
     - **snapshot_type**: Aggregation level (HOURLY, DAILY, WEEKLY, MONTHLY)
+    - **bucket**: Optional positive bucket width, e.g. `P1D` or `PT1H`; each point is the last state of the bucket
     """
     history = await history_manager.get_portfolio_history_aggregated(
-        wallet_id=wallet_id, start_date=start_date, end_date=end_date, snapshot_type=snapshot_type
+        wallet_id=wallet_id, start_date=start_date, end_date=end_date, snapshot_type=snapshot_type, bucket=bucket
     )
 
     return PortfolioChartResponse(history=history)
@@ -19,14 +19,14 @@ async def create_chain(
 
 @router.get("/chains/", response_model=list[Chain])
 async def list_chains(
-    chain_manager: Annotated[ChainManager, Depends(ChainManager)],
+    chain_manager: Annotated[ChainManager, Depends(ChainManager.reader)],
 ) -> list[Chain]:
     chains = await chain_manager.get_all()
     return [Chain.model_validate(chain) for chain in chains]
 
 
 @router.get("/chains/{chain_id}", response_model=Chain)
-async def get_chain(chain_id: int | str, chain_manager: Annotated[ChainManager, Depends(ChainManager)]) -> Chain:
+async def get_chain(chain_id: int | str, chain_manager: Annotated[ChainManager, Depends(ChainManager.reader)]) -> Chain:
     return Chain.model_validate(await chain_manager.get(chain_id))
 
 
@@ -18,7 +18,7 @@ router = APIRouter()
 @router.get("/portfolio-demo/{user_id}", response_model=dict)
 async def get_portfolio_demo(
     user_id: str,
-    wallet_manager: Annotated[WalletManager, Depends(WalletManager)],
+    wallet_manager: Annotated[WalletManager, Depends(WalletManager.reader)],
     eth_manager: Annotated[EthereumManager, Depends(EthereumManager)],
 ) -> dict:
     wallets = await wallet_manager.get_all_by_user(user_id)
@@ -61,18 +61,25 @@ async def create_portfolio(
 
 @router.get("/portfolios/{username}", response_model=PortfolioAll)
 async def list_portfolios(
-    username: str, portfolio_manager: Annotated[PortfolioManager, Depends(PortfolioManager)]
+    username: str, portfolio_manager: Annotated[PortfolioManager, Depends(PortfolioManager.reader)]
 ) -> PortfolioAll:
     return PortfolioAll.model_validate({"portfolios": await portfolio_manager.get_all_by_user(username)})
 
 
 @router.get("/portfolio/{portfolio_id}", response_model=Portfolio)
 async def get_portfolio(
-    portfolio_id: str, portfolio_manager: Annotated[PortfolioManager, Depends(PortfolioManager)]
+    portfolio_id: str, portfolio_manager: Annotated[PortfolioManager, Depends(PortfolioManager.reader)]
 ) -> Portfolio:
     return Portfolio.model_validate(await portfolio_manager.get(portfolio_id))
 
 
+@router.get("/portfolio/{portfolio_id}/totals", response_model=dict)
+async def get_portfolio_totals(
+    portfolio_id: str, portfolio_manager: Annotated[PortfolioManager, Depends(PortfolioManager.reader)]
+) -> dict:
+    return await portfolio_manager.get_portfolio_totals(portfolio_id)
+
+
 @router.put("/portfolio/{portfolio_id}", response_model=Portfolio)
 async def update_portfolio(
     portfolio_id: str,
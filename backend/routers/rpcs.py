@@ -19,13 +19,13 @@ async def create_rpc(
 
 @router.get("/rpcs/", response_model=RpcAll)
 async def list_rpcs(
-    rpc_manager: Annotated[RpcManager, Depends(RpcManager)],
+    rpc_manager: Annotated[RpcManager, Depends(RpcManager.reader)],
 ) -> RpcAll:
     return RpcAll(rpcs=await rpc_manager.get_all())
 
 
 @router.get("/rpcs/{rpc_id}", response_model=Rpc)
-async def get_rpc(rpc_id: int | str, rpc_manager: Annotated[RpcManager, Depends(RpcManager)]) -> Rpc:
+async def get_rpc(rpc_id: int | str, rpc_manager: Annotated[RpcManager, Depends(RpcManager.reader)]) -> Rpc:
     return Rpc.model_validate(await rpc_manager.get(rpc_id))
 
 
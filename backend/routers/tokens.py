@@ -19,13 +19,13 @@ async def create_token(
 
 @router.get("/tokens/", response_model=TokenAll)
 async def list_tokens(
-    token_manager: Annotated[TokenManager, Depends(TokenManager)],
+    token_manager: Annotated[TokenManager, Depends(TokenManager.reader)],
 ) -> TokenAll:
     return TokenAll.model_validate({"tokens": await token_manager.get_all()})
 
 
 @router.get("/tokens/{token_id}", response_model=Token)
-async def get_token(token_id: int | str, token_manager: Annotated[TokenManager, Depends(TokenManager)]) -> Token:
+async def get_token(token_id: int | str, token_manager: Annotated[TokenManager, Depends(TokenManager.reader)]) -> Token:
     return Token.model_validate(await token_manager.get(token_id))
 
 
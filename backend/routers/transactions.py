@@ -1,6 +1,7 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from backend.managers import TransactionManager
 from backend.schemas import Transaction, TransactionCreateOrUpdate, TransactionPatch, TransactionsAll
@@ -19,17 +20,30 @@ async def create_transaction(
 @router.get("/wallet/transactions/{wallet_uuid}", response_model=TransactionsAll, tags=["Wallets"])
 async def get_transactions_by_wallet_uuid(
     wallet_uuid: str,
-    transaction_manager: Annotated[TransactionManager, Depends(TransactionManager)],
+    transaction_manager: Annotated[TransactionManager, Depends(TransactionManager.reader)],
 ) -> TransactionsAll:
     return TransactionsAll.model_validate(
-        {"transactions": await transaction_manager.get_by_wallet_uuid(wallet_uuid=wallet_uuid)}
+        {"transactions": await transaction_manager.get_by_wallet_uuid_json(wallet_uuid=wallet_uuid)}
     )
 
 
+@router.get("/wallet/transactions/export/{wallet_uuid}", response_class=StreamingResponse, tags=["Wallets"])
+async def export_transactions_by_wallet_uuid(
+    wallet_uuid: str,
+    transaction_manager: Annotated[TransactionManager, Depends(TransactionManager.reader)],
+):
+    """
+    Export every transaction of a wallet as NDJSON, one transaction per line, oldest first.
+    Lines are produced by Postgres and streamed without building rows in the application.
+    """
+    lines = await transaction_manager.export_by_wallet_uuid(wallet_uuid)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
 @router.get("/cex/transactions/{cex_account_id}", response_model=TransactionsAll, tags=["CEX"])
 async def get_transactions_by_cex_account_id(
     cex_account_id: str,
-    transaction_manager: Annotated[TransactionManager, Depends(TransactionManager)],
+    transaction_manager: Annotated[TransactionManager, Depends(TransactionManager.reader)],
 ) -> TransactionsAll:
     return TransactionsAll.model_validate(
         {"transactions": await transaction_manager.get_all(cex_account_id=cex_account_id)}
@@ -39,7 +53,7 @@ async def get_transactions_by_cex_account_id(
 @router.get("/transaction/{transaction_id}", response_model=Transaction)
 async def get_transaction(
     transaction_id: str,
-    transaction_manager: Annotated[TransactionManager, Depends(TransactionManager)],
+    transaction_manager: Annotated[TransactionManager, Depends(TransactionManager.reader)],
 ) -> Transaction:
     return Transaction.model_validate(await transaction_manager.get(transaction_id))
 
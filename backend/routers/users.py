@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, Response
 from fastapi import status as status_code
 
 from backend import schemas
+from backend.databases.models import User
 from backend.dependencies import token_auth
 from backend.managers import UserManager
 
@@ -31,25 +32,23 @@ async def sign_up(
 
 
 @router.get("/user/{username}", response_model=schemas.User)
-async def get_user(username: str, user_manager: Annotated[UserManager, Depends(UserManager)]) -> schemas.User:
-    user_obj = await user_manager.get_user(username)
-    return schemas.User.model_validate(user_obj)
+async def get_user(username: str, user_manager: Annotated[UserManager, Depends(UserManager.reader)]) -> dict:
+    # The wallet/portfolio tree is assembled by Postgres in one query; response_model validates it once
+    return await user_manager.get_user_json(username)
 
 
 @router.put("/user/{username}", response_model=schemas.User)
 async def update_user(
     username: str, user: schemas.UserCreateOrUpdate, user_manager: Annotated[UserManager, Depends(UserManager)]
-) -> schemas.User:
-    user_obj = await user_manager.update_user(username, user)
-    return schemas.User.model_validate(user_obj)
+) -> User:
+    return await user_manager.update_user(username, user)
 
 
 @router.patch("/user/{username}", response_model=schemas.User)
 async def patch_user(
     username: str, user: schemas.UserPatch, user_manager: Annotated[UserManager, Depends(UserManager)]
-) -> schemas.User:
-    user_obj = await user_manager.patch_user(username, user)
-    return schemas.User.model_validate(user_obj)
+) -> User:
+    return await user_manager.patch_user(username, user)
 
 
 @router.delete("/user/{username}", status_code=status_code.HTTP_204_NO_CONTENT)
@@ -70,7 +69,7 @@ async def delete_user(username: str, user_manager: Annotated[UserManager, Depend
     response_model=schemas.UserMgmtAll,
 )
 async def get_all_users(
-    user_manager: Annotated[UserManager, Depends(UserManager)],
+    user_manager: Annotated[UserManager, Depends(UserManager.reader)],
 ) -> schemas.UserMgmtAll:
     users = await user_manager.get_all(include_deleted=True, eager_load=[])
     return schemas.UserMgmtAll(users=users)
@@ -68,19 +68,19 @@ async def remove_chain_from_wallet(
 @router.get("/user/wallets/{username}", response_model=WalletAll, tags=["Users"])
 async def list_wallets(
     username: str,
-    wallet_manager: Annotated[WalletManager, Depends(WalletManager)],
+    wallet_manager: Annotated[WalletManager, Depends(WalletManager.reader)],
 ) -> WalletAll:
     return WalletAll.model_validate({"wallets": await wallet_manager.get_all_by_user(username)})
 
 
 @router.get("/wallet/{wallet_id}", response_model=Wallet)
-async def get_wallet(wallet_id: str, wallet_manager: Annotated[WalletManager, Depends(WalletManager)]) -> Wallet:
+async def get_wallet(wallet_id: str, wallet_manager: Annotated[WalletManager, Depends(WalletManager.reader)]) -> Wallet:
     return Wallet.model_validate(await wallet_manager.get(wallet_id))
 
 
 @router.get("/wallet/address/{address}/chain/{chain_id}", response_model=WalletResponse)
 async def get_wallet_by_address_and_chain(
-    address: str, chain_id: int, wallet_manager: Annotated[WalletManager, Depends(WalletManager)]
+    address: str, chain_id: int, wallet_manager: Annotated[WalletManager, Depends(WalletManager.reader)]
 ) -> WalletResponse:
     """Find wallet by address on a specific chain."""
     wallet = await wallet_manager.get_by_address_and_chain(address, chain_id)
@@ -96,7 +96,7 @@ async def get_wallet_by_address_and_chain(
 
 @router.get("/wallet/address/{address}", response_model=WalletResponse)
 async def get_wallet_by_address(
-    address: str, wallet_manager: Annotated[WalletManager, Depends(WalletManager)]
+    address: str, wallet_manager: Annotated[WalletManager, Depends(WalletManager.reader)]
 ) -> WalletResponse | None:
     return WalletResponse.model_validate(await wallet_manager.get_by_address(address))
 
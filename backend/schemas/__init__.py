@@ -10,3 +10,4 @@ from .users import *  # Should be after "wallets" in order to avoid circular imp
 from .auth import *  # Should be after "users" in order to avoid circular import
 from .balance import *
 from .rpcs import *
+from .cex import *
@@ -1,6 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import StrEnum
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
@@ -16,6 +17,10 @@ class SnapshotType(StrEnum):
     MONTHLY = "monthly"  # Scheduled monthly snapshots
 
 
+# Type of the live balance point appended to history reads. Never stored, so not a `SnapshotType`
+CURRENT_SNAPSHOT_TYPE = "current"
+
+
 class BalanceBase(BaseModel):
     """Base balance schema."""
 
@@ -46,7 +51,7 @@ class BalanceHistoryPoint(BaseModel):
     """Single history point for charts."""
 
     snapshot_date: datetime
-    snapshot_type: SnapshotType
+    snapshot_type: SnapshotType | Literal["current"]
     amount_decimal: Decimal
     price_usd: Decimal
     triggered_by: str | None = None
@@ -54,6 +59,13 @@ class BalanceHistoryPoint(BaseModel):
     model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
+class BalanceHistoryExportRow(BalanceHistoryPoint):
+    """One line of the NDJSON balance history export."""
+
+    token_id: int
+    chain_id: int
+
+
 class BalanceCalculatedTotals(BaseModel):
     total_value_usd_display: str
     total_value_usd: Decimal | None = None
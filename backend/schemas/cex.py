@@ -0,0 +1,9 @@
+from enum import StrEnum
+
+
+class SubaccountType(StrEnum):
+    SPOT = "spot"
+    FUNDING = "funding"
+    EARN = "earn"
+    MARGIN = "margin"
+    FUTURES = "futures"
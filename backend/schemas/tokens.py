@@ -1,9 +1,19 @@
 from collections.abc import Sequence
 from decimal import Decimal
+from enum import StrEnum
 
 from pydantic import BaseModel, ConfigDict, model_validator
 
 
+class TokenStandard(StrEnum):
+    NATIVE = "native"
+    ERC20 = "ERC-20"
+    BEP20 = "BEP-20"
+    TRC20 = "TRC-20"
+    SPL = "SPL"
+    SIP010 = "SIP-010"
+
+
 class TokenBase(BaseModel):
     chain_id: int
     symbol: str
@@ -11,7 +21,7 @@ class TokenBase(BaseModel):
     decimals: int
     contract_address: str | None = None
     contract_address_lowercase: str | None = None
-    token_standard: str | None = None  # TODO: Use Enum for all standards
+    token_standard: TokenStandard | None = None
     is_native: bool = False
 
     coingecko_id: str | None = None
@@ -53,7 +63,7 @@ class TokenPatch(BaseModel):
     decimals: int | None = None
     contract_address: str | None = None
     contract_address_lowercase: str | None = None
-    token_standard: str | None = None
+    token_standard: TokenStandard | None = None
     is_native: bool = False
 
     coingecko_id: str | None = None
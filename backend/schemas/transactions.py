@@ -3,7 +3,7 @@ from decimal import Decimal
 from enum import StrEnum
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TransactionType(StrEnum):
@@ -38,9 +38,10 @@ class TransactionBase(BaseModel):
     fee_value: Decimal = Decimal("0.00")
     fee_currency: str = "USD"
 
-    block_timestamp: datetime | None = datetime.now(UTC)
-    detected_at: datetime | None = datetime.now(UTC)
-    timestamp: datetime = datetime.now(UTC)
+    # Evaluated per instance, not once at import; omitted on create, so Postgres fills in now()
+    block_timestamp: datetime | None = Field(default_factory=lambda: datetime.now(UTC))
+    detected_at: datetime | None = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
     model_config = ConfigDict(use_enum_values=True, from_attributes=True)
 
@@ -68,9 +69,9 @@ class TransactionPatch(BaseModel):
     fee_value: Decimal = Decimal("0.00")
     fee_currency: str = "USD"
 
-    block_timestamp: datetime | None = datetime.now(UTC)
-    detected_at: datetime | None = datetime.now(UTC)
-    timestamp: datetime = datetime.now(UTC)
+    block_timestamp: datetime | None = Field(default_factory=lambda: datetime.now(UTC))
+    detected_at: datetime | None = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
     model_config = ConfigDict(use_enum_values=True, from_attributes=True)
 
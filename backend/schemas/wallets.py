@@ -1,7 +1,7 @@
 from collections.abc import Sequence
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
+from enum import StrEnum
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, field_validator
@@ -9,7 +9,7 @@ from pydantic import BaseModel, ConfigDict, field_validator
 from backend.schemas import WalletAddressCreate, WalletAddressResponse, WalletAddressWithChain
 
 
-class WalletType(Enum):
+class WalletType(StrEnum):
     METAMASK = "metamask"
     TRONLINK = "tronlink"
     LEATHER = "leather"
@@ -1,9 +1,11 @@
+import hashlib
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from jose import JWTError, jwt
 from pydantic import BaseModel
 
+from backend.cache import TTLCache
 from backend.settings import settings
 
 
@@ -13,6 +15,16 @@ class TokenData(BaseModel):
     exp: datetime
 
 
+# Verified tokens by blake2b digest of the token
+_token_cache: TTLCache[bytes, TokenData] = TTLCache(maxsize=settings.token_cache_size, ttl=settings.token_cache_ttl)
+
+# Tokens that just failed verification, by the same digest, with the error to raise again.
+# Kept only briefly: it only absorbs bursts of retries with the same bad token.
+_rejected_token_cache: TTLCache[bytes, str] = TTLCache(
+    maxsize=settings.rejected_token_cache_size, ttl=settings.rejected_token_cache_ttl
+)
+
+
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     """
     Create a JWT access token
@@ -37,7 +49,11 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
 
 def decode_access_token(token: str) -> TokenData:
     """
-    Decode and validate JWT token
+    Decode and validate JWT token.
+
+    A token verified in the last `token_cache_ttl` seconds is served from memory without
+    checking its signature again; one rejected in the last `rejected_token_cache_ttl` seconds
+    is rejected again straight away.
 
     Args:
         token: JWT token string
@@ -48,11 +64,23 @@ def decode_access_token(token: str) -> TokenData:
     Raises:
         JWTError: If token is invalid or expired
     """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    if (token_data := _token_cache.get(key)) is not None:
+        return token_data
+    if (error_message := _rejected_token_cache.get(key)) is not None:
+        raise ValueError(error_message)
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        return TokenData(**payload)
+        token_data = TokenData(**payload)
     except JWTError as e:
-        raise ValueError("Invalid or expired token") from e
+        error_message = "Invalid or expired token"
+        _rejected_token_cache.set(key, error_message)
+        raise ValueError(error_message) from e
+
+    # Only verified tokens are cached, and never beyond their own expiry
+    _token_cache.set(key, token_data, expires_at=token_data.exp.timestamp())
+    return token_data
 
 
 def verify_token(token: str) -> dict[str, Any] | None:
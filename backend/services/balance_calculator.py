@@ -5,16 +5,33 @@ Handles balance calculations using FIFO cost basis method.
 
 from datetime import UTC, datetime
 from decimal import Decimal
+from itertools import groupby
+from operator import attrgetter
 
 from loguru import logger
-from sqlalchemy import not_, select
+from sqlalchemy import delete, func, not_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.databases.bulk import BALANCE_KEY_COLUMNS, copy_balance_history
 from backend.databases.models import Balance, BalanceHistory, Transaction
-from backend.errors import TransactionError
+from backend.errors import BadRequestException, TransactionError
 from backend.schemas import BalanceCalculatedTotals, SnapshotType, TransactionStatus, TransactionType
 from backend.settings import Settings
 
+# Balance columns produced by replaying transactions, see `recalculate_wallet()` and `process_transactions()`
+REPLAYED_BALANCE_COLUMNS = (
+    "amount",
+    "amount_decimal",
+    "avg_buy_price_usd",
+    "avg_sell_price_usd",
+    "total_bought_decimal",
+    "total_sold_decimal",
+    "previous_balance_decimal",
+    "price_usd",
+    "last_price_update",
+)
+
 
 class BalanceCalculator:
     """
@@ -70,39 +87,31 @@ class BalanceCalculator:
         return balance
 
     async def _get_or_create_balance(self, transaction: Transaction) -> Balance:
-        """Gets existing balance or creates a new one."""
-        if transaction.wallet_id:
-            # Wallet balance
-            stmt = select(Balance).where(
-                Balance.wallet_id == transaction.wallet_id,
-                Balance.token_id == transaction.token_id,
-                Balance.chain_id == transaction.chain_id,
-            )
-        else:
+        """
+        Gets existing balance or creates a new one, in a single race-free round trip.
+
+        INSERT ... ON CONFLICT (uq_wallet_token_chain) DO UPDATE with a no-op SET makes
+        RETURNING yield the stored row when it already exists.
+        """
+        if not transaction.wallet_id:
             # CEX balance - would need CexBalance model
             raise NotImplementedError("CEX balance calculation not yet implemented")
 
-        result = await self.db.execute(stmt)
-        balance = result.scalar_one_or_none()
-
-        if not balance:
-            # Create new balance record
-            balance = Balance(
-                wallet_id=transaction.wallet_id,
-                chain_id=transaction.chain_id,
-                token_id=transaction.token_id,
-                amount=Decimal(0),
-                amount_decimal=Decimal(0),
-                avg_buy_price_usd=Decimal(0),
-                price_usd=transaction.price_usd,
-                last_price_update=transaction.timestamp,
-            )
-            # self.db.add(balance)
-            # await self.db.flush()
-            logger.debug("Saving Balance")
-            await Balance.save(balance, self.db)
-
-        return balance
+        stmt = pg_insert(Balance).values(
+            wallet_id=transaction.wallet_id,
+            chain_id=transaction.chain_id,
+            token_id=transaction.token_id,
+            amount=Decimal(0),
+            amount_decimal=Decimal(0),
+            avg_buy_price_usd=Decimal(0),
+            price_usd=transaction.price_usd,
+            last_price_update=transaction.timestamp,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_wallet_token_chain", set_={"wallet_id": stmt.excluded.wallet_id}
+        ).returning(Balance)
+        result = await self.db.execute(select(Balance).from_statement(stmt).execution_options(populate_existing=True))
+        return result.scalar_one()
 
     async def _apply_transaction(self, balance: Balance, transaction: Transaction) -> Balance:
         """
@@ -128,7 +137,7 @@ class BalanceCalculator:
         # Update current price and value
         balance.price_usd = tx_price
         balance.last_price_update = transaction.timestamp
-        balance.last_updated_at = datetime.now(UTC)
+        # last_updated_at is set by its onupdate=func.now() when this change is flushed
 
         return balance
 
@@ -201,24 +210,41 @@ class BalanceCalculator:
             snapshot_type: Type of snapshot (use SnapshotType enum)
             triggered_by: Optional trigger identifier
         """
-        history = BalanceHistory(
-            wallet_id=balance.wallet_id,
-            chain_id=balance.chain_id,
-            token_id=balance.token_id,
-            amount=balance.amount,
-            amount_decimal=balance.amount_decimal,
-            price_usd=balance.price_usd,
-            avg_buy_price_usd=balance.avg_buy_price_usd,
-            last_price_update=balance.last_price_update,
-            snapshot_date=datetime.now(UTC),
-            snapshot_type=snapshot_type.value,  # Convert enum to string for DB
-            triggered_by=triggered_by,
-        )
+        history = BalanceHistory(**self.history_snapshot_row(balance, snapshot_type, triggered_by))
 
         # self.db.add(history)
         await BalanceHistory.save(history, self.db)
         return history
 
+    @staticmethod
+    def history_snapshot_row(
+        balance: Balance,
+        snapshot_type: SnapshotType,
+        triggered_by: str | None = None,
+        snapshot_date: datetime | None = None,
+    ) -> dict:
+        """
+        Column values for a balance_history row copied from `balance`.
+
+        Used directly by the bulk snapshot tasks (see `backend.databases.bulk`).
+        """
+        return {
+            "wallet_id": balance.wallet_id,
+            "chain_id": balance.chain_id,
+            "token_id": balance.token_id,
+            "amount": balance.amount,
+            "amount_decimal": balance.amount_decimal,
+            "price_usd": balance.price_usd,
+            "avg_buy_price_usd": balance.avg_buy_price_usd,
+            "avg_sell_price_usd": balance.avg_sell_price_usd,
+            "total_bought_decimal": balance.total_bought_decimal,
+            "total_sold_decimal": balance.total_sold_decimal,
+            "last_price_update": balance.last_price_update,
+            "snapshot_date": snapshot_date or datetime.now(UTC),
+            "snapshot_type": snapshot_type.value,  # Convert enum to string for DB
+            "triggered_by": triggered_by,
+        }
+
     async def recalculate_balance_from_transactions(
         self, wallet_id: int, token_id: int, chain_id: int
     ) -> Balance | None:
@@ -249,14 +275,12 @@ class BalanceCalculator:
 
         # Handle case with no transactions
         if not transactions:
-            # Check if balance exists and delete it (zero balance with no transactions)
-            stmt = select(Balance).where(
-                Balance.wallet_id == wallet_id, Balance.token_id == token_id, Balance.chain_id == chain_id
+            # Delete the balance if it exists (zero balance with no transactions), without loading it first
+            await self.db.execute(
+                delete(Balance).where(
+                    Balance.wallet_id == wallet_id, Balance.token_id == token_id, Balance.chain_id == chain_id
+                )
             )
-            result = await self.db.execute(stmt)
-            if existing_balance := result.scalar_one_or_none():
-                await self.db.delete(existing_balance)
-                await self.db.flush()
 
             return None
 
@@ -278,7 +302,156 @@ class BalanceCalculator:
 
         return balance
 
+    async def recalculate_wallet(self, wallet_id: int) -> list[Balance]:
+        """
+        Recalculates every balance of a wallet by replaying its confirmed transactions.
+
+        Same rules as `recalculate_balance_from_transactions()`, but the transactions of all
+        tokens are read in one query, ordered by `idx_tx_wallet_token_chain_time`, and the
+        results are written with a single upsert instead of a round trip per (token, chain).
+
+        Returns:
+            Balance objects for every (token, chain) pair the wallet has transactions for
+        """
+        stmt = (
+            select(Transaction)
+            .filter(
+                Transaction.wallet_id == wallet_id,
+                Transaction.status == TransactionStatus.CONFIRMED.value,
+                not_(Transaction.is_deleted),
+            )
+            .order_by(Transaction.token_id, Transaction.chain_id, Transaction.timestamp.asc())
+        )
+        transactions = (await self.db.scalars(stmt)).all()
+
+        rows = []
+        for (token_id, chain_id), pair_transactions in groupby(transactions, key=attrgetter("token_id", "chain_id")):
+            # Replayed in memory on a transient Balance, never added to the session
+            balance = self._zero_balance(wallet_id, token_id, chain_id)
+            for tx in pair_transactions:
+                await self._apply_transaction(balance, tx)
+            rows.append(self._replayed_row(balance))
+
+        return await self._upsert_replayed(rows)
+
+    async def process_transactions(
+        self, transactions: list[Transaction], create_snapshot: bool = True
+    ) -> list[Balance]:
+        """
+        Applies many new transactions to their balances at once.
+
+        Same result as calling `process_transaction()` for each of them in timestamp order, but
+        the current balances are read (and row-locked) in one query, the transactions are applied
+        in memory, and every touched balance is written back with a single upsert. Snapshots, one
+        per transaction, are written in one bulk insert.
+
+        A balance that already reflects transactions newer than some of the imported ones can't be
+        carried forward: it is replayed from all its transactions instead (the imported ones must be
+        stored already), with a single snapshot of the result.
+
+        Args:
+            transactions: Wallet transactions to apply
+            create_snapshot: Whether to create a history snapshot per transaction
+
+        Returns:
+            Updated Balance objects, one per (wallet, token, chain)
+        """
+        if any(not tx.wallet_id for tx in transactions):
+            raise BadRequestException("Only wallet transactions can be applied to balances")
+
+        by_key: dict[tuple[int, int, int], list[Transaction]] = {}
+        for tx in sorted(transactions, key=attrgetter("timestamp")):
+            by_key.setdefault((tx.wallet_id, tx.token_id, tx.chain_id), []).append(tx)
+        if not by_key:
+            return []
+
+        # Plain column rows, so nothing in the session turns dirty and autoflushes before the upsert
+        stmt = (
+            select(*(getattr(Balance, column) for column in (*BALANCE_KEY_COLUMNS, *REPLAYED_BALANCE_COLUMNS)))
+            .where(tuple_(Balance.wallet_id, Balance.token_id, Balance.chain_id).in_(list(by_key)))
+            .with_for_update()
+        )
+        stored = {(row.wallet_id, row.token_id, row.chain_id): row for row in await self.db.execute(stmt)}
+
+        rows = []
+        replayed = []
+        snapshot_rows = []
+        for key, key_transactions in by_key.items():
+            row = stored.get(key)
+            if row is not None and row.last_price_update and key_transactions[0].timestamp < row.last_price_update:
+                # Backfilled before transactions the balance already includes: apply everything in time order
+                if (balance := await self.recalculate_balance_from_transactions(*key)) is not None:
+                    replayed.append(balance)
+                    if create_snapshot:
+                        snapshot_rows.append(
+                            self.history_snapshot_row(balance, SnapshotType.TRANSACTION, "recalculation")
+                        )
+                continue
+
+            balance = self._zero_balance(*key)
+            if row is not None:
+                for column in REPLAYED_BALANCE_COLUMNS:
+                    setattr(balance, column, getattr(row, column))
+            for tx in key_transactions:
+                await self._apply_transaction(balance, tx)
+                if create_snapshot:
+                    snapshot_rows.append(
+                        self.history_snapshot_row(balance, SnapshotType.TRANSACTION, triggered_by=f"tx_{tx.uuid}")
+                    )
+            rows.append(self._replayed_row(balance))
+
+        balances = await self._upsert_replayed(rows)
+        await copy_balance_history(self.db, snapshot_rows)
+        return [*balances, *replayed]
+
+    @staticmethod
+    def _zero_balance(wallet_id: int, token_id: int, chain_id: int) -> Balance:
+        """Transient empty Balance to replay transactions on"""
+        return Balance(
+            wallet_id=wallet_id,
+            token_id=token_id,
+            chain_id=chain_id,
+            amount=Decimal(0),
+            amount_decimal=Decimal(0),
+            avg_buy_price_usd=Decimal(0),
+            avg_sell_price_usd=Decimal(0),
+            total_bought_decimal=Decimal(0),
+            total_sold_decimal=Decimal(0),
+        )
+
+    @staticmethod
+    def _replayed_row(balance: Balance) -> dict:
+        return {
+            **{column: getattr(balance, column) for column in BALANCE_KEY_COLUMNS},
+            **{column: getattr(balance, column) for column in REPLAYED_BALANCE_COLUMNS},
+        }
+
+    async def _upsert_replayed(self, rows: list[dict]) -> list[Balance]:
+        """Writes replayed balances with one INSERT ... ON CONFLICT DO UPDATE ... RETURNING"""
+        if not rows:
+            return []
+
+        stmt = pg_insert(Balance)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_wallet_token_chain",
+            set_={
+                **{column: stmt.excluded[column] for column in REPLAYED_BALANCE_COLUMNS},
+                "updated_at": func.now(),
+                "last_updated_at": func.now(),
+            },
+        ).returning(Balance, sort_by_parameter_order=True)
+        result = await self.db.scalars(stmt, rows, execution_options={"populate_existing": True})
+        return list(result.all())
+
     async def calculate_from_balance(self, balance: Balance | dict) -> BalanceCalculatedTotals:
+        return self._calculate_totals(balance)
+
+    async def calculate_from_balance_many(self, balances: list[Balance | dict]) -> list[BalanceCalculatedTotals]:
+        """Totals for many balances (or aggregate rows) in one call, with no await per row"""
+        return [self._calculate_totals(balance) for balance in balances]
+
+    def _calculate_totals(self, balance: Balance | dict) -> BalanceCalculatedTotals:
+        """Value and P&L of a balance. Pure arithmetic, no database access."""
         if isinstance(balance, Balance):
             balance_price_usd = balance.price_usd or Decimal(0)
             balance_amount_decimal = balance.amount_decimal or Decimal(0)
@@ -312,6 +485,3 @@ class BalanceCalculator:
             total_unrealized_pnl_usd=unrealized_pnl_usd.quantize(self.qtz_default),
             total_unrealized_pnl_percent=unrealized_pnl_percent.quantize(self.qtz_default),
         )
-
-    async def calculate_from_balance_many(self, balances: list[Balance | dict]) -> list[BalanceCalculatedTotals]:
-        return [await self.calculate_from_balance(balance) for balance in balances]
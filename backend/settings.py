@@ -40,6 +40,7 @@ class Settings(BaseSettings):
 
     # Application
     app_name: str = "API"
+    debug: bool = False  # Development/CI checks, e.g. fail on relationships that weren't eager loaded
     token_header_name: str = "header-name"
     token: str = "token"
 
@@ -51,6 +52,19 @@ class Settings(BaseSettings):
     postgres_password: str = "password"
     db_driver_async: str = "postgresql+asyncpg"
     db_driver_sync: str = "postgresql+psycopg"
+    postgres_query_cache_size: int = 1200  # SQLAlchemy compiled statement cache, per engine
+    postgres_statement_cache_size: int = 500  # asyncpg prepared statements, per connection
+    postgres_prepare_threshold: int = 5  # psycopg executions before a statement is prepared server-side
+    postgres_insertmanyvalues_page_size: int = 1000  # Rows per multi-VALUES INSERT in executemany batches
+    postgres_connect_timeout: int = 10  # Seconds to wait for a new connection to be established
+    # Per engine, so per worker: keep (pool_size + max_overflow) * uvicorn_workers under the server's max_connections
+    postgres_pool_size: int = 20  # Connections kept open per engine
+    postgres_max_overflow: int = 10  # Extra connections allowed under burst load
+    postgres_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
+    postgres_pool_use_lifo: bool = True  # Reuse the most recent connection so surplus ones idle out and get recycled
+    postgres_pool_pre_ping: bool = False  # SELECT 1 on every checkout; pool_recycle already retires idle connections
+    postgres_pgbouncer: bool = False  # Behind PgBouncer (transaction mode): no local pool, no prepared statements
+    postgres_jit_above_cost: int = 500000  # API connections only; server default 100000 JITs mid-size plans
 
     # Redis
     redis_host: str | None = None
@@ -58,6 +72,7 @@ class Settings(BaseSettings):
     redis_db: int = 0
     redis_username: str | None = None
     redis_password: str | None = None
+    redis_max_connections: int = 64  # Per-process pool shared by every client
 
     # Taskiq
     taskiq_redis_url: str | None = None  # If not set, will be constructed from redis settings
@@ -80,6 +95,12 @@ class Settings(BaseSettings):
     secret_key: str = "my secret key, set in env"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    token_cache_ttl: int = 60  # Seconds a verified JWT is served from memory (never past its exp)
+    token_cache_size: int = 10000  # Verified JWTs kept per process
+    rejected_token_cache_ttl: int = 2  # Seconds a token that failed verification is rejected without re-checking
+    rejected_token_cache_size: int = 10000  # Rejected JWTs kept per process
+    user_cache_ttl: int = 30  # Seconds an authenticated user is served without a query
+    user_cache_size: int = 5000  # Authenticated users kept per process
 
     # Telegram Bot Token for Mini App authentication
     telegram_bot_token: str | None = None
@@ -4,6 +4,7 @@ Background tasks for balance snapshots and transaction processing.
 This module defines Taskiq tasks for periodic operations:
 - Balance snapshot creation (hourly, daily, weekly, monthly)
 - Transaction recalculation
+- Portfolio totals view refresh
 - Price updates with snapshots
 """
 
@@ -12,12 +13,15 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from loguru import logger
-from sqlalchemy import delete, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.databases.bulk import copy_balance_history
 from backend.databases.factory_async import get_async_db_instance
 from backend.databases.models import Balance, Wallet
+from backend.databases.views import refresh_portfolio_totals
 from backend.managers.balance import BalanceManager
+from backend.managers.balance_history import BalanceHistoryManager
 from backend.schemas import SnapshotType
 from backend.services.balance_calculator import BalanceCalculator
 from backend.settings import get_settings
@@ -58,17 +62,16 @@ def _create_snapshot_task(
         try:
             db = get_async_db_instance()
             async with db.session() as session:
-                calculator = BalanceCalculator(db=session, settings=settings)
                 stmt = select(Balance).where(Balance.amount_decimal > 0)
                 result = await session.execute(stmt)
                 balances = result.scalars().all()
 
-                for b in balances:
-                    await calculator._create_history_snapshot(
-                        balance=b,
-                        snapshot_type=snapshot_type,
-                        triggered_by=triggered_by,
-                    )
+                # One COPY for the whole run instead of a commit per snapshot
+                rows = [
+                    BalanceCalculator.history_snapshot_row(b, snapshot_type, triggered_by, snapshot_date=start)
+                    for b in balances
+                ]
+                await copy_balance_history(session, rows)
                 await session.commit()
 
             duration = (datetime.now(UTC) - start).total_seconds()
@@ -236,6 +239,36 @@ async def recalculate_all_wallets(create_snapshots: bool = False) -> dict:
         return {"status": "error", "error": str(e)}
 
 
+@broker.task(
+    task_name="refresh_portfolio_totals",
+    schedule=[{"cron": "*/15 * * * *", "id": "refresh_portfolio_totals"}],
+)
+async def refresh_portfolio_totals_task() -> dict:
+    """
+    Rebuild the portfolio_totals materialized view.
+
+    Runs on a schedule only, so totals lag balance recalculations by up to 15 minutes.
+    CONCURRENTLY keeps the view readable while it is rebuilt.
+
+    Returns:
+        Dict with refresh stats
+    """
+    start_time = datetime.now(UTC)
+    try:
+        db = get_async_db_instance()
+        async with db.session() as session:
+            await refresh_portfolio_totals(session)
+            await session.commit()
+
+        duration = (datetime.now(UTC) - start_time).total_seconds()
+        logger.info(f"portfolio_totals refreshed in {duration:.2f}s")
+        return {"status": "success", "duration_seconds": duration}
+
+    except Exception as e:
+        logger.error(f"portfolio_totals refresh failed: {e}")
+        return {"status": "error", "error": str(e)}
+
+
 @broker.task(
     schedule=[{"cron": "0 3 * * *", "id": "cleanup_old_snapshots"}],
 )
@@ -258,26 +291,13 @@ async def cleanup_old_snapshots() -> dict:
         async with db.session() as session:
             session: AsyncSession
 
-            from backend.databases.models import BalanceHistory
+            hourly_cutoff = start_time - timedelta(days=settings.balance_hourly_retention_days)
+            history_cutoff = start_time - timedelta(days=settings.balance_history_retention_days)
 
-            # Cleanup hourly snapshots older than retention period using bulk delete
-            hourly_cutoff = datetime.now(UTC) - timedelta(days=settings.balance_hourly_retention_days)
-            stmt = delete(BalanceHistory).where(
-                BalanceHistory.snapshot_type == SnapshotType.HOURLY.value, BalanceHistory.snapshot_date < hourly_cutoff
+            history_manager = BalanceHistoryManager(db=session, settings=settings)
+            hourly_deleted_count, history_deleted_count = await history_manager.delete_expired_snapshots(
+                hourly_cutoff, history_cutoff
             )
-            result = await session.execute(stmt)
-            hourly_deleted_count = getattr(result, "rowcount", 0) or 0
-
-            # Cleanup daily/weekly/monthly snapshots older than retention period using bulk delete
-            history_cutoff = datetime.now(UTC) - timedelta(days=settings.balance_history_retention_days)
-            stmt = delete(BalanceHistory).where(
-                BalanceHistory.snapshot_type.in_(
-                    [SnapshotType.DAILY.value, SnapshotType.WEEKLY.value, SnapshotType.MONTHLY.value]
-                ),
-                BalanceHistory.snapshot_date < history_cutoff,
-            )
-            result = await session.execute(stmt)
-            history_deleted_count = getattr(result, "rowcount", 0) or 0
 
             # Commit deletions
             await session.commit()
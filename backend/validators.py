@@ -1,4 +1,14 @@
 import uuid
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> uuid.UUID | None:
+    """Parsed UUID or None. Cached: the same ids come back request after request"""
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        return None
 
 
 def get_uuid(value) -> uuid.UUID | None:
@@ -8,10 +18,11 @@ def get_uuid(value) -> uuid.UUID | None:
     Returns:
         UUID or None
     """
-    try:
-        return value if isinstance(value, uuid.UUID) else uuid.UUID(value)
-    except (ValueError, AttributeError, TypeError):
-        return None
+    if isinstance(value, uuid.UUID):
+        return value
+    if isinstance(value, str):
+        return _parse_uuid(value)
+    return None
 
 
 def get_uuid_or_rise(value) -> uuid.UUID:
@@ -11,13 +11,14 @@ SQLite is NOT supported due to:
 
 import asyncio
 import os
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from decimal import Decimal
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator, Generator, Iterator
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from backend.databases.models.base import Base
@@ -57,16 +58,15 @@ async def test_engine():
         try:
             await conn.execute(text("CREATE EXTENSION IF NOT EXISTS timescaledb"))
 
-            # Create hypertables for balance history tables
-            await conn.execute(
-                text("SELECT create_hypertable('balances_history', 'snapshot_date', if_not_exists => TRUE)")
-            )
-            await conn.execute(
-                text("SELECT create_hypertable('nft_balances_history', 'snapshot_date', if_not_exists => TRUE)")
-            )
-            await conn.execute(
-                text("SELECT create_hypertable('cex_balances_history', 'snapshot_date', if_not_exists => TRUE)")
-            )
+            # Create hypertables for balance history tables, partitioned by month like the migrated schema
+            for table in ("balances_history", "nft_balances_history", "cex_balances_history"):
+                await conn.execute(
+                    text(
+                        f"SELECT create_hypertable('{table}', 'snapshot_date', "
+                        "chunk_time_interval => INTERVAL '1 month', create_default_indexes => FALSE, "
+                        "if_not_exists => TRUE)"
+                    )
+                )
         except Exception as e:
             # If TimescaleDB is not available, continue without it for basic tests
             print(f"Warning: Could not enable TimescaleDB: {e}")
@@ -100,6 +100,32 @@ async def db_session(async_session: AsyncSession) -> AsyncSession:
     return async_session
 
 
+@pytest.fixture
+def query_counter(test_engine):
+    """
+    Record the SQL statements executed inside a block, to pin a query budget:
+
+        with query_counter() as queries:
+            await manager.get(wallet.uuid)
+        assert len(queries) <= 4
+    """
+
+    @contextmanager
+    def _count_queries() -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    return _count_queries
+
+
 # Factory fixtures for creating test data
 
 
@@ -128,12 +154,13 @@ def chain_factory():
 
     def _create_chain(**kwargs):
         from backend.databases.models.chain import Chain
+        from backend.schemas.chains import ChainType
 
         defaults = {
-            "chain_id": int(os.urandom(2).hex(), 16),
-            "name": f"Test Chain {os.urandom(4).hex()}",
-            "short_name": f"TC{os.urandom(2).hex()}",
-            "chain_type": "evm",
+            "chain_id": str(int(os.urandom(2).hex(), 16)),
+            "name": f"test-chain-{os.urandom(4).hex()}",
+            "name_full": f"Test Chain {os.urandom(4).hex()}",
+            "chain_type": ChainType.EVM,
             "is_testnet": True,
         }
         defaults.update(kwargs)
@@ -201,7 +228,6 @@ def wallet_address_factory():
             "wallet_id": wallet_id,
             "chain_id": chain_id,
             "address": address,
-            "address_lowercase": address.lower(),
         }
         defaults.update(kwargs)
         return WalletAddress(**defaults)
@@ -215,7 +241,7 @@ def transaction_factory():
 
     def _create_transaction(wallet_id: int, token_id: int, chain_id: int, **kwargs):
         from backend.databases.models.balance import Transaction
-        from backend.schemas.transactions import TransactionType
+        from backend.schemas.transactions import TransactionStatus, TransactionType
 
         tx_hash = kwargs.pop("transaction_hash", f"0x{os.urandom(32).hex()}")
         defaults = {
@@ -223,8 +249,8 @@ def transaction_factory():
             "token_id": token_id,
             "chain_id": chain_id,
             "transaction_type": TransactionType.BUY,
+            "status": TransactionStatus.CONFIRMED,
             "amount": Decimal("1000000000000000000"),  # 1 token with 18 decimals
-            "amount_decimal": Decimal("1.0"),
             "price_usd": Decimal("100.50"),
             "transaction_hash": tx_hash,
             "timestamp": datetime.now(UTC),
@@ -250,7 +276,7 @@ def balance_factory():
             "amount": Decimal("1000000000000000000"),  # 1 token with 18 decimals
             "amount_decimal": Decimal("1.0"),
             "avg_buy_price_usd": Decimal("100.0"),
-            "value_usd": Decimal("100.0"),
+            "price_usd": Decimal("100.0"),
         }
         defaults.update(kwargs)
         return Balance(**defaults)
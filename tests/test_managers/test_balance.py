@@ -3,18 +3,23 @@ Tests for BalanceManager.
 
 Tests balance management functionality:
 - get_wallet_balances()
+- get_wallet_balances_json()
 - get_wallet_balances_by_chain()
 - get_wallet_total_value()
+- upsert_balances()
 - process_transaction()
 - recalculate_wallet_balances()
 """
 
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.managers.balance import BalanceManager
+from backend.managers.transactions import TransactionManager
+from backend.schemas import TransactionCreateOrUpdate, TransactionType
 from backend.settings import get_settings
 
 
@@ -137,10 +142,46 @@ class TestBalanceManagerGetBalances:
 
         assert len(balances_with_zero) == 2
 
-    async def test_get_wallet_balances_by_chain(
+    async def test_get_wallet_balances_json(
         self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, token_factory, balance_factory
     ):
-        """Test get_wallet_balances_by_chain filters by chain."""
+        """Test get_wallet_balances_json returns the wallet ID and exact-precision balance dicts."""
+        settings = get_settings()
+        manager = BalanceManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        token = token_factory(chain.id)
+        await token.save(async_session)
+
+        balance = balance_factory(wallet.id, token.id, chain.id, amount_decimal=Decimal("1.123456789012345678"))
+        await balance.save(async_session)
+
+        wallet_id, balances = await manager.get_wallet_balances_json(wallet.uuid)
+
+        assert wallet_id == wallet.id
+        assert len(balances) == 1
+        assert balances[0]["token_id"] == token.id
+        assert Decimal(balances[0]["amount_decimal"]) == Decimal("1.123456789012345678")
+
+    async def test_get_wallet_balances_by_chain(
+        self,
+        async_session: AsyncSession,
+        user_factory,
+        wallet_factory,
+        chain_factory,
+        token_factory,
+        balance_factory,
+        query_counter,
+    ):
+        """Test get_wallet_balances_by_chain filters by chain and loads token and chain in the same query."""
         settings = get_settings()
         manager = BalanceManager(async_session, settings)
 
@@ -150,8 +191,8 @@ class TestBalanceManagerGetBalances:
         wallet = wallet_factory(user.id)
         await wallet.save(async_session)
 
-        chain1 = chain_factory(chain_id=1, name="Ethereum")
-        chain2 = chain_factory(chain_id=137, name="Polygon")
+        chain1 = chain_factory(chain_id="1")
+        chain2 = chain_factory(chain_id="137")
         await chain1.save(async_session)
         await chain2.save(async_session)
 
@@ -166,8 +207,10 @@ class TestBalanceManagerGetBalances:
         await balance2.save(async_session)
 
         # Get balances for chain1 only
-        chain1_balances = await manager.get_wallet_balances_by_chain(wallet.id, chain1.id)
+        with query_counter() as queries:
+            chain1_balances = await manager.get_wallet_balances_by_chain(wallet.id, chain1.id)
 
+        assert len(queries) == 1
         assert len(chain1_balances) == 1
         assert chain1_balances[0].chain_id == chain1.id
         assert chain1_balances[0].token_id == token1.id
@@ -207,11 +250,87 @@ class TestBalanceManagerTotals:
 
         assert len(totals_by_chain) == 0
 
+    async def test_wallet_total_follows_balances(
+        self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, token_factory
+    ):
+        """Test the stored and computed wallet totals are the sum of amount * price over its positive balances."""
+        settings = get_settings()
+        manager = BalanceManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        token1 = token_factory(chain.id, symbol="TKN1")
+        token2 = token_factory(chain.id, symbol="TKN2")
+        await token1.save(async_session)
+        await token2.save(async_session)
+
+        rows = [
+            {
+                "wallet_id": wallet.id,
+                "token_id": token.id,
+                "chain_id": chain.id,
+                "amount_decimal": amount,
+                "price_usd": price,
+            }
+            for token, amount, price in ((token1, Decimal("2"), Decimal("10")), (token2, Decimal("3"), Decimal("5")))
+        ]
+        await manager.upsert_balances(rows)
+
+        await async_session.refresh(wallet, ["total_value_usd"])
+        assert wallet.total_value_usd == Decimal("35")
+        assert await manager.get_wallet_total_by_chain(wallet.id) == {chain.id: Decimal("35")}
+        totals = await manager.get_wallet_total_value(wallet.id)
+        assert totals["total_value_usd"] == Decimal("35")
+
 
 @pytest.mark.asyncio
 class TestBalanceManagerProcessing:
     """Test balance processing and recalculation."""
 
+    async def test_upsert_balances(
+        self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, token_factory, balance_factory
+    ):
+        """Test upsert_balances updates existing balances and inserts new ones in one call."""
+        settings = get_settings()
+        manager = BalanceManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        token1 = token_factory(chain.id, symbol="TKN1")
+        token2 = token_factory(chain.id, symbol="TKN2")
+        await token1.save(async_session)
+        await token2.save(async_session)
+
+        existing = balance_factory(wallet.id, token1.id, chain.id, amount_decimal=Decimal("1.0"))
+        await existing.save(async_session)
+
+        rows = [
+            {"wallet_id": wallet.id, "token_id": token.id, "chain_id": chain.id, "amount_decimal": amount}
+            for token, amount in ((token1, Decimal("2.5")), (token2, Decimal("7.0")))
+        ]
+        written = await manager.upsert_balances(rows)
+        wallet_id, token1_id, token2_id = wallet.id, token1.id, token2.id
+
+        assert written == 2
+        async_session.expire_all()  # The upsert bypasses the identity map
+        balances = await manager.get_wallet_balances(wallet_id=wallet_id, include_zero=True)
+        amounts = {b.token_id: b.amount_decimal for b in balances}
+        assert amounts == {token1_id: Decimal("2.5"), token2_id: Decimal("7.0")}
+
     async def test_recalculate_wallet_balances_no_transactions(
         self, async_session: AsyncSession, user_factory, wallet_factory
     ):
@@ -229,3 +348,84 @@ class TestBalanceManagerProcessing:
         recalculated = await manager.recalculate_wallet_balances(wallet.id, create_snapshots=False)
 
         assert len(recalculated) == 0
+
+    async def test_recalculate_wallet_balances_per_token(
+        self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, token_factory
+    ):
+        """Test recalculate_wallet_balances replays every token of the wallet."""
+        settings = get_settings()
+        manager = BalanceManager(async_session, settings)
+        tx_manager = TransactionManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        token1 = token_factory(chain.id, symbol="TK1")
+        await token1.save(async_session)
+        token2 = token_factory(chain.id, symbol="TK2")
+        await token2.save(async_session)
+
+        start = datetime.now(UTC) - timedelta(hours=1)
+        moves = [
+            (token1, TransactionType.BUY, Decimal("3000")),
+            (token2, TransactionType.BUY, Decimal("5000")),
+            (token1, TransactionType.SELL, Decimal("1000")),
+        ]
+        for i, (token, tx_type, amount) in enumerate(moves):
+            tx_data = TransactionCreateOrUpdate(
+                wallet_uuid=wallet.uuid,
+                token_id=token.id,
+                chain_id=chain.id,
+                transaction_type=tx_type,
+                amount=amount,
+                price_usd=Decimal("1.0"),
+                transaction_hash=f"0xRECALC{i}",
+                timestamp=start + timedelta(minutes=i),
+            )
+            await tx_manager.create_tx(tx_data, process_balance=False)
+
+        recalculated = await manager.recalculate_wallet_balances(wallet.id, create_snapshots=False)
+
+        amounts = {balance.token_id: balance.amount for balance in recalculated}
+        assert amounts == {token1.id: Decimal("2000"), token2.id: Decimal("5000")}
+
+    async def test_update_prices_with_snapshots(
+        self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, token_factory, balance_factory
+    ):
+        """Test update_prices reprices every held balance of the token and snapshots each one."""
+        from sqlalchemy import func, select
+
+        from backend.databases.models import BalanceHistory
+
+        settings = get_settings()
+        manager = BalanceManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        token = token_factory(chain.id)
+        await token.save(async_session)
+
+        wallets = [wallet_factory(user.id), wallet_factory(user.id)]
+        for wallet in wallets:
+            await wallet.save(async_session)
+            balance = balance_factory(wallet.id, token.id, chain.id)
+            await balance.save(async_session)
+
+        updated = await manager.update_prices(token.id, Decimal("123.45"), create_snapshots=True)
+
+        assert len(updated) == 2
+        assert {balance.price_usd for balance in updated} == {Decimal("123.45")}
+        snapshots = await async_session.scalar(
+            select(func.count()).select_from(BalanceHistory).where(BalanceHistory.token_id == token.id)
+        )
+        assert snapshots == 2
@@ -0,0 +1,232 @@
+"""
+Tests for BalanceHistoryManager.
+
+Tests balance history functionality:
+- get_balance_history()
+- get_balance_history_with_current()
+- delete_expired_snapshots()
+- get_portfolio_history_aggregated()
+"""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.databases.models import BalanceHistory
+from backend.managers.balance_history import BalanceHistoryManager
+from backend.schemas import BalanceHistoryPoint, SnapshotType
+from backend.services.balance_calculator import BalanceCalculator
+from backend.settings import get_settings
+
+
+@pytest.fixture
+def position(async_session: AsyncSession, user_factory, wallet_factory, chain_factory, token_factory, balance_factory):
+    """Create a saved wallet balance to take snapshots of."""
+
+    async def _create_position(**balance_kwargs):
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        token = token_factory(chain.id)
+        await token.save(async_session)
+
+        balance = balance_factory(wallet.id, token.id, chain.id, **balance_kwargs)
+        await balance.save(async_session)
+        return balance
+
+    return _create_position
+
+
+async def add_snapshots(session: AsyncSession, balance, *snapshots: tuple[SnapshotType, datetime]) -> None:
+    """Store a snapshot of `balance` for each (snapshot_type, snapshot_date)."""
+    session.add_all(
+        BalanceHistory(**BalanceCalculator.history_snapshot_row(balance, snapshot_type, snapshot_date=snapshot_date))
+        for snapshot_type, snapshot_date in snapshots
+    )
+    await session.flush()
+
+
+@pytest.mark.asyncio
+class TestBalanceHistoryManagerGetHistory:
+    """Test per-position history reads."""
+
+    async def test_get_balance_history_ordered(self, async_session: AsyncSession, position):
+        """Test points come back oldest first whatever order they were stored in."""
+        manager = BalanceHistoryManager(async_session, get_settings())
+        balance = await position()
+
+        now = datetime.now(UTC)
+        dates = [now - timedelta(days=2), now - timedelta(days=5), now - timedelta(days=1)]
+        await add_snapshots(async_session, balance, *((SnapshotType.DAILY, date) for date in dates))
+
+        points = [
+            row.snapshot_date
+            async for row in manager.get_balance_history(balance.wallet_id, balance.token_id, balance.chain_id)
+        ]
+
+        assert points == sorted(dates)
+
+    async def test_get_balance_history_filters(self, async_session: AsyncSession, position):
+        """Test start/end dates are inclusive and the snapshot type filter applies."""
+        manager = BalanceHistoryManager(async_session, get_settings())
+        balance = await position()
+
+        now = datetime.now(UTC)
+        start, end = now - timedelta(days=4), now - timedelta(days=2)
+        await add_snapshots(
+            async_session,
+            balance,
+            (SnapshotType.DAILY, start - timedelta(seconds=1)),
+            (SnapshotType.DAILY, start),
+            (SnapshotType.HOURLY, now - timedelta(days=3)),
+            (SnapshotType.DAILY, end),
+            (SnapshotType.DAILY, end + timedelta(seconds=1)),
+        )
+        key = (balance.wallet_id, balance.token_id, balance.chain_id)
+
+        points = [row.snapshot_date async for row in manager.get_balance_history(*key, start_date=start, end_date=end)]
+        assert points == [start, now - timedelta(days=3), end]
+
+        points = [
+            row.snapshot_date
+            async for row in manager.get_balance_history(
+                *key, start_date=start, end_date=end, snapshot_type=SnapshotType.DAILY
+            )
+        ]
+        assert points == [start, end]
+
+        points = [row async for row in manager.get_balance_history(*key, start_date=now)]
+        assert points == []
+
+    async def test_get_balance_history_with_current(self, async_session: AsyncSession, position):
+        """Test the live balance is appended after the stored snapshots as a `current` point."""
+        manager = BalanceHistoryManager(async_session, get_settings())
+        balance = await position(amount_decimal=Decimal("5"), price_usd=Decimal("2"))
+
+        now = datetime.now(UTC)
+        await add_snapshots(
+            async_session,
+            balance,
+            (SnapshotType.DAILY, now - timedelta(days=1)),
+            (SnapshotType.DAILY, now - timedelta(days=3)),
+        )
+
+        points = [
+            BalanceHistoryPoint.model_validate(row, from_attributes=True)
+            async for row in manager.get_balance_history_with_current(
+                balance.wallet_id, balance.token_id, balance.chain_id
+            )
+        ]
+
+        assert [point.snapshot_type for point in points] == [
+            SnapshotType.DAILY.value,
+            SnapshotType.DAILY.value,
+            "current",
+        ]
+        assert points[0].snapshot_date < points[1].snapshot_date < points[2].snapshot_date
+        assert (points[-1].amount_decimal, points[-1].price_usd) == (Decimal("5"), Decimal("2"))
+
+    async def test_get_balance_history_with_current_without_snapshots(self, async_session: AsyncSession, position):
+        """Test a position without snapshots still returns its current point."""
+        manager = BalanceHistoryManager(async_session, get_settings())
+        balance = await position()
+
+        points = [
+            row.snapshot_type
+            async for row in manager.get_balance_history_with_current(
+                balance.wallet_id, balance.token_id, balance.chain_id
+            )
+        ]
+
+        assert points == ["current"]
+
+
+@pytest.mark.asyncio
+class TestBalanceHistoryManagerRetention:
+    """Test snapshot retention."""
+
+    async def test_delete_expired_snapshots(self, async_session: AsyncSession, position):
+        """Test expired scheduled snapshots are deleted and transaction snapshots are kept."""
+        manager = BalanceHistoryManager(async_session, get_settings())
+        balance = await position()
+
+        now = datetime.now(UTC)
+        hourly_cutoff = now - timedelta(days=7)
+        history_cutoff = now - timedelta(days=90)
+        long_ago = now - timedelta(days=365)
+        await add_snapshots(
+            async_session,
+            balance,
+            (SnapshotType.TRANSACTION, long_ago),
+            (SnapshotType.HOURLY, long_ago),
+            (SnapshotType.HOURLY, now - timedelta(days=8)),
+            (SnapshotType.HOURLY, now - timedelta(days=1)),
+            (SnapshotType.DAILY, long_ago),
+            (SnapshotType.DAILY, now - timedelta(days=8)),
+        )
+
+        deleted = await manager.delete_expired_snapshots(hourly_cutoff, history_cutoff)
+
+        assert deleted == (2, 1)
+        remaining = await async_session.execute(
+            select(BalanceHistory.snapshot_type, BalanceHistory.snapshot_date)
+            .where(BalanceHistory.wallet_id == balance.wallet_id)
+            .order_by(BalanceHistory.snapshot_date)
+        )
+        assert remaining.all() == [
+            (SnapshotType.TRANSACTION.value, long_ago),
+            (SnapshotType.DAILY.value, now - timedelta(days=8)),
+            (SnapshotType.HOURLY.value, now - timedelta(days=1)),
+        ]
+
+
+@pytest.mark.asyncio
+class TestBalanceHistoryManagerPortfolio:
+    """Test aggregated portfolio history."""
+
+    async def test_get_portfolio_history_aggregated(
+        self, async_session: AsyncSession, position, token_factory, balance_factory
+    ):
+        """Test one point per snapshot date without a bucket, and each position's last snapshot per bucket."""
+        manager = BalanceHistoryManager(async_session, get_settings())
+        first = await position(amount_decimal=Decimal("1"), price_usd=Decimal("10"))
+
+        token = token_factory(first.chain_id)
+        await token.save(async_session)
+        second = balance_factory(
+            first.wallet_id, token.id, first.chain_id, amount_decimal=Decimal("3"), price_usd=Decimal("1")
+        )
+        await second.save(async_session)
+
+        day = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=3)
+        await add_snapshots(async_session, first, (SnapshotType.DAILY, day + timedelta(hours=1)))
+        await add_snapshots(async_session, second, (SnapshotType.DAILY, day + timedelta(hours=3)))
+        first.amount_decimal = Decimal("2")
+        await add_snapshots(
+            async_session,
+            first,
+            (SnapshotType.DAILY, day + timedelta(hours=5)),
+            (SnapshotType.HOURLY, day + timedelta(hours=6)),  # Other snapshot types are left out
+        )
+
+        points = await manager.get_portfolio_history_aggregated(first.wallet_id)
+
+        assert [(p.snapshot_date, p.total_value_usd) for p in points] == [
+            (day + timedelta(hours=1), Decimal("10")),
+            (day + timedelta(hours=3), Decimal("3")),
+            (day + timedelta(hours=5), Decimal("20")),
+        ]
+
+        points = await manager.get_portfolio_history_aggregated(first.wallet_id, bucket=timedelta(days=1))
+
+        # The first position counts once, with its last snapshot of the day
+        assert [(p.snapshot_date, p.total_value_usd) for p in points] == [(day, Decimal("23"))]
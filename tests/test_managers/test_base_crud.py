@@ -16,14 +16,16 @@ Tests common CRUD operations that all managers inherit:
 """
 
 import uuid
+from decimal import Decimal
 
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.databases.models.portfolio import User
 from backend.errors import BadRequestException, DatabaseError
-from backend.managers import UserManager, WalletManager
-from backend.schemas import UserSignUp, UserCreateOrUpdate, UserPatch
+from backend.managers import TokenManager, UserManager, WalletManager
+from backend.schemas import Token, UserSignUp, UserCreateOrUpdate, UserPatch
 from backend.settings import get_settings
 from backend.security import hash_password
 
@@ -79,6 +81,37 @@ class TestBaseCRUDManager:
 
         assert found.uuid == user.uuid
 
+    async def test_get_repeated_reuses_result(self, async_session: AsyncSession, user_factory, query_counter):
+        """Test get() for the same id within a session queries once, until the object is deleted."""
+        settings = get_settings()
+        manager = UserManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        first = await manager.get(user.uuid)
+        with query_counter() as queries:
+            again = await UserManager(async_session, settings).get(str(user.uuid))
+        assert again is first
+        assert queries == []
+
+        await manager.delete(user.uuid)
+        with pytest.raises(DatabaseError) as exc_info:
+            await manager.get(user.uuid)
+        assert exc_info.value.status_code == 404
+
+    async def test_get_forgets_results_on_rollback(self, async_session: AsyncSession, user_factory):
+        """Test a rollback drops the objects get() remembered, since the rollback expired them."""
+        manager = UserManager(async_session, get_settings())
+
+        user = user_factory()
+        await user.save(async_session)
+        await manager.get(user.uuid)
+        assert async_session.info["objects_by_id"]
+
+        await async_session.rollback()
+        assert "objects_by_id" not in async_session.info
+
     async def test_get_not_found(self, async_session: AsyncSession):
         """Test get() raises error when not found."""
         settings = get_settings()
@@ -173,6 +206,20 @@ class TestBaseCRUDManager:
         assert len(users) == 1
         assert users[0].username == "specific"
 
+    async def test_iter_all(self, async_session: AsyncSession, user_factory):
+        """Test iter_all() streams the same records as get_all() across batches."""
+        settings = get_settings()
+        manager = UserManager(async_session, settings)
+
+        for i in range(3):
+            await user_factory(username=f"streamed{i}").save(async_session)
+
+        streamed = [u.username async for u in manager.iter_all(batch_size=2)]
+        all_users = await manager.get_all()
+
+        assert sorted(streamed) == sorted(u.username for u in all_users)
+        assert {"streamed0", "streamed1", "streamed2"} <= set(streamed)
+
     async def test_get_all_excludes_deleted(self, async_session: AsyncSession, user_factory):
         """Test get_all() excludes soft-deleted by default."""
         settings = get_settings()
@@ -208,6 +255,25 @@ class TestBaseCRUDManager:
         assert created.username == "newuser"
         assert created.email == "newuser@example.com"
 
+    async def test_create_existing_uuid(self, async_session: AsyncSession, user_factory):
+        """Test create() rejects a uuid that is already taken."""
+        settings = get_settings()
+        manager = UserManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        create_dict = {
+            "uuid": str(user.uuid),
+            "username": "other",
+            "email": "other@example.com",
+            "password_hash": hash_password("password123"),
+        }
+
+        with pytest.raises(DatabaseError) as exc_info:
+            await manager.create(create_dict)
+        assert exc_info.value.status_code == 400
+
     async def test_create_from_schema(self, async_session: AsyncSession):
         """Test create_from_schema() with Pydantic model."""
         settings = get_settings()
@@ -329,7 +395,7 @@ class TestBaseCRUDManagerEagerLoading:
         wallet = wallet_factory(user.id)
         await wallet.save(async_session)
 
-        # UserManager has eager_load = ["wallets.addresses.chain", "portfolios.wallets", "cex_accounts"]
+        # UserManager has eager_load = ["wallets.addresses.chain", "portfolios.wallets.addresses.chain"]
         found = await manager.get(user.uuid)
 
         # Wallets should be loaded (not trigger additional query)
@@ -350,6 +416,54 @@ class TestBaseCRUDManagerEagerLoading:
 
         assert found.uuid == user.uuid
 
+    async def test_debug_keeps_mapper_level_eager_loads(
+        self, async_session: AsyncSession, chain_factory, token_factory
+    ):
+        """Test debug raiseload leaves relationships that are eager at mapper level (Token.price) loaded."""
+        settings = get_settings().model_copy(update={"debug": True})
+        manager = TokenManager(async_session, settings)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        token = token_factory(chain.id, current_price_usd=Decimal("1.5"))
+        await token.save(async_session)
+        async_session.expunge_all()  # Load from the database, not the identity map
+
+        found = await manager.get(token.id)
+        assert Token.model_validate(found).current_price_usd == Decimal("1.5")
+        all_tokens = await manager.get_all(chain_id=chain.id)
+        assert [Token.model_validate(t).current_price_usd for t in all_tokens] == [Decimal("1.5")]
+
+        # Relationships that would lazy load still raise
+        with pytest.raises(InvalidRequestError):
+            found.chain
+
+    async def test_eager_load_paths_sharing_a_prefix(
+        self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, wallet_address_factory
+    ):
+        """Test get() accepts eager load paths that share a leading relationship."""
+        settings = get_settings()
+        manager = UserManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        address = wallet_address_factory(wallet.id, chain.id)
+        await address.save(async_session)
+
+        for eager_load in (["wallets", "wallets.addresses"], ["wallets.addresses", "wallets.portfolio"]):
+            found = await manager.get(user.uuid, eager_load=eager_load)
+
+            assert [w.id for w in found.wallets] == [wallet.id]
+            assert [a.id for a in found.wallets[0].addresses] == [address.id]
+
 
 @pytest.mark.asyncio
 class TestBaseCRUDManagerUserHelpers:
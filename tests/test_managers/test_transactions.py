@@ -4,18 +4,22 @@ Tests for TransactionManager.
 Tests transaction management functionality:
 - create_tx()
 - get_by_wallet_uuid()
+- get_by_wallet_uuid_json()
+- export_by_wallet_uuid()
 - update_tx()
 - delete_tx()
 - mark_as_cancelled()
 - bulk_create_transactions()
 """
 
+import json
 from decimal import Decimal
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.errors import BadRequestException
+from backend.managers.balance import BalanceManager
 from backend.managers.transactions import TransactionManager
 from backend.schemas import TransactionCreateOrUpdate, TransactionType
 from backend.settings import get_settings
@@ -148,6 +152,80 @@ class TestTransactionManagerCreate:
         assert "0xTX1" in tx_hashes
         assert "0xTX2" in tx_hashes
 
+    async def test_get_by_wallet_uuid_json(
+        self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, token_factory
+    ):
+        """Test transactions by wallet UUID come back as dicts with numerics as exact strings."""
+        settings = get_settings()
+        manager = TransactionManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        token = token_factory(chain.id)
+        await token.save(async_session)
+
+        tx_data = TransactionCreateOrUpdate(
+            wallet_uuid=wallet.uuid,
+            token_id=token.id,
+            chain_id=chain.id,
+            transaction_type=TransactionType.BUY,
+            amount=Decimal("3"),
+            price_usd=Decimal("100.12345678"),
+            transaction_hash="0xTXJSON",
+        )
+        await manager.create_tx(tx_data, process_balance=False)
+
+        transactions = await manager.get_by_wallet_uuid_json(str(wallet.uuid))
+
+        assert len(transactions) == 1
+        assert transactions[0]["transaction_hash"] == "0xTXJSON"
+        assert Decimal(transactions[0]["price_usd"]) == Decimal("100.12345678")
+
+    async def test_export_by_wallet_uuid(
+        self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, token_factory
+    ):
+        """Test the NDJSON export yields one JSON line per transaction, oldest first."""
+        settings = get_settings()
+        manager = TransactionManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        token = token_factory(chain.id)
+        await token.save(async_session)
+
+        for tx_hash in ("0xEXPORT1", "0xEXPORT2"):
+            tx_data = TransactionCreateOrUpdate(
+                wallet_uuid=wallet.uuid,
+                token_id=token.id,
+                chain_id=chain.id,
+                transaction_type=TransactionType.BUY,
+                amount=Decimal("1"),
+                price_usd=Decimal("1.5"),
+                transaction_hash=tx_hash,
+            )
+            await manager.create_tx(tx_data, process_balance=False)
+
+        chunks = await manager.export_by_wallet_uuid(str(wallet.uuid))
+        lines = b"".join([chunk async for chunk in chunks]).decode().splitlines()
+
+        transactions = [json.loads(line) for line in lines]
+        assert [t["transaction_hash"] for t in transactions] == ["0xEXPORT1", "0xEXPORT2"]
+        assert Decimal(transactions[0]["price_usd"]) == Decimal("1.5")
+
 
 @pytest.mark.asyncio
 class TestTransactionManagerUpdate:
@@ -333,3 +411,113 @@ class TestTransactionManagerBulk:
         assert len(created_txs) == 5
         for i, tx in enumerate(created_txs, 1):
             assert tx.transaction_hash == f"0xBULK{i}"
+
+    async def test_bulk_create_transactions_processes_balances(
+        self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, token_factory
+    ):
+        """Test bulk creation applies every transaction to the balance and the wallet total."""
+        settings = get_settings()
+        manager = TransactionManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        token = token_factory(chain.id)
+        await token.save(async_session)
+
+        from datetime import UTC, datetime, timedelta
+
+        start = datetime.now(UTC) - timedelta(hours=1)
+        moves = [(TransactionType.BUY, "4.0"), (TransactionType.BUY, "2.0"), (TransactionType.SELL, "1.0")]
+        tx_list = [
+            TransactionCreateOrUpdate(
+                wallet_uuid=wallet.uuid,
+                token_id=token.id,
+                chain_id=chain.id,
+                transaction_type=tx_type,
+                amount=Decimal(amount),
+                price_usd=Decimal("10.0"),
+                transaction_hash=f"0xBATCH{i}",
+                timestamp=start + timedelta(minutes=i),
+            )
+            for i, (tx_type, amount) in enumerate(moves)
+        ]
+
+        await manager.bulk_create_transactions(tx_list, process_balances=True)
+
+        balances = await BalanceManager(async_session, settings).get_wallet_balances(wallet_id=wallet.id)
+        assert [balance.amount for balance in balances] == [Decimal("5.0")]
+        await async_session.refresh(wallet, ["total_value_usd"])
+        assert wallet.total_value_usd == Decimal("50")
+
+    async def test_bulk_create_transactions_backfills_in_time_order(
+        self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, token_factory
+    ):
+        """Test importing transactions older than an already applied one replays the balance in time order."""
+        settings = get_settings()
+        manager = TransactionManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        token = token_factory(chain.id)
+        await token.save(async_session)
+
+        from datetime import UTC, datetime, timedelta
+
+        now = datetime.now(UTC)
+        applied = TransactionCreateOrUpdate(
+            wallet_uuid=wallet.uuid,
+            token_id=token.id,
+            chain_id=chain.id,
+            transaction_type=TransactionType.BUY,
+            amount=Decimal("1.0"),
+            price_usd=Decimal("100.0"),
+            transaction_hash="0xAPPLIED",
+            timestamp=now - timedelta(days=1),
+        )
+        await manager.create_tx(applied)
+
+        backfilled = [
+            TransactionCreateOrUpdate(
+                wallet_uuid=wallet.uuid,
+                token_id=token.id,
+                chain_id=chain.id,
+                transaction_type=tx_type,
+                amount=Decimal("1.0"),
+                price_usd=Decimal("50.0"),
+                transaction_hash=f"0xBACKFILL{i}",
+                timestamp=now - timedelta(days=days_ago),
+            )
+            for i, (tx_type, days_ago) in enumerate(((TransactionType.BUY, 10), (TransactionType.SELL, 2)))
+        ]
+        await manager.bulk_create_transactions(backfilled, process_balances=True)
+
+        balances = await BalanceManager(async_session, settings).get_wallet_balances(wallet_id=wallet.id)
+        assert [(b.amount, b.price_usd, b.last_price_update) for b in balances] == [
+            (Decimal("1.0"), Decimal("100.0"), now - timedelta(days=1))
+        ]
+        await async_session.refresh(wallet, ["total_value_usd"])
+        assert wallet.total_value_usd == Decimal("100")
+
+    async def test_bulk_create_transactions_rejects_cex_balances(self, async_session: AsyncSession):
+        """Test CEX transactions are refused before any balance is touched."""
+        from backend.databases.models import Transaction
+        from backend.services.balance_calculator import BalanceCalculator
+
+        calculator = BalanceCalculator(async_session, get_settings())
+
+        with pytest.raises(BadRequestException):
+            await calculator.process_transactions([Transaction(cex_account_id=1, token_id=1)])
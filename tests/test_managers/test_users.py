@@ -12,11 +12,12 @@ Tests user-specific functionality:
 """
 
 import pytest
+import sqlalchemy.exc
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.errors import DatabaseError, UserError
 from backend.managers.users import UserManager
-from backend.schemas import UserCreateOrUpdate, UserPatch, UserSignUp
+from backend.schemas import User, UserCreateOrUpdate, UserPatch, UserSignUp
 from backend.security import verify_password
 from backend.settings import get_settings
 
@@ -173,6 +174,51 @@ class TestUserManagerGetUser:
 
         assert exc_info.value.status_code == 404
 
+    async def test_get_user_json(
+        self,
+        async_session: AsyncSession,
+        user_factory,
+        wallet_factory,
+        chain_factory,
+        wallet_address_factory,
+        query_counter,
+    ):
+        """Test get_user_json returns the nested user tree shaped like schemas.User, wallets in id order."""
+        settings = get_settings()
+        manager = UserManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallets = [wallet_factory(user.id) for _ in range(3)]
+        for wallet in wallets:
+            await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        address = wallet_address_factory(wallets[1].id, chain.id)
+        await address.save(async_session)
+
+        with query_counter() as queries:
+            tree = await manager.get_user_json(user.username)
+        user_schema = User.model_validate(tree)
+
+        assert user_schema.uuid == user.uuid
+        assert [w.uuid for w in user_schema.wallets] == [w.uuid for w in wallets]
+        assert user_schema.wallets[1].addresses[0].chain.id == chain.id
+        assert len(queries) == 1
+
+    async def test_get_user_json_not_found(self, async_session: AsyncSession):
+        """Test get_user_json raises error when not found."""
+        settings = get_settings()
+        manager = UserManager(async_session, settings)
+
+        with pytest.raises(DatabaseError) as exc_info:
+            await manager.get_user_json("doesnotexist")
+
+        assert exc_info.value.status_code == 404
+
 
 @pytest.mark.asyncio
 class TestUserManagerUpdateUser:
@@ -291,3 +337,45 @@ class TestUserManagerEagerLoading:
         # Should have portfolios loaded
         assert hasattr(found, "portfolios")
         assert len(found.portfolios) > 0
+
+    async def test_get_user_loads_address_chains(
+        self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, wallet_address_factory
+    ):
+        """Test address chains are eager loaded with the user, so serialization never lazy loads."""
+        settings = get_settings()
+        manager = UserManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        address = wallet_address_factory(wallet.id, chain.id)
+        await address.save(async_session)
+
+        username, chain_id = user.username, chain.id
+        async_session.expunge_all()
+
+        found = await manager.get_user(username)
+        user_schema = User.model_validate(found)
+
+        assert user_schema.wallets[0].addresses[0].chain.id == chain_id
+
+    async def test_get_user_does_not_load_unserialized_relationships(self, async_session: AsyncSession, user_factory):
+        """Test relationships outside eager_load are not loaded and raise instead of lazy loading."""
+        settings = get_settings()
+        manager = UserManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+        username = user.username
+        async_session.expire_all()
+
+        found = await manager.get_user(username)
+
+        with pytest.raises(sqlalchemy.exc.InvalidRequestError):
+            _ = found.cex_accounts
@@ -7,9 +7,12 @@ Tests wallet-specific functionality:
 - remove_chain()
 - get_by_address()
 - get_by_address_and_chain()
+- get_with_balances() / get_with_history()
+- get_wallets_to_sync()
 """
 
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.errors import DatabaseError
@@ -30,8 +33,8 @@ class TestWalletManagerCreate:
         user = user_factory()
         await user.save(async_session)
 
-        chain1 = chain_factory(chain_id=1, name="Ethereum")
-        chain2 = chain_factory(chain_id=137, name="Polygon")
+        chain1 = chain_factory(chain_id="1")
+        chain2 = chain_factory(chain_id="137")
         await chain1.save(async_session)
         await chain2.save(async_session)
 
@@ -251,6 +254,31 @@ class TestWalletManagerFindByAddress:
         assert found is not None
         assert found.id == wallet.id
 
+    async def test_address_lowercase_generated(
+        self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, wallet_address_factory
+    ):
+        """Test address_lowercase is generated by the database for checksummed EVM addresses."""
+        settings = get_settings()
+        manager = WalletManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        checksummed = "0xAbC" + "d" * 37
+        address = wallet_address_factory(wallet.id, chain.id, address=checksummed)
+        await address.save(async_session)
+
+        assert address.address_lowercase == checksummed.lower()
+        found = await manager.get_by_address_and_chain(checksummed.upper().replace("0X", "0x"), chain.id)
+        assert found is not None
+        assert found.id == wallet.id
+
     async def test_get_by_address_and_chain(
         self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, wallet_address_factory
     ):
@@ -264,8 +292,8 @@ class TestWalletManagerFindByAddress:
         wallet = wallet_factory(user.id)
         await wallet.save(async_session)
 
-        chain1 = chain_factory(chain_id=1, name="Ethereum")
-        chain2 = chain_factory(chain_id=137, name="Polygon")
+        chain1 = chain_factory(chain_id="1")
+        chain2 = chain_factory(chain_id="137")
         await chain1.save(async_session)
         await chain2.save(async_session)
 
@@ -303,6 +331,125 @@ class TestWalletManagerFindByAddress:
         assert found is None
 
 
+@pytest.mark.asyncio
+class TestWalletManagerLoadHelpers:
+    """Test wallet loaders that hydrate one named relationship."""
+
+    async def test_get_with_balances(
+        self,
+        async_session: AsyncSession,
+        user_factory,
+        wallet_factory,
+        chain_factory,
+        token_factory,
+        balance_factory,
+        query_counter,
+    ):
+        """Test balances and their tokens, with prices, are loaded in two queries, other collections are not."""
+        settings = get_settings()
+        manager = WalletManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        token = token_factory(chain.id)
+        await token.save(async_session)
+
+        balance = balance_factory(wallet.id, token.id, chain.id)
+        await balance.save(async_session)
+        async_session.expunge_all()
+
+        with query_counter() as queries:
+            found = await manager.get_with_balances(wallet.id)
+
+        assert len(queries) == 2
+        assert [b.id for b in found.balances] == [balance.id]
+        assert found.balances[0].token.id == token.id
+        assert found.balances[0].token.current_price_usd is None  # token_prices is joined, not a third query
+        with pytest.raises(InvalidRequestError):
+            _ = found.transactions
+
+    async def test_get_with_history_since(
+        self, async_session: AsyncSession, user_factory, wallet_factory, chain_factory, token_factory
+    ):
+        """Test only snapshots at or after `since` are loaded."""
+        from datetime import UTC, datetime, timedelta
+
+        from backend.databases.models import BalanceHistory
+
+        settings = get_settings()
+        manager = WalletManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        wallet = wallet_factory(user.id)
+        await wallet.save(async_session)
+
+        chain = chain_factory()
+        await chain.save(async_session)
+
+        token = token_factory(chain.id)
+        await token.save(async_session)
+
+        now = datetime.now(UTC)
+        for days_ago in (0, 1, 30):
+            snapshot = BalanceHistory(
+                wallet_id=wallet.id, chain_id=chain.id, token_id=token.id, snapshot_date=now - timedelta(days=days_ago)
+            )
+            await snapshot.save(async_session)
+
+        found = await manager.get_with_history(wallet.id, since=now - timedelta(days=7))
+
+        assert len(found.balances_history) == 2
+        assert all(s.snapshot_date >= now - timedelta(days=7) for s in found.balances_history)
+
+    async def test_get_with_balances_not_found(self, async_session: AsyncSession):
+        """Test a missing wallet raises 404."""
+        settings = get_settings()
+        manager = WalletManager(async_session, settings)
+
+        with pytest.raises(DatabaseError) as exc_info:
+            await manager.get_with_balances(999999)
+
+        assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+class TestWalletManagerSyncQueue:
+    """Test picking wallets for the sync scheduler."""
+
+    async def test_get_wallets_to_sync(self, async_session: AsyncSession, user_factory, wallet_factory):
+        """Test only syncable wallets are returned, never-synced first, then oldest sync."""
+        from datetime import UTC, datetime, timedelta
+
+        settings = get_settings()
+        manager = WalletManager(async_session, settings)
+
+        user = user_factory()
+        await user.save(async_session)
+
+        now = datetime.now(UTC)
+        recent = wallet_factory(user.id, last_sync_at=now)
+        stale = wallet_factory(user.id, last_sync_at=now - timedelta(days=1))
+        never = wallet_factory(user.id, last_sync_at=None)
+        disabled = wallet_factory(user.id, sync_enabled=False)
+        watched = wallet_factory(user.id, is_watched_only=True)
+        for wallet in (recent, stale, never, disabled, watched):
+            await wallet.save(async_session)
+
+        wallets = await manager.get_wallets_to_sync()
+
+        # Other tests' wallets may be queued too
+        assert [w.id for w in wallets if w.user_id == user.id] == [never.id, stale.id, recent.id]
+
+
 @pytest.mark.asyncio
 class TestWalletManagerEagerLoading:
     """Test wallet manager eager loading."""
@@ -316,6 +463,7 @@ class TestWalletManagerEagerLoading:
         wallet_address_factory,
         transaction_factory,
         token_factory,
+        query_counter,
     ):
         """Test get() eager loads addresses, transactions, and balances."""
         settings = get_settings()
@@ -339,8 +487,11 @@ class TestWalletManagerEagerLoading:
         transaction = transaction_factory(wallet.id, token.id, chain.id)
         await transaction.save(async_session)
 
-        # Get wallet (should eager load)
-        found = await manager.get(wallet.uuid)
+        # Get wallet (should eager load): the wallet joined with its portfolio and addresses, then one
+        # SELECT ... IN for each of the other collections
+        with query_counter() as queries:
+            found = await manager.get(wallet.uuid)
+        assert len(queries) <= 3
 
         # Addresses should be loaded
         assert hasattr(found, "addresses")
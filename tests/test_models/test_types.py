@@ -0,0 +1,42 @@
+"""
+Tests for custom column types.
+
+Tests AddressBytes encoding:
+- EVM addresses packed to tagged raw bytes
+- Non-EVM addresses stored as tagged UTF-8
+- Round trip through bind/result processing
+"""
+
+from sqlalchemy.dialects import postgresql
+
+from backend.databases.types import AddressBytes
+
+
+class TestAddressBytes:
+    """Test AddressBytes bind/result processing."""
+
+    dialect = postgresql.dialect()
+
+    def test_evm_address_packed(self):
+        """Test EVM hex address is stored as 1 tag byte + 20 raw bytes."""
+        address = "0x" + "ab" * 20
+
+        stored = AddressBytes().process_bind_param(address, self.dialect)
+
+        assert len(stored) == 21
+        assert stored[:1] == AddressBytes.EVM_TAG
+
+    def test_non_evm_address_stored_as_text(self):
+        """Test non-EVM address is stored as tagged UTF-8."""
+        address = "tlyqmc5yq8ebu6vqwnfsxpvtsvc5rqmdhs"
+
+        stored = AddressBytes().process_bind_param(address, self.dialect)
+
+        assert stored == AddressBytes.TEXT_TAG + address.encode("utf-8")
+
+    def test_round_trip(self):
+        """Test addresses read back exactly as written."""
+        address_type = AddressBytes()
+        for address in ("0x" + "0f" * 20, "sp2j6zy48gv1ez5v2v5rb9mp66sw86pykknrv9ej7", "0xnothex" + "z" * 34, None):
+            stored = address_type.process_bind_param(address, self.dialect)
+            assert address_type.process_result_value(stored, self.dialect) == address